@@ -1,10 +1,36 @@
 
-from conway.application.application                                 import Application
-from limon_test.framework.application.limon_test_application        import Limon_Test_Application
-
-# Start the global singleton that represents a (mock) application based on 
-# :class:`conway`, so that the tests can run (since anything based on the class:`conway`
-# requires a global :class:`Application` object to exist as context)
+# GOTCHA
+#
+# Importing this package must stay cheap, since it is imported whenever any of its modules is (e.g., when a test
+# runner merely discovers tests, or when the parallel scenario runner prints its --help). So the Conway modules
+# and the global application singleton are not loaded here, but by `bootstrap()`, which test cases call before
+# they need the application.
 #
-if Application._singleton_app is None:
-    Limon_Test_Application()
+def bootstrap():
+    '''
+    Starts the global singleton that represents a (mock) application based on :class:`conway`, so that the tests
+    can run (since anything based on the :class:`conway` requires a global :class:`Application` object to exist
+    as context).
+
+    It does nothing if the application already exists, so it is safe to call it as often as needed.
+
+    :returns: the global application
+    :rtype: Limon_Test_Application
+    '''
+    from conway.application.application                             import Application
+    from limon_test.framework.application.limon_test_application    import Limon_Test_Application
+
+    if Application._singleton_app is None:
+        Limon_Test_Application()
+
+    return Application.app()
+
+def __getattr__(name):
+    # Lazily give access to the names that this package used to import eagerly
+    if name == "Application":
+        from conway.application.application                         import Application
+        return Application
+    if name == "Limon_Test_Application":
+        from limon_test.framework.application.limon_test_application import Limon_Test_Application
+        return Limon_Test_Application
+    raise AttributeError(f"module 'limon_test' has no attribute '{name}'")
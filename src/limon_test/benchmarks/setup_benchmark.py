@@ -0,0 +1,329 @@
+import argparse                                                     as _argparse
+import contextlib                                                   as _contextlib
+import datetime                                                     as _datetime
+import math                                                         as _math
+import os                                                           as _os
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+import sys                                                          as _sys
+import types                                                        as _types
+
+import limon_test
+from limon_test.benchmarks.synthetic_project                        import Synthetic_Project
+from limon_test.framework.github.github_backends                    import GitHub_Backends
+from limon_test.framework.observability.timing_report               import Timing_Report
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+
+class Setup_Benchmark():
+
+    '''
+    Benchmarks how the setup-and-report pipeline of repo manipulation tests scales with the size of projects.
+
+    For each project size (i.e., number of repos) it generates a :class:`Synthetic_Project`, with a user profile
+    that lists its repos, in a seed laid out like those of test scenarios. Then it runs, against it, the same code
+    that `onboarding.test_repo_setup` runs, through a :class:`TestRepoSetup` instance and a stand-in for the test
+    context that points to the synthetic seed:
+
+    * "github_fixtures" - the repos are created in the "fake" GitHub backend by
+      :meth:`RepoManipulationTestCase._supervisor`, run through the harness runtime.
+    * "github_reset" - the same, but with re-use of repo fixtures turned on, so the repos created by the previous
+      stage are reset in place.
+    * "repo_setup" - the local development environment is set up with `RepoSetup.setup` (from :mod:`limon_ops`),
+      which clones the repos from the "fake" backend's bare repos (see :meth:`GitHub_Backends.remote_redirect`).
+    * "report" - the branch report is produced with `BranchLifecycleManager.create_repo_report`, for the branch
+      manager built by :meth:`TestRepoSetup._branch_manager`.
+
+    Before "repo_setup", the branches and commits of the synthetic project are pushed to the "fake" backend's bare
+    repos, so that the last two stages work on repos of the requested shape. That push is not timed.
+
+    All stages run locally: each call to the "fake" GitHub backend takes `latency` seconds, and the "remote"
+    repos are bare repos on disk. While the benchmark runs, the harness is configured for that through its
+    environment variables, with a cache root of its own under `work_root`, which is emptied at the start of each
+    run. Since the harness is used, so is the global application, hence the benchmark needs the Conway modules
+    and :mod:`limon_ops` just as tests do.
+
+    Each stage is timed as a span named ``benchmark/repos_{N}/{stage}``, with the span timer of the application,
+    so results can be compared against a baseline with :class:`Timing_Report`. Calls to GitHub are timed too,
+    nested under the span of the stage that made them.
+
+    :param str work_root: the folder in which synthetic projects are generated and set up
+    :param list sizes_l: the numbers of repos of the projects to benchmark
+    :param int branch_count: how many branches, besides master, each repo has
+    :param int commit_count: how many commits the master branch of each repo has
+    :param float latency: how many seconds each call to the GitHub stand-in takes
+    '''
+
+    # The GitHub owner of the synthetic projects' repos
+    GITHUB_OWNER                                    = "benchmark"
+
+    def __init__(self, work_root, sizes_l, branch_count=5, commit_count=20, latency=0.02):
+
+        self.work_root                              = work_root
+        self.sizes_l                                = sorted(sizes_l)
+        self.branch_count                           = branch_count
+        self.commit_count                           = commit_count
+        self.latency                                = latency
+
+        self.span_timer                             = None
+
+    def run(self):
+        '''
+        Runs the benchmark for each project size.
+
+        :returns: the span timer with the timings of the run
+        :rtype: Span_Timer
+        '''
+        cache_root                                  = f"{self.work_root}/cache"
+        if _os.path.exists(cache_root):
+            _shutil.rmtree(cache_root)
+
+        with self._harness_environment({LimonTestStatics.CACHE_ROOT_VAR:          cache_root,
+                                        LimonTestStatics.GITHUB_BACKEND_VAR:      LimonTestStatics.GITHUB_BACKEND_FAKE,
+                                        LimonTestStatics.FAKE_GITHUB_LATENCY_VAR: str(self.latency),
+                                        LimonTestStatics.WORKER_ID_VAR:           None}):
+            application                             = limon_test.bootstrap()
+            self.span_timer                         = application.span_timer
+            self.span_timer.reset()
+            try:
+                with self.span_timer.span("benchmark"):
+                    for size in self.sizes_l:
+                        with self.span_timer.span(f"repos_{size:04d}"):
+                            self._run_one_size(size)
+            finally:
+                # Connections to the GitHub backend were opened under this run's cache root, so they must not be
+                # re-used by later runs
+                #
+                application.harness_runtime.close()
+        return self.span_timer
+
+    def _run_one_size(self, size):
+        # Import here so that importing this module (e.g., for `scaling_exponents`) doesn't need the Conway modules
+        from limon_ops.onboarding.repo_setup                        import RepoSetup
+        from limon_test.tests_conway_ops.onboarding.test_repo_setup import TestRepoSetup
+
+        # Like in tests, the project is named after the scenario id
+        scenario_id                                 = f"bench_{size:04d}"
+        project                                     = Synthetic_Project(
+                                                            root_folder     = f"{self.work_root}/remotes/repos_{size:04d}",
+                                                            project_name    = f"scenario_{scenario_id}",
+                                                            repo_count      = size,
+                                                            branch_count    = self.branch_count,
+                                                            commit_count    = self.commit_count)
+        project.generate()
+
+        scenario                                    = TestRepoSetup()
+        scenario.profile_name                       = "TestRobot@CCL"
+        ctx                                         = self._context(scenario, scenario_id, project, size)
+        P                                           = ctx.manifest.profile
+
+        with self.span_timer.span("github_fixtures"):
+            self._setup_github_repos(scenario, ctx, reuse_repos=False)
+        with self.span_timer.span("github_reset"):
+            self._setup_github_repos(scenario, ctx, reuse_repos=True)
+
+        self._push_history(project)
+
+        local_root                                  = f"{self.work_root}/local/repos_{size:04d}"
+        if _os.path.exists(local_root):
+            _shutil.rmtree(local_root)
+        _os.makedirs(local_root)
+
+        with GitHub_Backends.remote_redirect(remote_root=P.REMOTE_ROOT, github_owner=P.GH_ORGANIZATION):
+            with self.span_timer.span("repo_setup"):
+                RepoSetup(sdlc_root     = f"{ctx.manifest.path_to_seed()}/sdlc_root",
+                          profile_name  = scenario.profile_name).setup(project.project_name)
+
+            with self.span_timer.span("report"):
+                scenario._branch_manager(ctx).create_repo_report(publications_folder         = ctx.manifest.path_to_actuals(),
+                                                                 mask_nondeterministic_data  = True)
+
+    def _context(self, scenario, scenario_id, project, size):
+        '''
+        Writes a seed for `project`, with a user profile that lists its repos, and returns a stand-in for the
+        context of a test case that runs against that seed. It has what :class:`TestRepoSetup` uses of a
+        `Chassis_TestContext`: the scenario id, and a manifest with the seed, the actual outputs and the profile.
+
+        :param TestRepoSetup scenario: the test case through which the benchmark runs the harness
+        :param str scenario_id: the id of the stand-in's scenario
+        :param Synthetic_Project project: the project to write a seed for
+        :param int size: the number of repos of the project
+        :raises ValueError: if the profile written does not load as expected
+        '''
+        seed_folder                                 = f"{self.work_root}/seeds/repos_{size:04d}"
+        profile_path                                = f"{seed_folder}/sdlc_root/sdlc.profiles/{scenario.profile_name}/profile.toml"
+        project.write_profile(profile_path      = profile_path,
+                              github_owner      = Setup_Benchmark.GITHUB_OWNER,
+                              local_root        = f"{self.work_root}/local/repos_{size:04d}")
+
+        manifest                                    = _types.SimpleNamespace(
+                                                            path_to_seed            = lambda: seed_folder,
+                                                            path_to_actuals         = lambda: f"{self.work_root}/reports/repos_{size:04d}",
+                                                            scenarios_root_folder   = self.work_root)
+        ctx                                         = _types.SimpleNamespace(scenario_id=scenario_id, manifest=manifest)
+
+        # The profile is loaded from the seed, just like for the GitHub fixtures
+        manifest.profile                            = scenario._profile(ctx)
+        if manifest.profile.GH_ORGANIZATION != Setup_Benchmark.GITHUB_OWNER \
+                or list(manifest.profile.REPO_LIST(project.project_name)) != project.repo_names():
+            raise ValueError(f"The profile written to '{profile_path}' does not load as expected, so the layout "
+                             + "written by Synthetic_Project.write_profile must be out of date")
+        return ctx
+
+    def _setup_github_repos(self, scenario, ctx, reuse_repos):
+        '''
+        Sets up the repos of the project in `ctx` as GitHub repo fixtures, by running the harness's own
+        :meth:`RepoManipulationTestCase._supervisor` in the harness runtime.
+
+        :param TestRepoSetup scenario: the test case through which the benchmark runs the harness
+        :param ctx: the stand-in for the test context, as returned by :meth:`_context`
+        :param bool reuse_repos: whether repo fixtures that already exist should be reset in place
+        :returns: the results of setting up each repo
+        :rtype: list
+        '''
+        with self._harness_environment({LimonTestStatics.REUSE_REPOS_VAR: str(reuse_repos).lower()}):
+            return limon_test.bootstrap().harness_runtime.run(scenario._supervisor(ctx))
+
+    def _push_history(self, project):
+        '''
+        Pushes the branches and commits of the repos of `project` to the bare repos that back them in the "fake"
+        GitHub backend, replacing the initial commit that the backend gave them.
+        '''
+        fake_repos_root                             = GitHub_Backends.fake_repos_root(Setup_Benchmark.GITHUB_OWNER)
+        for repo_name in project.repo_names():
+            self._git(None, "--git-dir", f"{project.root_folder}/{repo_name}.git", "push", "--quiet", "--force",
+                      f"{fake_repos_root}/{repo_name}.git", "refs/heads/*:refs/heads/*")
+
+    @_contextlib.contextmanager
+    def _harness_environment(self, settings_dict):
+        '''
+        Context manager within which the environment variables that configure the harness have the values in
+        `settings_dict` (or are unset, for None values). They are restored when exiting it.
+        '''
+        previous_dict                               = {name: _os.environ.get(name) for name in settings_dict.keys()}
+        self._set_environment(settings_dict)
+        try:
+            yield
+        finally:
+            self._set_environment(previous_dict)
+
+    def _set_environment(self, settings_dict):
+        for name, value in settings_dict.items():
+            if value is None:
+                _os.environ.pop(name, None)
+            else:
+                _os.environ[name]                   = value
+
+    def _git(self, repo_path, *args):
+        cwd_args_l                                  = ["-C", repo_path] if repo_path is not None else []
+        completed                                   = _subprocess.run(["git", *cwd_args_l, *args],
+                                                                      capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"'git {' '.join(args)}' failed: {completed.stderr.strip()}")
+        return completed.stdout
+
+def scaling_exponents(timing_record_path):
+    '''
+    Estimates how the duration of each stage of a benchmark grows with the number of repos, by fitting a line to
+    the logarithms of both (i.e., assuming that duration is proportional to ``repos ** exponent``).
+
+    An exponent around 1 means that a stage scales linearly. A clearly higher exponent flags super-linear
+    behaviour.
+
+    :param str timing_record_path: a timing record written by :meth:`Span_Timer.save` for a benchmark run
+    :returns: a dictionary whose keys are stage names, and whose values are tuples with the estimated exponent
+        and the duration for the largest project size. Stages measured for less than two sizes are not included.
+    :rtype: dict
+    '''
+    points_dict                                     = {}
+    for path, totals in Timing_Report().load(timing_record_path).items():
+        components_l                                = path.split("/")
+        if len(components_l) != 3 or not components_l[1].startswith("repos_") or totals["total"] <= 0:
+            continue
+        size                                        = int(components_l[1].removeprefix("repos_"))
+        points_dict.setdefault(components_l[2], []).append((size, totals["total"]))
+
+    exponents_dict                                  = {}
+    for stage, points_l in points_dict.items():
+        if len(set([size for size, duration in points_l])) < 2:
+            continue
+        xs_l                                        = [_math.log(size) for size, duration in points_l]
+        ys_l                                        = [_math.log(duration) for size, duration in points_l]
+        mean_x                                      = sum(xs_l) / len(xs_l)
+        mean_y                                      = sum(ys_l) / len(ys_l)
+        slope                                       = sum([(x - mean_x) * (y - mean_y) for x, y in zip(xs_l, ys_l)]) \
+                                                            / sum([(x - mean_x) ** 2 for x in xs_l])
+        exponents_dict[stage]                       = (slope, max(points_l)[1])
+    return exponents_dict
+
+def main(args):
+    parser                                          = _argparse.ArgumentParser(
+                                                            description = "Benchmarks repo setup and reporting for "
+                                                                            + "synthetic projects of growing size")
+    parser.add_argument("--sizes", default="5,20,80",
+                        help="comma-separated numbers of repos of the projects to benchmark (default 5,20,80)")
+    parser.add_argument("--branches", type=int, default=5, help="branches per repo, besides master (default 5)")
+    parser.add_argument("--commits", type=int, default=20, help="commits in the master branch of each repo (default 20)")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="seconds that each call to the GitHub stand-in takes (default 0.02)")
+    parser.add_argument("--work-root", default=None,
+                        help="folder for generated and set up repos (default: benchmarks/work under the cache root)")
+    parser.add_argument("--baseline", default=None,
+                        help="timing record to compare against (default: benchmarks/baseline.json under the cache root)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--max-exponent", type=float, default=1.3,
+                        help="scaling exponent above which a stage is flagged as super-linear (default 1.3)")
+    parser.add_argument("--min-secs", type=float, default=0.5,
+                        help="stages faster than this, for the largest size, are not flagged (default 0.5)")
+    parsed                                          = parser.parse_args(args)
+
+    benchmarks_root                                 = f"{LimonTestStatics.CACHE_ROOT()}/benchmarks"
+    work_root                                       = parsed.work_root or f"{benchmarks_root}/work"
+    baseline_path                                   = parsed.baseline or f"{benchmarks_root}/baseline.json"
+
+    sizes_l                                         = [int(size) for size in parsed.sizes.split(",")]
+    benchmark                                       = Setup_Benchmark(work_root     = work_root,
+                                                                      sizes_l       = sizes_l,
+                                                                      branch_count  = parsed.branches,
+                                                                      commit_count  = parsed.commits,
+                                                                      latency       = parsed.latency)
+    span_timer                                      = benchmark.run()
+
+    run_info_dict                                   = {"sizes": sizes_l, "branches": parsed.branches,
+                                                       "commits": parsed.commits, "latency": parsed.latency}
+    record_path                                     = f"{benchmarks_root}/{_datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    span_timer.save(record_path, run_info=run_info_dict)
+    print(f"Timing record saved to {record_path}")
+
+    problems                                        = 0
+
+    # Throughput and scaling of each stage
+    totals_dict                                     = Timing_Report().load(record_path)
+    for size in benchmark.sizes_l:
+        for stage in ["github_fixtures", "github_reset", "repo_setup", "report"]:
+            duration                                = totals_dict[f"benchmark/repos_{size:04d}/{stage}"]["total"]
+            print(f"{size:>6} repos  {stage:16} {duration:>9.3f}s  {size / duration:>9.1f} repos/s")
+
+    for stage, (exponent, duration) in sorted(scaling_exponents(record_path).items()):
+        flag                                        = ""
+        if exponent > parsed.max_exponent and duration >= parsed.min_secs:
+            flag                                    = "SUPER-LINEAR"
+            problems                                += 1
+        print(f"{stage:16} scales as repos ** {exponent:.2f}  {flag}")
+
+    # Regressions against the baseline
+    if _os.path.exists(baseline_path) and not parsed.save_baseline:
+        rows_l                                      = Timing_Report().compare(baseline_path, record_path)
+        regressions_l                               = [row for row in rows_l if row["regressed"]
+                                                            and row["path"].count("/") == 2]
+        for row in regressions_l:
+            print(f"REGRESSED  {row['path']}: {row['baseline']:.3f}s -> {row['current']:.3f}s")
+        problems                                    += len(regressions_l)
+
+    if parsed.save_baseline:
+        _shutil.copyfile(record_path, baseline_path)
+        print(f"Baseline saved to {baseline_path}")
+
+    return 1 if problems > 0 else 0
+
+if __name__ == "__main__":
+    _sys.exit(main(_sys.argv[1:]))
@@ -0,0 +1,144 @@
+import json                                                         as _json
+import os                                                           as _os
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+
+class Synthetic_Project():
+
+    '''
+    Generates a synthetic project, made of `repo_count` bare GIT repos under `root_folder`, to benchmark how the
+    harness scales with the size of projects.
+
+    Each repo has `commit_count` commits in its master branch, and `branch_count` additional branches that fork
+    from the last commit of master and add one commit each. Repos are generated with ``git fast-import``, so even
+    projects with hundreds of repos are generated in seconds.
+
+    Generated repos are kept, and re-used by later instances with the same parameters.
+
+    :param str root_folder: the folder under which the repos are generated
+    :param str project_name: prefix for the names of the repos
+    :param int repo_count: how many repos to generate
+    :param int branch_count: how many branches, besides master, to generate in each repo
+    :param int commit_count: how many commits to generate in the master branch of each repo
+    '''
+    def __init__(self, root_folder, project_name, repo_count, branch_count, commit_count):
+
+        self.root_folder                            = root_folder
+        self.project_name                           = project_name
+        self.repo_count                             = repo_count
+        self.branch_count                           = branch_count
+        self.commit_count                           = commit_count
+
+    def repo_names(self):
+        '''
+        :returns: the names of the repos of the project
+        :rtype: list
+        '''
+        return [f"{self.project_name}.repo{idx:04d}" for idx in range(self.repo_count)]
+
+    def generate(self):
+        '''
+        Generates the repos of the project, unless they were already generated with the same parameters.
+
+        :returns: the URLs of the generated repos, in the same order as :meth:`repo_names`
+        :rtype: list
+        '''
+        params_dict                                 = {"branch_count": self.branch_count, "commit_count": self.commit_count}
+        params_path                                 = f"{self.root_folder}/params.json"
+        if _os.path.exists(params_path):
+            with open(params_path, "r") as file:
+                if _json.load(file) != params_dict:
+                    _shutil.rmtree(self.root_folder)
+        _os.makedirs(self.root_folder, exist_ok=True)
+
+        urls_l                                      = []
+        for repo_name in self.repo_names():
+            repo_path                               = f"{self.root_folder}/{repo_name}.git"
+            if not _os.path.exists(f"{repo_path}/HEAD"):
+                self._generate_repo(repo_path)
+            urls_l.append(f"file://{repo_path}")
+
+        with open(params_path, "w") as file:
+            _json.dump(params_dict, file)
+
+        return urls_l
+
+    def write_profile(self, profile_path, github_owner, local_root):
+        '''
+        Writes a user profile for the project, like the ``profile.toml`` files in the seeds of test scenarios, so
+        that code which loads profiles (such as `RepoSetup`) works with the project as it does with real ones.
+
+        The profile says that the repos of the project are in GitHub, owned by `github_owner`, and that they are
+        cloned under `local_root`.
+
+        GOTCHA: The layout written here must match the one that :class:`UserProfile` (from :mod:`conway_ops`)
+            loads. Callers should check that the loaded profile lists :meth:`repo_names`, as
+            :class:`Setup_Benchmark` does, so that a change in that layout fails loudly.
+
+        :param str profile_path: where to write the profile
+        :param str github_owner: the GitHub user or organization that owns the repos
+        :param str local_root: the folder under which the repos are cloned
+        '''
+        def quoted(text):
+            # JSON strings are valid TOML basic strings
+            return _json.dumps(text)
+
+        lines_l                                     = ["[github]",
+                                                       f"user = {quoted(github_owner)}",
+                                                       f"organization = {quoted(github_owner)}",
+                                                       f"remote_root = {quoted(f'https://{github_owner}@github.com/{github_owner}')}",
+                                                       "",
+                                                       "[local]",
+                                                       f"root = {quoted(local_root)}",
+                                                       "",
+                                                       f"[projects.{quoted(self.project_name)}]",
+                                                       f"repos = [{', '.join([quoted(name) for name in self.repo_names()])}]",
+                                                       ""]
+        _os.makedirs(_os.path.dirname(profile_path), exist_ok=True)
+        with open(profile_path, "w") as file:
+            file.write("\n".join(lines_l))
+
+    def _generate_repo(self, repo_path):
+        if _os.path.exists(repo_path):
+            # Left over from an interrupted generation
+            _shutil.rmtree(repo_path)
+        _os.makedirs(repo_path)
+        self._git(repo_path, None, "init", "--bare", "--quiet", "--initial-branch=master")
+        self._git(repo_path, self._fast_import_stream(), "fast-import", "--quiet")
+
+    def _fast_import_stream(self):
+        '''
+        :returns: the input for ``git fast-import`` that creates the commits and branches of a repo
+        :rtype: bytes
+        '''
+        lines_l                                     = []
+        timestamp                                   = 1700000000
+
+        def add_commit(ref, mark, parent_mark, message, path, content):
+            lines_l.extend([f"commit {ref}",
+                            f"mark :{mark}",
+                            f"committer Benchmark <benchmark@example.com> {timestamp + mark} +0000",
+                            f"data {len(message.encode('utf-8'))}",
+                            message])
+            if parent_mark is not None:
+                lines_l.append(f"from :{parent_mark}")
+            lines_l.extend([f"M 644 inline {path}",
+                            f"data {len(content.encode('utf-8'))}",
+                            content,
+                            ""])
+
+        for idx in range(self.commit_count):
+            add_commit("refs/heads/master", idx + 1, idx if idx > 0 else None,
+                       f"Commit {idx} on master", "README.md", f"Revision {idx} of the README\n")
+
+        for idx in range(self.branch_count):
+            add_commit(f"refs/heads/branch_{idx:03d}", self.commit_count + idx + 1, self.commit_count,
+                       f"Work on branch {idx}", f"branch_{idx:03d}.txt", f"Content of branch {idx}\n")
+
+        return "\n".join(lines_l).encode("utf-8")
+
+    def _git(self, repo_path, input_bytes, *args):
+        completed                                   = _subprocess.run(["git", "--git-dir", repo_path, *args],
+                                                                      input=input_bytes, capture_output=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"'git {' '.join(args)}' failed: {completed.stderr.decode('utf-8').strip()}")
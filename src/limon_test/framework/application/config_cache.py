@@ -0,0 +1,95 @@
+import hashlib                                                      as _hashlib
+import os                                                           as _os
+import threading                                                    as _threading
+
+class Config_Cache():
+
+    '''
+    Process-wide cache of configuration loaded from files, such as user profiles, so that each file is parsed
+    (and its environment variables expanded) once per process rather than once per test case.
+
+    Cached values are invalidated when any file they were loaded from changes, i.e., when its modification time
+    or size changes. Values loaded with :meth:`get` are also cached per environment, so callers always get values
+    consistent with the files on disk and with the environment.
+
+    Cached values are shared by all callers, so callers must not modify them.
+
+    The cache is normally owned by the :class:`Limon_Test_Application`.
+    '''
+    def __init__(self):
+
+        # Keys are as passed to `memoize`, values are tuples (value, stamps), where `stamps` is a tuple with the
+        # stamp of each file the value depends on, as returned by `_stamp`
+        #
+        self._entries_dict                          = {}
+        self._lock                                  = _threading.Lock()
+
+    def get(self, path, loader, kind=None):
+        '''
+        Since loaders may expand environment variables in what they load, values are cached per environment,
+        i.e., a value loaded under some environment is not returned if any environment variable changed since.
+
+        :param str path: the file to load
+        :param loader: callable that takes `path` and returns the value loaded from it, such as a class whose
+            constructor takes the path
+        :param str kind: optional name for the kind of value loaded, to tell apart values loaded from the same
+            path by different loaders. Defaults to the name of `loader`.
+        :returns: the value returned by `loader` for `path`, from the cache if neither `path` nor the environment
+            have changed since it was cached.
+        '''
+        kind                                        = kind or getattr(loader, "__qualname__", repr(loader))
+        return self.memoize(key                     = (kind, path, self.environment_key()),
+                            producer                = lambda: loader(path),
+                            dependency_paths        = [path])
+
+    def environment_key(self):
+        '''
+        :returns: a value that changes whenever any environment variable of this process changes, to include in
+            the keys of values that depend on the environment.
+        :rtype: str
+        '''
+        environment_text                            = "\0".join([f"{name}={value}"
+                                                                  for name, value in sorted(_os.environ.items())])
+        return _hashlib.sha1(environment_text.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def memoize(self, key, producer, dependency_paths):
+        '''
+        :param key: hashable value identifying what `producer` produces. It should include anything other than
+            the content of `dependency_paths` that the produced value depends on, such as environment variables.
+        :param producer: callable without arguments that produces the value to cache
+        :param list dependency_paths: files whose content the produced value depends on. The cached value is
+            produced again if any of them changes.
+        :returns: the value returned by `producer`, from the cache if none of `dependency_paths` has changed since
+            it was cached.
+        '''
+        stamps                                      = tuple([self._stamp(path) for path in dependency_paths])
+
+        with self._lock:
+            entry                                   = self._entries_dict.get(key)
+        if entry is not None and entry[1] == stamps:
+            return entry[0]
+
+        # Produce the value outside the lock, since it may be slow. If two threads produce it at the same time
+        # the last one wins, which is harmless
+        #
+        value                                       = producer()
+        with self._lock:
+            self._entries_dict[key]                 = (value, stamps)
+        return value
+
+    def clear(self):
+        '''
+        Removes all values from the cache.
+        '''
+        with self._lock:
+            self._entries_dict                      = {}
+
+    def _stamp(self, path):
+        '''
+        :returns: a value that changes whenever the file `path` changes, or None if the file does not exist.
+        '''
+        try:
+            stat                                    = _os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
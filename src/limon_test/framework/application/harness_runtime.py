@@ -0,0 +1,95 @@
+import asyncio
+
+from limon_test.framework.github.github_backends                    import GitHub_Backends
+from limon_test.framework.github.github_scheduler                   import GitHub_Scheduler
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+
+class Harness_Runtime():
+
+    '''
+    Asynchronous runtime shared by all the test cases that run in the same process.
+
+    It owns:
+
+    * One event loop, in which all the asynchronous work of the harness is run. This spares each test case the
+      cost of starting (and tearing down) an event loop of its own.
+    * One connection to GitHub per GitHub organization, which is opened the first time it is needed and kept
+      open until the runtime is closed. That way test cases re-use warm connections instead of paying for TLS
+      handshakes and connection setup each time.
+
+    The runtime is normally owned by the :class:`Limon_Test_Application`, which closes it when the process exits.
+
+    :param Span_Timer span_timer: if given, calls to GitHub are timed with it.
+    '''
+    def __init__(self, span_timer=None):
+
+        self.span_timer                             = span_timer
+
+        self._loop                                  = None
+
+        # Keys are tuples (github_owner, recording_name), values are tuples (github, scheduler), where `github`
+        # is an opened GitHub client and `scheduler` the GitHub_Scheduler wrapping it
+        #
+        self._github_dict                           = {}
+
+    def run(self, coroutine):
+        '''
+        Runs `coroutine` to completion in the runtime's event loop, and returns its result.
+
+        It is the equivalent of `asyncio.run(coroutine)`, except that the event loop is kept for later calls.
+
+        :param coroutine: the coroutine to run
+        :returns: whatever `coroutine` returns
+        '''
+        if self._loop is None or self._loop.is_closed():
+            self._loop                              = asyncio.new_event_loop()
+
+        return self._loop.run_until_complete(coroutine)
+
+    async def github(self, github_owner, recording_name="default"):
+        '''
+        Returns the object through which the harness should make calls to GitHub for `github_owner`. It is
+        a :class:`GitHub_Scheduler` wrapping an already opened client from :class:`GitHub_Backends`.
+
+        The first call for a given `github_owner` opens the connection to GitHub, and later calls re-use it.
+
+        GOTCHA: must be called from a coroutine run with :meth:`run`, since connections are tied to the
+        event loop in which they were opened.
+
+        :param str github_owner: the GitHub user or organization that owns the repos
+        :param str recording_name: used only by the "record" and "replay" backends, to identify the recording
+            to use. Recordings are not shared across names, so there is one connection per name for those
+            backends.
+        :rtype: GitHub_Scheduler
+        '''
+        if LimonTestStatics.GITHUB_BACKEND() in [LimonTestStatics.GITHUB_BACKEND_RECORD,
+                                                  LimonTestStatics.GITHUB_BACKEND_REPLAY]:
+            key                                     = (github_owner, recording_name)
+        else:
+            key                                     = (github_owner, None)
+
+        if not key in self._github_dict:
+            github                                  = GitHub_Backends.client(github_owner      = github_owner,
+                                                                             recording_name    = recording_name)
+            await github.__aenter__()
+            scheduler                               = GitHub_Scheduler(github,
+                                                                       max_concurrency  = LimonTestStatics.GITHUB_CONCURRENCY(),
+                                                                       max_retries      = LimonTestStatics.GITHUB_RETRIES(),
+                                                                       span_timer       = self.span_timer)
+            self._github_dict[key]                  = (github, scheduler)
+
+        return self._github_dict[key][1]
+
+    def close(self):
+        '''
+        Closes all connections to GitHub and the event loop. It is safe to call it more than once.
+        '''
+        if self._loop is None or self._loop.is_closed():
+            return
+
+        for github, scheduler in self._github_dict.values():
+            self._loop.run_until_complete(github.__aexit__(None, None, None))
+        self._github_dict                           = {}
+
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
@@ -1,18 +1,126 @@
+import atexit                                                       as _atexit
+import contextlib                                                   as _contextlib
+import contextvars                                                  as _contextvars
 import os                                                           as _os
+import sys                                                          as _sys
+import time                                                         as _time
 
 from conway.application.application                                 import Application
 from conway.observability.logger                                    import Logger
 from conway.util.path_utils                                         import PathUtils
+from conway.util.secrets                                            import Secrets
 
 from conway_acceptance.util.test_statics                            import TestStatics
 
+from limon_test.framework.application.config_cache                  import Config_Cache
+from limon_test.framework.application.harness_runtime               import Harness_Runtime
+from limon_test.framework.observability.async_log_sink              import Async_Log_Sink
+from limon_test.framework.observability.span_timer                  import Span_Timer
+
 class Test_Logger(Logger):
     '''
     This is a mock logger, needed in order to run the tests of the :class:`limon_test`.
 
     Specifically, it is needed by the :class:`Chassis_Test_Application`. Please refer to its
     documentation as to why these mock classes are needed in order to run the tests.
+
+    To keep logging off the critical path of the harness (e.g., when many repos are set up concurrently), it
+    adds :meth:`log_async` to the parent, which is what the harness uses for its own logging:
+
+    * Non-blocking: records are only enqueued. A background thread (please refer to :class:`Async_Log_Sink`)
+      takes records from the queue and passes them on to the parent's logging, one at a time.
+    * Lazy formatting: the message may be a callable that returns the text. Records whose level is not active
+      are dropped before anything is done with them, and for the others the callable is only called by the
+      background thread, so the cost of formatting (e.g., prettifying a big JSON response) is not paid by the caller.
+    * Structured: a record can have fields, like the scenario id, repo, phase or latency of what is logged.
+      Fields can be passed explicitly, or set for a block of code with :meth:`context`. The caller's file and line
+      are added as the `caller` field, since by the time the parent logs the record it is no longer known.
+    * Ring buffer: the last `ring_buffer_size` records, with all their fields, are kept in memory, so that they
+      can be dumped with :meth:`dump_ring_buffer` when a test fails.
+
+    The parent's :meth:`log`, which is what Conway uses, is left as is, i.e., it logs synchronously and with the
+    caller's information.
+
+    :param int activation_level: as in the parent class
+    :param int ring_buffer_size: how many of the most recent records to keep in memory.
     '''
+    # Fields that apply to all records logged by the code running in the current thread or asyncio task
+    _CONTEXT_FIELDS                                 = _contextvars.ContextVar("limon_test_log_fields", default={})
+
+    def __init__(self, activation_level, ring_buffer_size=2000):
+        super().__init__(activation_level=activation_level)
+
+        self._activation_level                      = activation_level
+        self._sink                                  = Async_Log_Sink(write              = self._write,
+                                                                     ring_buffer_size   = ring_buffer_size)
+
+    def log_async(self, message, log_level, fields=None, stack_level=1):
+        '''
+        Enqueues a record to be logged by the parent class, without waiting for it to be logged. Nothing is done
+        if `log_level` is not active.
+
+        :param message: the text to log, or a callable without arguments that returns the text
+        :param int log_level: the level at which to log, as for the parent's `log`
+        :param dict fields: optional structured data about the record, such as {"repo": "scenario_8002.svc"}.
+            They are added to those set with :meth:`context`.
+        :param int stack_level: how many frames up the stack is the code to report as the caller. 1 (the
+            default) is whoever called this method.
+        '''
+        # As in the parent, only levels up to the activation level are logged
+        if log_level > self._activation_level:
+            return
+
+        caller                                      = _sys._getframe(stack_level)
+        all_fields                                  = dict(Test_Logger._CONTEXT_FIELDS.get())
+        if fields is not None:
+            all_fields.update(fields)
+        all_fields["caller"]                        = f"{_os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno}"
+
+        self._sink.put((_time.time(), message, all_fields, log_level))
+
+    @_contextlib.contextmanager
+    def context(self, **fields):
+        '''
+        Context manager to add `fields` to all the records logged within it, including those logged from
+        asyncio tasks created within it.
+
+        :param fields: structured data, such as `scenario_id=8002` or `phase="github_fixtures"`
+        '''
+        token                                       = Test_Logger._CONTEXT_FIELDS.set(
+                                                            {**Test_Logger._CONTEXT_FIELDS.get(), **fields})
+        try:
+            yield self
+        finally:
+            Test_Logger._CONTEXT_FIELDS.reset(token)
+
+    def flush(self):
+        '''
+        Waits until all the records enqueued so far have been logged by the parent.
+        '''
+        self._sink.flush()
+
+    def close(self):
+        '''
+        Logs any pending records and stops the background thread. It is safe to call it more than once.
+        '''
+        self._sink.close()
+
+    def clear_ring_buffer(self):
+        '''
+        Forgets the records in the ring buffer, e.g., when a new test starts.
+        '''
+        self._sink.clear_ring_buffer()
+
+    def dump_ring_buffer(self, stream=None):
+        '''
+        Writes all the records in the ring buffer, with their fields, to `stream`.
+
+        :param stream: where to write the records. Defaults to stderr.
+        '''
+        self._sink.dump_ring_buffer(stream)
+
+    def _write(self, text, log_level):
+        super().log(text, log_level=log_level)
 
 
 class Limon_Test_Application(Application):
@@ -28,6 +136,10 @@ class Limon_Test_Application(Application):
     :class:`limon_test` wouldn't run unless there is (mock) Application as a global context.
 
     Hence this class, which is initialized in ``limon_test.__init__.py``
+
+    It also owns the :class:`Harness_Runtime` (event loop and GitHub connections) shared by all test cases
+    in the process, and closes it when the process exits, as well as the :class:`Span_Timer` with which test
+    cases time their steps and the :class:`Config_Cache` through which they load profiles and secrets.
     '''
     def __init__(self):
 
@@ -70,3 +182,26 @@ class Limon_Test_Application(Application):
           
         super().__init__(app_name=APP_NAME, config_path=config_path, logger=logger)
 
+        # Give the harness direct access to the Test_Logger, for structured and lazily formatted logging
+        self.test_logger                                = logger
+        _atexit.register(logger.close)
+
+        self.span_timer                                 = Span_Timer()
+
+        self.harness_runtime                            = Harness_Runtime(span_timer = self.span_timer)
+        _atexit.register(self.harness_runtime.close)
+
+        self.config_cache                               = Config_Cache()
+        self._config_file                               = f"{config_path}/{APP_NAME}_config.toml"
+
+    def secrets_path(self):
+        '''
+        :returns: the path to the secrets vault, as configured in the `[secrets]` section of this application's
+            configuration. It is only resolved again if the configuration file changes, or if the environment
+            variable `TestStatics.SCENARIOS_REPO` (on which the configured location depends) changes.
+        :rtype: str
+        '''
+        return self.config_cache.memoize(key                = ("secrets_path", _os.environ.get(TestStatics.SCENARIOS_REPO)),
+                                         producer           = Secrets.SECRETS_PATH,
+                                         dependency_paths   = [self._config_file])
+
@@ -0,0 +1,136 @@
+import fnmatch                                                      as _fnmatch
+import hashlib                                                      as _hashlib
+import os                                                           as _os
+import pickle                                                       as _pickle
+import uuid                                                         as _uuid
+
+class Excel_Comparison_Engine():
+
+    '''
+    Compares Excel workbooks (e.g., the expected and actual repo reports of a test) cell by cell, and describes
+    their differences in a compact report.
+
+    It is designed to keep comparisons fast for large workbooks:
+
+    * Parsing ``.xlsx`` files is slow, so expected workbooks are parsed only once. The parsed sheets are cached (as
+      pickled DataFrames) under `cache_root`, keyed by the SHA-256 hash of the workbook's content. Expected outputs
+      seldom change, so parsing them is skipped on virtually every run. Actual workbooks are not cached, since
+      their content changes on every run (if only in their document properties), so caching them would only
+      grow the cache.
+    * Sheets are compared as whole arrays rather than cell by cell, so the cost of a comparison is dominated by
+      numpy rather than by Python loops.
+
+    Sheets are compared positionally, without interpreting any row as a header. However, the first row is taken
+    as the column labels for the purposes of masking columns and of reporting differences.
+
+    GOTCHA: pandas (and openpyxl, to parse workbooks) are imported only when needed, so that importing this module
+    is cheap.
+
+    :param str cache_root: the folder under which parsed workbooks are cached
+    '''
+    def __init__(self, cache_root):
+
+        self.cache_root                             = cache_root
+
+    def load(self, path, cache=True):
+        '''
+        :param str path: an Excel workbook
+        :param bool cache: if True, the parsed workbook is taken from the cache, or added to it. Otherwise the
+            workbook is parsed without using the cache.
+        :returns: a dictionary whose keys are the names of the sheets in `path`, and whose values are DataFrames
+            with the content of each sheet (with all cells as Python objects, and without a header).
+        :rtype: dict
+        '''
+        import pandas                                                   as _pd
+
+        if not cache:
+            return _pd.read_excel(path, sheet_name=None, header=None, dtype=object)
+
+        content_hash                                = self._hash(path)
+        cached_path                                 = f"{self.cache_root}/{content_hash[:2]}/{content_hash[2:]}.pkl"
+
+        if _os.path.exists(cached_path):
+            try:
+                with open(cached_path, "rb") as file:
+                    return _pickle.load(file)
+            except Exception:
+                # E.g., the cache was written with a different version of pandas. Parse it again
+                pass
+
+        sheets_dict                                 = _pd.read_excel(path, sheet_name=None, header=None, dtype=object)
+
+        # Write to a temporary file first, so that concurrent test processes never read a partial cache entry
+        _os.makedirs(_os.path.dirname(cached_path), exist_ok=True)
+        tmp_path                                    = f"{cached_path}.{_uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as file:
+            _pickle.dump(sheets_dict, file, protocol=_pickle.HIGHEST_PROTOCOL)
+        _os.replace(tmp_path, cached_path)
+
+        return sheets_dict
+
+    def compare(self, expected_path, actual_path, masked_columns=None, max_examples=3):
+        '''
+        Compares two workbooks.
+
+        :param str expected_path: the workbook with the expected content
+        :param str actual_path: the workbook to check
+        :param list masked_columns: optional list of patterns (as in `fnmatch`) for the labels of columns that
+            should not be compared, such as columns with timestamps or other non-deterministic data.
+        :param int max_examples: for each column that differs, how many of the differing cells to describe
+        :returns: a list of strings, each describing a difference between the workbooks. It is empty if the
+            workbooks match.
+        :rtype: list
+        '''
+        import numpy                                                    as _np
+        import pandas                                                   as _pd
+
+        masked_columns                              = masked_columns or []
+        expected_dict                               = self.load(expected_path)
+        actual_dict                                 = self.load(actual_path, cache=False)
+
+        differences_l                               = []
+        for sheet in expected_dict.keys():
+            if not sheet in actual_dict:
+                differences_l.append(f"sheet '{sheet}': missing")
+        for sheet in actual_dict.keys():
+            if not sheet in expected_dict:
+                differences_l.append(f"sheet '{sheet}': unexpected")
+
+        for sheet in [s for s in expected_dict.keys() if s in actual_dict]:
+            expected                                = expected_dict[sheet].to_numpy(dtype=object)
+            actual                                  = actual_dict[sheet].to_numpy(dtype=object)
+            labels_l                                = [str(label) for label in expected[0]] if len(expected) > 0 else []
+
+            if expected.shape != actual.shape:
+                differences_l.append(f"sheet '{sheet}': expected {expected.shape[0]} rows x {expected.shape[1]} "
+                                     + f"columns, got {actual.shape[0]} x {actual.shape[1]}")
+
+            # Compare the region that both sheets have in common
+            rows                                    = min(expected.shape[0], actual.shape[0])
+            columns                                 = min(expected.shape[1], actual.shape[1])
+            expected                                = expected[:rows, :columns]
+            actual                                  = actual[:rows, :columns]
+
+            both_empty                              = _pd.isna(expected) & _pd.isna(actual)
+            mismatches                              = ~((expected == actual) | both_empty)
+            for idx, label in enumerate(labels_l[:columns]):
+                if any([_fnmatch.fnmatchcase(label, pattern) for pattern in masked_columns]):
+                    mismatches[:, idx]              = False
+
+            for column in _np.flatnonzero(mismatches.any(axis=0)):
+                mismatched_rows                     = _np.flatnonzero(mismatches[:, column])
+                examples_l                          = [f"row {row + 1}: expected {expected[row, column]!r}, "
+                                                       + f"got {actual[row, column]!r}"
+                                                       for row in mismatched_rows[:max_examples]]
+                more                                = "; ..." if len(mismatched_rows) > max_examples else ""
+                differences_l.append(f"sheet '{sheet}', column {column + 1} ('{labels_l[column]}'): "
+                                     + f"{len(mismatched_rows)} cells differ - " + "; ".join(examples_l) + more)
+
+        return differences_l
+
+    def _hash(self, path):
+        hasher                                      = _hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
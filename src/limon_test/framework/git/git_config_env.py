@@ -0,0 +1,39 @@
+import contextlib                                                   as _contextlib
+import os                                                           as _os
+
+class Git_Config_Env():
+
+    '''
+    Utilities to set GIT configuration for the GIT commands run by this process (or by its child processes)
+    through environment variables, rather than by changing any GIT configuration file.
+
+    It relies on the ``GIT_CONFIG_COUNT``, ``GIT_CONFIG_KEY_<n>`` and ``GIT_CONFIG_VALUE_<n>`` environment
+    variables, which GIT reads as if they were the last entries of its configuration.
+    '''
+
+    @_contextlib.contextmanager
+    def settings(settings_l):
+        '''
+        Context manager within which GIT commands see the configuration `settings_l`, on top of any such
+        configuration already set through environment variables. The environment variables are restored when the
+        context manager exits.
+
+        :param list settings_l: tuples (key, value), such as ``("url./some/folder/.insteadOf", "https://host/")``
+        '''
+        saved_environ_dict                          = {k: v for k, v in _os.environ.items() if Git_Config_Env._is_config_var(k)}
+        count                                       = int(_os.environ.get("GIT_CONFIG_COUNT", "0"))
+        for key, value in settings_l:
+            _os.environ[f"GIT_CONFIG_KEY_{count}"]  = key
+            _os.environ[f"GIT_CONFIG_VALUE_{count}"]= value
+            count                                   += 1
+        _os.environ["GIT_CONFIG_COUNT"]             = str(count)
+
+        try:
+            yield
+        finally:
+            for key in [k for k in _os.environ.keys() if Git_Config_Env._is_config_var(k)]:
+                del _os.environ[key]
+            _os.environ.update(saved_environ_dict)
+
+    def _is_config_var(name):
+        return name == "GIT_CONFIG_COUNT" or name.startswith("GIT_CONFIG_KEY_") or name.startswith("GIT_CONFIG_VALUE_")
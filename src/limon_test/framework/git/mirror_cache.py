@@ -0,0 +1,100 @@
+import concurrent.futures                                           as _futures
+import os                                                           as _os
+import re                                                           as _re
+import subprocess                                                   as _subprocess
+
+from limon_test.framework.git.git_config_env                        import Git_Config_Env
+
+class Mirror_Cache():
+
+    '''
+    Keeps local bare mirrors of remote GIT repos, so that cloning them becomes a disk-local operation.
+
+    The typical usage is:
+
+    1. Call :meth:`refresh` for the remote repos that are about to be cloned. The first time, this creates
+       a mirror of each remote (i.e., a full network clone). Later on, it only fetches whatever refs and objects
+       changed in the remote since the last refresh.
+    2. Within the context manager returned by :meth:`redirect`, clone the remote repos by their usual URL. GIT
+       transparently clones them from the local mirrors instead, hardlinking the object files where possible.
+
+    Clones made this way are indistinguishable from clones made from the remote: their `origin` is the remote's
+    URL and their remote-tracking branches are those of the remote, as of the refresh.
+
+    :param str cache_root: the folder under which the mirrors are kept
+    '''
+    def __init__(self, cache_root):
+
+        self.cache_root                             = cache_root
+
+    def mirror_path(self, remote_url):
+        '''
+        :param str remote_url: URL of a remote repo, such as ``https://owner@github.com/owner/repo.git``
+        :returns: the path of the local mirror for `remote_url`
+        :rtype: str
+        '''
+        # Strip the scheme and any credentials, so that the mirror does not depend on how the remote is accessed
+        location                                    = _re.sub(r"^[a-zA-Z+]+://", "", remote_url)
+        location                                    = location.split("@", 1)[-1]
+        location                                    = location.removesuffix(".git").strip("/")
+        location                                    = _re.sub(r"[^a-zA-Z0-9._/-]", "_", location)
+        return f"{self.cache_root}/{location}.git"
+
+    def refresh(self, remote_url):
+        '''
+        Creates or updates the local mirror for `remote_url`, so that it has the same refs as the remote.
+
+        :param str remote_url: URL of a remote repo
+        :returns: the path of the local mirror
+        :rtype: str
+        '''
+        mirror                                      = self.mirror_path(remote_url)
+        if _os.path.exists(f"{mirror}/HEAD"):
+            # Make sure the mirror points to the remote, in case the remote's URL has changed (e.g., credentials)
+            self._git("--git-dir", mirror, "remote", "set-url", "origin", remote_url)
+            self._git("--git-dir", mirror, "remote", "update", "--prune")
+        else:
+            _os.makedirs(_os.path.dirname(mirror), exist_ok=True)
+            self._git("clone", "--mirror", "--quiet", remote_url, mirror)
+        return mirror
+
+    def refresh_all(self, remote_urls_l, max_workers=8):
+        '''
+        Refreshes the mirrors of all of `remote_urls_l`, several at a time.
+
+        :param list remote_urls_l: URLs of remote repos
+        :param int max_workers: how many mirrors to refresh at the same time
+        :returns: the paths of the local mirrors, in the same order as `remote_urls_l`
+        :rtype: list
+        '''
+        with _futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.refresh, remote_urls_l))
+
+    def redirect(self, remote_urls_l):
+        '''
+        Returns a context manager within which GIT commands run by this process (or by its child processes)
+        fetch from the local mirrors of `remote_urls_l` instead of from the remotes. Pushes still go to the remotes.
+
+        It works by setting GIT configuration through environment variables (see :class:`Git_Config_Env`), so it
+        doesn't change any GIT configuration file.
+
+        :param list remote_urls_l: URLs of remote repos, whose mirrors should be up to date (see :meth:`refresh`)
+        '''
+        settings_l                                  = []
+        for remote_url in remote_urls_l:
+            mirror                                  = self.mirror_path(remote_url)
+            # GIT picks the longest matching prefix, so covering the URL with and without the ".git" suffix
+            # is enough for either form to be redirected to the mirror
+            #
+            for prefix in sorted(set([remote_url, remote_url.removesuffix(".git")])):
+                settings_l.append((f"url.{mirror}.insteadOf", prefix))
+                # Rewrite pushes to the URL itself, which takes precedence over `insteadOf` for pushes
+                settings_l.append((f"url.{prefix}.pushInsteadOf", prefix))
+
+        return Git_Config_Env.settings(settings_l)
+
+    def _git(self, *args):
+        completed                                   = _subprocess.run(["git", *args], capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"'git {' '.join(args)}' failed: {completed.stderr.strip()}")
+        return completed.stdout
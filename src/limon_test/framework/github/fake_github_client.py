@@ -0,0 +1,342 @@
+import asyncio
+import hashlib                                                      as _hashlib
+import json                                                         as _json
+import os                                                           as _os
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+import time                                                         as _time
+import urllib.parse                                                 as _urlparse
+
+class Fake_GitHub_Error(Exception):
+
+    '''
+    Raised by the :class:`Fake_GitHub_Client` in the situations where GitHub would have answered with an HTTP
+    error status.
+
+    It exposes the same `status` and `headers` attributes as the HTTP errors raised by real HTTP clients, so that
+    callers can handle both in the same way.
+
+    :param int status: the HTTP status GitHub would have answered with
+    :param str message: description of the error
+    :param dict headers: the HTTP response headers GitHub would have answered with
+    '''
+    def __init__(self, status, message, headers=None):
+        super().__init__(f"{status}: {message}")
+        self.status                                 = status
+        self.headers                                = headers if headers is not None else {}
+
+class Fake_GitHub_Client():
+
+    '''
+    In-process stand-in for :class:`limon_ops.util.github_client.GitHub_Client`, used by the test harness to
+    set up repo fixtures without network access.
+
+    It supports the same usage pattern as the real client, i.e., it is an asynchronous context manager with
+    `GET`, `POST`, `PATCH` and `DELETE` coroutines, and it answers with JSON dictionaries shaped like GitHub's.
+    Only the subset of the GitHub REST API that the harness uses is supported:
+
+    * ``GET users/repos``
+    * ``POST user/repos``
+    * ``DELETE repos/{repo}``
+    * ``GET repos/{repo}/git/refs/heads``
+    * ``POST repos/{repo}/git/refs``
+    * ``PATCH repos/{repo}/git/refs/heads/{branch}``
+    * ``DELETE repos/{repo}/git/refs/heads/{branch}``
+
+    Listings honor GitHub's ``per_page`` and ``page`` query parameters, so that pagination works as in GitHub.
+
+    The state (repos, refs and commit SHAs) is kept in memory. If a `store_path` is given, the state is loaded from
+    it when entering the context manager and saved back to it when exiting, so that it persists across runs just
+    like repos in GitHub would.
+
+    If a `repos_root` is given, each repo is also backed by a real bare GIT repo, ``{repos_root}/{repo}.git``.
+    Commits are then real GIT commits, and refs are read from and written to the bare repo, so that the repos
+    can be cloned and pushed to like the ones in GitHub (see :meth:`GitHub_Backends.remote_redirect`). Otherwise
+    SHAs are made up, and refs only exist in the stand-in's state.
+
+    :param str github_owner: the GitHub user or organization that owns the repos
+    :param str store_path: optional path to a JSON file in which to persist the state.
+    :param str repos_root: optional folder under which to keep a bare GIT repo for each repo.
+    :param float latency: how many seconds each call takes before it is answered, to stand in for the latency
+        of calls over the network. Defaults to 0.
+    '''
+    def __init__(self, github_owner, store_path=None, repos_root=None, latency=0.0):
+
+        self.github_owner                           = github_owner
+        self.store_path                             = store_path
+        self.repos_root                             = repos_root
+        self.latency                                = latency
+
+        self._state                                 = {"next_id": 1, "repos": {}}
+
+    async def __aenter__(self):
+        if self.store_path is not None and _os.path.exists(self.store_path):
+            with open(self.store_path, "r") as file:
+                self._state                         = _json.load(file)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.store_path is not None:
+            _os.makedirs(_os.path.dirname(self.store_path), exist_ok=True)
+            with open(self.store_path, "w") as file:
+                _json.dump(self._state, file, indent=4)
+
+    async def GET(self, resource, sub_path, **kwargs):
+        '''
+        Stand-in for a ``GET https://api.github.com/{resource}/...`` call.
+
+        :param str resource: a GitHub resource, like "repos" or "users"
+        :param str sub_path: the portion of the URL path after the resource (and after the owner, for resources
+            that are scoped to an owner)
+        :returns: the JSON response that GitHub would give
+        :rtype: dict | list
+        '''
+        await asyncio.sleep(self.latency)
+        path_l                                      = self._path_components(sub_path)
+        query_dict                                  = self._query_params(sub_path)
+
+        if resource == "users" and path_l == ["repos"]:
+            repos_l                                 = [self._repo_json(name)
+                                                            for name in sorted(self._state["repos"].keys())]
+            return self._page(repos_l, query_dict)
+
+        if resource == "repos" and len(path_l) == 4 and path_l[1:] == ["git", "refs", "heads"]:
+            refs_dict                               = await self._refs(path_l[0])
+            refs_l                                  = [self._ref_json(path_l[0], ref, refs_dict[ref])
+                                                            for ref in sorted(refs_dict.keys())
+                                                            if ref.startswith("refs/heads/")]
+            return self._page(refs_l, query_dict)
+
+        raise Fake_GitHub_Error(404, f"Unsupported GET {resource}{sub_path}")
+
+    async def POST(self, resource, sub_path, body=None, **kwargs):
+        '''
+        Stand-in for a ``POST https://api.github.com/{resource}/...`` call.
+
+        :param str resource: a GitHub resource, like "repos" or "user"
+        :param str sub_path: the portion of the URL path after the resource (and after the owner, for resources
+            that are scoped to an owner)
+        :param dict body: the JSON payload of the request
+        :returns: the JSON response that GitHub would give
+        :rtype: dict
+        '''
+        await asyncio.sleep(self.latency)
+        path_l                                      = self._path_components(sub_path)
+        body                                        = body if body is not None else {}
+
+        if resource == "user" and path_l == ["repos"]:
+            return await self._create_repo(body)
+
+        if resource == "repos" and len(path_l) == 3 and path_l[1:] == ["git", "refs"]:
+            repo_name                               = path_l[0]
+            ref                                     = body["ref"]
+            if ref in await self._refs(repo_name):
+                raise Fake_GitHub_Error(422, f"Reference '{ref}' already exists in '{repo_name}'")
+            await self._set_ref(repo_name, ref, body["sha"])
+            return self._ref_json(repo_name, ref, body["sha"])
+
+        raise Fake_GitHub_Error(404, f"Unsupported POST {resource}{sub_path}")
+
+    async def PATCH(self, resource, sub_path, body=None, **kwargs):
+        '''
+        Stand-in for a ``PATCH https://api.github.com/{resource}/...`` call.
+
+        :param str resource: a GitHub resource, like "repos"
+        :param str sub_path: the portion of the URL path after the resource and the owner
+        :param dict body: the JSON payload of the request
+        :returns: the JSON response that GitHub would give
+        :rtype: dict
+        '''
+        await asyncio.sleep(self.latency)
+        path_l                                      = self._path_components(sub_path)
+        body                                        = body if body is not None else {}
+
+        if resource == "repos" and len(path_l) > 3 and path_l[1:3] == ["git", "refs"]:
+            repo_name                               = path_l[0]
+            ref                                     = "refs/" + "/".join(path_l[3:])
+            if not ref in await self._refs(repo_name):
+                raise Fake_GitHub_Error(422, f"Reference '{ref}' does not exist in '{repo_name}'")
+            await self._set_ref(repo_name, ref, body["sha"])
+            return self._ref_json(repo_name, ref, body["sha"])
+
+        raise Fake_GitHub_Error(404, f"Unsupported PATCH {resource}{sub_path}")
+
+    async def DELETE(self, resource, sub_path, **kwargs):
+        '''
+        Stand-in for a ``DELETE https://api.github.com/{resource}/...`` call.
+
+        :param str resource: a GitHub resource, like "repos"
+        :param str sub_path: the portion of the URL path after the resource and the owner
+        :returns: the JSON response that GitHub would give (which is empty, since GitHub answers with a 204 status)
+        :rtype: dict
+        '''
+        await asyncio.sleep(self.latency)
+        path_l                                      = self._path_components(sub_path)
+
+        if resource == "repos" and len(path_l) == 1:
+            self._get_repo(path_l[0])
+            del self._state["repos"][path_l[0]]
+            if self.repos_root is not None and _os.path.exists(self._repo_path(path_l[0])):
+                await asyncio.to_thread(_shutil.rmtree, self._repo_path(path_l[0]))
+            return {}
+
+        if resource == "repos" and len(path_l) > 3 and path_l[1:3] == ["git", "refs"]:
+            repo_name                               = path_l[0]
+            ref                                     = "refs/" + "/".join(path_l[3:])
+            if not ref in await self._refs(repo_name):
+                raise Fake_GitHub_Error(422, f"Reference '{ref}' does not exist in '{repo_name}'")
+            if self.repos_root is None:
+                del self._state["repos"][repo_name]["refs"][ref]
+            else:
+                await self._git(repo_name, None, "update-ref", "-d", ref)
+            return {}
+
+        raise Fake_GitHub_Error(404, f"Unsupported DELETE {resource}{sub_path}")
+
+    def _path_components(self, sub_path):
+        path                                        = sub_path.split("?")[0]
+        return [p for p in path.split("/") if len(p) > 0]
+
+    def _query_params(self, sub_path):
+        query                                       = sub_path.split("?")[1] if "?" in sub_path else ""
+        return dict(_urlparse.parse_qsl(query))
+
+    def _page(self, items_l, query_dict):
+        # Like GitHub, default to 30 items per page
+        per_page                                    = int(query_dict.get("per_page", 30))
+        page                                        = int(query_dict.get("page", 1))
+        return items_l[(page - 1) * per_page : page * per_page]
+
+    def _get_repo(self, repo_name):
+        repo                                        = self._state["repos"].get(repo_name)
+        if repo is None:
+            raise Fake_GitHub_Error(404, f"Repo '{self.github_owner}/{repo_name}' not found")
+        return repo
+
+    async def _create_repo(self, body):
+        repo_name                                   = body["name"]
+        if repo_name in self._state["repos"]:
+            raise Fake_GitHub_Error(422, f"Repo '{self.github_owner}/{repo_name}' already exists")
+
+        repo_id                                     = self._state["next_id"]
+        self._state["next_id"]                      += 1
+
+        repo                                        = {"id":            repo_id,
+                                                       "description":   body.get("description"),
+                                                       "commits":       [],
+                                                       "refs":          {}}
+        self._state["repos"][repo_name]             = repo
+
+        if self.repos_root is not None:
+            repo_path                               = self._repo_path(repo_name)
+            if _os.path.exists(repo_path):
+                # Left over from a repo deleted outside of the stand-in (e.g., by discarding its store)
+                await asyncio.to_thread(_shutil.rmtree, repo_path)
+            _os.makedirs(repo_path)
+            await self._git(repo_name, None, "init", "--bare", "--quiet", "--initial-branch=master")
+
+        if body.get("auto_init", False):
+            # Like GitHub, create a first commit (with an empty README) on the default branch
+            if self.repos_root is None:
+                # Derive the SHA from the repo's id so that it is unique yet deterministic
+                sha                                 = self._new_sha(f"{self.github_owner}/{repo_name}#{repo_id}")
+            else:
+                sha                                 = await self._new_commit(repo_name, "refs/heads/master", "Initial commit",
+                                                                             "README.md", f"# {repo_name}\n")
+            repo["commits"].append(sha)
+            await self._set_ref(repo_name, "refs/heads/master", sha)
+
+        return self._repo_json(repo_name)
+
+    def _new_sha(self, seed):
+        return _hashlib.sha1(seed.encode("utf-8")).hexdigest()
+
+    def _repo_path(self, repo_name):
+        return f"{self.repos_root}/{repo_name}.git"
+
+    async def _refs(self, repo_name):
+        '''
+        :returns: a dictionary whose keys are the refs of the repo `repo_name`, and whose values are the SHAs of the
+            commits they point to.
+        :rtype: dict
+        '''
+        repo                                        = self._get_repo(repo_name)
+        if self.repos_root is None:
+            return dict(repo["refs"])
+
+        # Refs are read from the bare repo, since they may have been pushed to it
+        output                                      = await self._git(repo_name, None, "for-each-ref",
+                                                                      "--format=%(refname) %(objectname)")
+        return dict([line.split(" ") for line in output.splitlines()])
+
+    async def _set_ref(self, repo_name, ref, sha):
+        repo                                        = self._get_repo(repo_name)
+        if self.repos_root is None:
+            if not sha in repo["commits"]:
+                raise Fake_GitHub_Error(422, f"Object '{sha}' does not exist in '{repo_name}'")
+            repo["refs"][ref]                       = sha
+            return
+
+        try:
+            await self._git(repo_name, None, "cat-file", "-e", f"{sha}^{{commit}}")
+        except RuntimeError:
+            raise Fake_GitHub_Error(422, f"Object '{sha}' does not exist in '{repo_name}'")
+        await self._git(repo_name, None, "update-ref", ref, sha)
+
+    async def _new_commit(self, repo_name, ref, message, path, content):
+        '''
+        Creates a commit in the bare repo of `repo_name`, with a single file `path` whose content is `content`,
+        and makes `ref` point to it.
+
+        :returns: the SHA of the commit
+        :rtype: str
+        '''
+        stream                                      = "\n".join([f"commit {ref}",
+                                                                 f"committer GitHub <noreply@github.com> {int(_time.time())} +0000",
+                                                                 f"data {len(message.encode('utf-8'))}",
+                                                                 message,
+                                                                 f"M 644 inline {path}",
+                                                                 f"data {len(content.encode('utf-8'))}",
+                                                                 content,
+                                                                 ""])
+        await self._git(repo_name, stream, "fast-import", "--quiet")
+        return (await self._git(repo_name, None, "rev-parse", ref)).strip()
+
+    async def _git(self, repo_name, input_text, *args):
+        '''
+        Runs GIT on the bare repo of `repo_name` as a subprocess, without blocking the event loop, so that calls
+        for different repos run concurrently like they would in GitHub.
+
+        :param str input_text: if not None, it is written to the standard input of GIT
+        :returns: the standard output of GIT
+        :rtype: str
+        '''
+        process                                     = await asyncio.create_subprocess_exec(
+                                                            "git", "--git-dir", self._repo_path(repo_name), *args,
+                                                            stdin   = _subprocess.PIPE if input_text is not None else _subprocess.DEVNULL,
+                                                            stdout  = _subprocess.PIPE,
+                                                            stderr  = _subprocess.PIPE)
+        input_bytes                                 = input_text.encode("utf-8") if input_text is not None else None
+        stdout, stderr                              = await process.communicate(input_bytes)
+        if process.returncode != 0:
+            raise RuntimeError(f"'git {' '.join(args)}' failed for '{repo_name}': {stderr.decode('utf-8').strip()}")
+        return stdout.decode("utf-8")
+
+    def _repo_json(self, repo_name):
+        repo                                        = self._state["repos"][repo_name]
+        return {"id":                               repo["id"],
+                "name":                             repo_name,
+                "full_name":                        f"{self.github_owner}/{repo_name}",
+                "description":                      repo["description"],
+                "html_url":                         f"https://github.com/{self.github_owner}/{repo_name}",
+                "url":                              f"https://api.github.com/repos/{self.github_owner}/{repo_name}",
+                "default_branch":                   "master"}
+
+    def _ref_json(self, repo_name, ref, sha):
+        repo_url                                    = f"https://api.github.com/repos/{self.github_owner}/{repo_name}"
+        return {"ref":                              ref,
+                "url":                              f"{repo_url}/git/{ref}",
+                "object": {
+                    "sha":                          sha,
+                    "type":                         "commit",
+                    "url":                          f"{repo_url}/git/commits/{sha}"}}
@@ -0,0 +1,103 @@
+import contextlib                                                   as _contextlib
+
+from limon_test.framework.git.git_config_env                        import Git_Config_Env
+from limon_test.framework.github.fake_github_client                  import Fake_GitHub_Client
+from limon_test.framework.github.recording_github_client            import Recording_GitHub_Client
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+
+class GitHub_Backends():
+
+    '''
+    Factory for the objects through which the test harness talks to GitHub.
+
+    All the objects it returns have the same interface as :class:`limon_ops.util.github_client.GitHub_Client`,
+    but depending on the value of the environment variable named by `LimonTestStatics.GITHUB_BACKEND_VAR`
+    they may be a stand-in for GitHub instead of the real thing. Please refer to the documentation of
+    :class:`LimonTestStatics` for the possible values.
+    '''
+
+    def client(github_owner, recording_name="default"):
+        '''
+        :param str github_owner: the GitHub user or organization that owns the repos
+        :param str recording_name: used only by the "record" and "replay" backends, to identify the recording
+            to use. Normally it is the name of the project whose repos are being set up, so that recordings for
+            different scenarios don't overwrite each other.
+        :returns: an object that can be used like a :class:`limon_ops.util.github_client.GitHub_Client` for
+            `github_owner`, according to the GitHub backend configured for the harness.
+        '''
+        backend                                     = LimonTestStatics.GITHUB_BACKEND()
+        backend_root                                = f"{LimonTestStatics.CACHE_ROOT()}/github/{github_owner}"
+
+        if backend == LimonTestStatics.GITHUB_BACKEND_LIVE:
+            # Import here so that offline backends do not need the real client to be installed
+            from limon_ops.util.github_client                       import GitHub_Client
+
+            return GitHub_Client(github_owner = github_owner)
+
+        elif backend == LimonTestStatics.GITHUB_BACKEND_FAKE:
+            # When scenarios run in parallel, each worker gets its own stand-in for GitHub, since the stand-in's
+            # state is loaded and saved as a whole
+            #
+            worker_id                               = LimonTestStatics.WORKER_ID()
+            store_name                              = "fake_store" if worker_id is None else f"fake_store_{worker_id}"
+            return Fake_GitHub_Client(github_owner  = github_owner,
+                                      store_path    = f"{backend_root}/{store_name}.json",
+                                      repos_root    = GitHub_Backends.fake_repos_root(github_owner),
+                                      latency       = LimonTestStatics.FAKE_GITHUB_LATENCY())
+
+        elif backend in [LimonTestStatics.GITHUB_BACKEND_RECORD, LimonTestStatics.GITHUB_BACKEND_REPLAY]:
+            return Recording_GitHub_Client(github_owner     = github_owner,
+                                           cassette_path    = f"{backend_root}/recordings/{recording_name}.json",
+                                           replay           = backend == LimonTestStatics.GITHUB_BACKEND_REPLAY)
+
+        else:
+            raise ValueError(f"Unsupported GitHub backend '{backend}' set in "
+                             f"${LimonTestStatics.GITHUB_BACKEND_VAR}")
+
+    def fake_repos_root(github_owner):
+        '''
+        :param str github_owner: the GitHub user or organization that owns the repos
+        :returns: the folder with the bare GIT repos that back the "fake" backend's repos for `github_owner`.
+            When scenarios run in parallel, each worker has its own.
+        :rtype: str
+        '''
+        worker_id                                   = LimonTestStatics.WORKER_ID()
+        folder_name                                 = "fake_repos" if worker_id is None else f"fake_repos_{worker_id}"
+        return f"{LimonTestStatics.CACHE_ROOT()}/github/{github_owner}/{folder_name}"
+
+    def remote_redirect(remote_root, github_owner):
+        '''
+        Returns a context manager within which GIT commands run by this process (or by its child processes) that
+        clone, fetch from or push to repos under `remote_root` use the repos of the configured GitHub backend.
+
+        For the "fake" backend, that means the bare repos that back the stand-in (see :meth:`fake_repos_root`), so
+        tests can clone the repos the harness created in the stand-in without any network access. For other
+        backends, GIT commands are left alone, since their repos are in GitHub.
+
+        :param str remote_root: URL under which the repos are in GitHub, such as
+            ``https://{owner}@github.com/{owner}``
+        :param str github_owner: the GitHub user or organization that owns the repos
+        '''
+        if LimonTestStatics.GITHUB_BACKEND() != LimonTestStatics.GITHUB_BACKEND_FAKE:
+            return _contextlib.nullcontext()
+
+        # A single prefix rule covers all repos. `insteadOf` applies to pushes as well as to fetches
+        return Git_Config_Env.settings([(f"url.{GitHub_Backends.fake_repos_root(github_owner)}/.insteadOf",
+                                         f"{remote_root.rstrip('/')}/")])
+
+    def fixture_registry_path(github_owner):
+        '''
+        :param str github_owner: the GitHub user or organization that owns the repos
+        :returns: path to the JSON file where the harness remembers the initial commit of each repo fixture it
+            created for `github_owner`. There is one such file per backend, since each backend has its own SHAs.
+        :rtype: str
+        '''
+        backend                                     = LimonTestStatics.GITHUB_BACKEND()
+        if backend == LimonTestStatics.GITHUB_BACKEND_RECORD:
+            # Recording talks to the real GitHub, so it shares its fixtures with the live backend
+            backend                                 = LimonTestStatics.GITHUB_BACKEND_LIVE
+        elif backend == LimonTestStatics.GITHUB_BACKEND_FAKE and LimonTestStatics.WORKER_ID() is not None:
+            # Each worker has its own stand-in for GitHub, hence its own SHAs
+            backend                                 = f"{backend}_{LimonTestStatics.WORKER_ID()}"
+
+        return f"{LimonTestStatics.CACHE_ROOT()}/github/{github_owner}/fixtures_{backend}.json"
@@ -0,0 +1,196 @@
+import asyncio
+import random                                                       as _random
+import time                                                         as _time
+
+class GitHub_Scheduler():
+
+    '''
+    Wraps an object with the interface of :class:`limon_ops.util.github_client.GitHub_Client` (such as those
+    returned by :class:`GitHub_Backends`) so that the calls made through it are scheduled in a way that
+    respects GitHub's limits:
+
+    * At most `max_concurrency` calls are in flight at any given time.
+    * Calls rejected by GitHub due to rate limits (primary or secondary) are retried, up to `max_retries` times.
+      Before retrying, the scheduler waits for as long as GitHub asks through the ``Retry-After`` or
+      ``X-RateLimit-Reset`` headers or, if GitHub doesn't say, for an exponentially growing delay with jitter.
+      While waiting, no other call is started either, since they would be rejected too.
+
+    It also offers :meth:`paginate`, to stream the items of GitHub listings that span multiple pages.
+
+    The scheduler has the same `GET`, `POST`, `PATCH` and `DELETE` coroutines as the object it wraps, so callers
+    can use it as a drop-in replacement. Since not all clients support all verbs (e.g., a client might lack
+    `PATCH`), callers can check with :meth:`supports` before relying on one.
+
+    GOTCHA: HTTP errors are recognized by duck typing: they must have a `status` attribute and, optionally,
+    a `headers` attribute, or else a `response` attribute with those (or with `status_code` instead of `status`).
+    That is the case for the errors raised by aiohttp, by requests and by :class:`Fake_GitHub_Client`. Errors
+    without a status are raised without retrying.
+
+    :param github: the object through which GitHub is accessed, which must be already opened (i.e., the caller
+        must have entered its asynchronous context manager)
+    :param int max_concurrency: the maximum number of calls to GitHub that can be in flight at the same time
+    :param int max_retries: how many times to retry a call rejected due to rate limits, before giving up
+    :param float base_delay: number of seconds to wait before the first retry, if GitHub doesn't say how long
+        to wait. It doubles for each subsequent retry.
+    :param float max_delay: the maximum number of seconds to wait before a retry.
+    :param Span_Timer span_timer: if given, each call is timed as a span named after its HTTP verb, with the
+        repo it is about (if any) as an attribute.
+    '''
+    def __init__(self, github, max_concurrency=8, max_retries=5, base_delay=1.0, max_delay=60.0, span_timer=None):
+
+        self.github                                 = github
+        self.max_concurrency                        = max_concurrency
+        self.max_retries                            = max_retries
+        self.base_delay                             = base_delay
+        self.max_delay                              = max_delay
+        self.span_timer                             = span_timer
+
+        # Created lazily, so that it is bound to the event loop in which calls are actually made
+        self._semaphore                             = None
+
+        # Time (as per time.monotonic) before which no call should be started, because GitHub asked us to back off
+        self._resume_at                             = 0.0
+
+    async def GET(self, resource, sub_path, **kwargs):
+        return await self._call("GET", resource, sub_path, **kwargs)
+
+    async def POST(self, resource, sub_path, body=None, **kwargs):
+        return await self._call("POST", resource, sub_path, body=body, **kwargs)
+
+    async def PATCH(self, resource, sub_path, body=None, **kwargs):
+        return await self._call("PATCH", resource, sub_path, body=body, **kwargs)
+
+    async def DELETE(self, resource, sub_path, **kwargs):
+        return await self._call("DELETE", resource, sub_path, **kwargs)
+
+    def supports(self, verb):
+        '''
+        :param str verb: an HTTP verb, such as "PATCH"
+        :returns: True if the wrapped object can make calls with `verb`. Calls with other verbs fail.
+        :rtype: bool
+        '''
+        supports                                    = getattr(self.github, "supports", None)
+        if supports is not None:
+            return supports(verb)
+        return callable(getattr(self.github, verb, None))
+
+    async def paginate(self, resource, sub_path, per_page=100):
+        '''
+        Asynchronous generator that yields, one at a time, all the items of a GitHub listing, such as
+        ``GET users/repos``. Pages are requested one after the other, as the caller consumes the items.
+
+        :param str resource: a GitHub resource, like "users"
+        :param str sub_path: the portion of the URL path after the resource, such as "/repos"
+        :param int per_page: how many items to request in each page. GitHub allows up to 100.
+        '''
+        separator                                   = "&" if "?" in sub_path else "?"
+        page                                        = 1
+        while True:
+            items_l                                 = await self.GET(
+                                                            resource    = resource,
+                                                            sub_path    = f"{sub_path}{separator}per_page={per_page}&page={page}")
+            for item in items_l:
+                yield item
+
+            if len(items_l) < per_page:
+                return
+            page                                    += 1
+
+    def http_error(ex):
+        '''
+        :param Exception ex: an error raised by a call to GitHub
+        :returns: a tuple (status, headers) with the HTTP status and response headers of `ex`, or with None for
+            those that `ex` doesn't have, e.g. because it is not an HTTP error.
+        :rtype: tuple
+        '''
+        # Errors either carry the response's status and headers (like aiohttp's), or the response itself (like
+        # requests')
+        #
+        response                                    = getattr(ex, "response", None)
+        status                                      = getattr(ex, "status", None)
+        if status is None and response is not None:
+            status                                  = getattr(response, "status", getattr(response, "status_code", None))
+        headers                                     = getattr(ex, "headers", None)
+        if headers is None and response is not None:
+            headers                                 = getattr(response, "headers", None)
+        return status, headers
+
+    async def _call(self, verb, resource, sub_path, **kwargs):
+        if self.span_timer is None:
+            return await self._scheduled_call(verb, resource, sub_path, **kwargs)
+
+        # For resources like "repos", the first component of sub_path is the repo's name. When creating a repo,
+        # the name is in the body
+        #
+        body                                        = kwargs.get("body")
+        if resource == "repos":
+            repo                                    = sub_path.split("?")[0].strip("/").split("/")[0]
+        elif isinstance(body, dict):
+            repo                                    = body.get("name", "")
+        else:
+            repo                                    = ""
+        with self.span_timer.span(f"github.{verb}", resource=resource, repo=repo):
+            return await self._scheduled_call(verb, resource, sub_path, **kwargs)
+
+    async def _scheduled_call(self, verb, resource, sub_path, **kwargs):
+        if self._semaphore is None:
+            self._semaphore                         = asyncio.Semaphore(self.max_concurrency)
+
+        method                                      = getattr(self.github, verb)
+        attempt                                     = 0
+        while True:
+            async with self._semaphore:
+                await self._wait_until_resumed()
+                try:
+                    return await method(resource=resource, sub_path=sub_path, **kwargs)
+                except Exception as ex:
+                    delay                           = self._retry_delay(ex, attempt)
+                    if delay is None or attempt >= self.max_retries:
+                        raise
+                    self._resume_at                 = max(self._resume_at, _time.monotonic() + delay)
+
+            attempt                                 += 1
+
+    async def _wait_until_resumed(self):
+        remaining_wait                              = self._resume_at - _time.monotonic()
+        while remaining_wait > 0:
+            await asyncio.sleep(remaining_wait)
+            remaining_wait                          = self._resume_at - _time.monotonic()
+
+    def _retry_delay(self, ex, attempt):
+        '''
+        :returns: how many seconds to wait before retrying a call that failed with exception `ex`, or None if
+            the call should not be retried because the failure was not due to rate limits.
+        :rtype: float
+        '''
+        status, headers                             = GitHub_Scheduler.http_error(ex)
+        headers                                     = {str(k).lower(): v for k, v in headers.items()} \
+                                                            if headers is not None else {}
+
+        retry_after                                 = headers.get("retry-after")
+        rate_limit_remaining                        = headers.get("x-ratelimit-remaining")
+        rate_limit_reset                            = headers.get("x-ratelimit-reset")
+
+        # GitHub signals rate limits with a 429, or with a 403 that either has rate limit headers or
+        # mentions the limit in the message (for secondary rate limits). Other 403s are about permissions, so
+        # there is no point in retrying them.
+        #
+        if status == 429:
+            pass
+        elif status == 403 and (retry_after is not None or str(rate_limit_remaining) == "0"
+                                    or "rate limit" in str(ex).lower()):
+            pass
+        else:
+            return None
+
+        if retry_after is not None:
+            delay                                   = float(retry_after)
+        elif str(rate_limit_remaining) == "0" and rate_limit_reset is not None:
+            # X-RateLimit-Reset is the time, in seconds since the epoch, at which the rate limit window resets
+            delay                                   = float(rate_limit_reset) - _time.time()
+        else:
+            delay                                   = self.base_delay * (2 ** attempt)
+
+        # Add jitter so that concurrent callers don't all come back at the same time
+        delay                                       = min(max(delay, 0.0), self.max_delay)
+        return delay + _random.uniform(0, self.base_delay)
@@ -0,0 +1,118 @@
+import asyncio
+import json                                                         as _json
+import os                                                           as _os
+
+class ReplayMissError(Exception):
+
+    '''
+    Raised by a :class:`Recording_GitHub_Client` in replay mode when asked for a request for which there is no
+    recorded response.
+    '''
+
+class Recording_GitHub_Client():
+
+    '''
+    Stand-in for :class:`limon_ops.util.github_client.GitHub_Client` that can either record the responses from
+    GitHub, or replay previously recorded responses without any network access.
+
+    Recordings are kept in a JSON "cassette" file, as a list of entries, each of them having the verb, resource,
+    sub_path and body of a request, plus the response that GitHub gave.
+
+    When replaying, a request is matched against the recorded entries with the same verb, resource, sub_path and
+    body, and these are served in the order in which they were recorded. So if the same request was done
+    several times when recording (e.g., listing the repos before and after some change), each replay
+    gets the response of the corresponding occurrence.
+
+    GOTCHA: matching is by request and not by the global order of the recording, since the harness creates repos
+    concurrently and so the relative order of requests for different repos is not deterministic.
+
+    :param str github_owner: the GitHub user or organization that owns the repos
+    :param str cassette_path: path to the JSON file where responses are recorded to or replayed from.
+    :param bool replay: if True, responses are served from `cassette_path`. Otherwise real calls are made
+        to GitHub and recorded into `cassette_path`.
+    :param github: when recording, the (not yet opened) client whose responses to record. If None, it is a
+        :class:`limon_ops.util.github_client.GitHub_Client` for `github_owner`.
+    '''
+    def __init__(self, github_owner, cassette_path, replay, github=None):
+
+        self.github_owner                           = github_owner
+        self.cassette_path                          = cassette_path
+        self.replay                                 = replay
+
+        self._entries_l                             = []
+        self._pending_dict                          = {}
+        self._github                                = github
+
+    async def __aenter__(self):
+        if self.replay:
+            if not _os.path.exists(self.cassette_path):
+                raise ReplayMissError(f"There is no recording to replay at '{self.cassette_path}'")
+            with open(self.cassette_path, "r") as file:
+                self._entries_l                     = _json.load(file)
+            for entry in self._entries_l:
+                key                                 = self._key(entry["verb"], entry["resource"],
+                                                                entry["sub_path"], entry["body"])
+                self._pending_dict.setdefault(key, []).append(entry["response"])
+        else:
+            if self._github is None:
+                # Import here so that replay mode does not need the real client to be installed
+                from limon_ops.util.github_client                   import GitHub_Client
+
+                self._github                        = GitHub_Client(github_owner = self.github_owner)
+            await self._github.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if not self.replay:
+            await self._github.__aexit__(exc_type, exc_value, traceback)
+            _os.makedirs(_os.path.dirname(self.cassette_path), exist_ok=True)
+            with open(self.cassette_path, "w") as file:
+                _json.dump(self._entries_l, file, indent=4)
+
+    def supports(self, verb):
+        '''
+        :param str verb: an HTTP verb, such as "PATCH"
+        :returns: True if calls with `verb` can be made. When replaying, that is the case if some call with `verb`
+            was recorded, and otherwise if the client being recorded supports it.
+        :rtype: bool
+        '''
+        if self.replay:
+            return any(entry["verb"] == verb for entry in self._entries_l)
+        return callable(getattr(self._github, verb, None))
+
+    async def GET(self, resource, sub_path, **kwargs):
+        return await self._call("GET", resource, sub_path, None, **kwargs)
+
+    async def POST(self, resource, sub_path, body=None, **kwargs):
+        return await self._call("POST", resource, sub_path, body, **kwargs)
+
+    async def PATCH(self, resource, sub_path, body=None, **kwargs):
+        return await self._call("PATCH", resource, sub_path, body, **kwargs)
+
+    async def DELETE(self, resource, sub_path, **kwargs):
+        return await self._call("DELETE", resource, sub_path, None, **kwargs)
+
+    async def _call(self, verb, resource, sub_path, body, **kwargs):
+        if self.replay:
+            await asyncio.sleep(0)
+            responses_l                             = self._pending_dict.get(self._key(verb, resource, sub_path, body))
+            if responses_l is None or len(responses_l) == 0:
+                raise ReplayMissError(f"No recorded response for {verb} {resource}{sub_path} "
+                                      f"in '{self.cassette_path}'")
+            return responses_l.pop(0)
+
+        method                                      = getattr(self._github, verb)
+        if body is None:
+            response                                = await method(resource=resource, sub_path=sub_path, **kwargs)
+        else:
+            response                                = await method(resource=resource, sub_path=sub_path, body=body,
+                                                                   **kwargs)
+        self._entries_l.append({"verb":             verb,
+                                "resource":         resource,
+                                "sub_path":         sub_path,
+                                "body":             body,
+                                "response":         response})
+        return response
+
+    def _key(self, verb, resource, sub_path, body):
+        return (verb, resource, sub_path, _json.dumps(body, sort_keys=True))
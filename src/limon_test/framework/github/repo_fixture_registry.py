@@ -0,0 +1,86 @@
+import json                                                         as _json
+import os                                                           as _os
+import uuid                                                         as _uuid
+
+class Repo_Fixture_Registry():
+
+    '''
+    Remembers, across test runs, the initial commit of each repo fixture that the harness created in GitHub.
+
+    This is what allows a pre-existing repo fixture to be reset in place: as long as the harness knows the SHA
+    of the commit that GitHub made when the repo was created with `auto_init`, it can move the repo's branches
+    back to it instead of deleting and re-creating the repo.
+
+    The same registry file may be shared by concurrent test runs (e.g., by the workers of a
+    :class:`Parallel_Scenario_Runner` that use the live GitHub backend). So :meth:`save` only applies the changes
+    made through this instance to whatever is in the file at that time, and replaces the file atomically, so
+    that readers never see it half-written.
+
+    :param str registry_path: path to the JSON file where the registry is persisted.
+    '''
+    def __init__(self, registry_path):
+
+        self.registry_path                          = registry_path
+
+        self._initial_sha_dict                      = self._load()
+
+        # Changes made through this instance, to apply on save. Keys are repo names, and values are initial SHAs,
+        # or None for repos that were forgotten
+        #
+        self._changes_dict                          = {}
+
+    def initial_sha(self, repo_name):
+        '''
+        :param str repo_name: name of a repo fixture
+        :returns: the SHA of the initial commit of `repo_name`, or None if the harness did not create that repo.
+        :rtype: str
+        '''
+        return self._initial_sha_dict.get(repo_name)
+
+    def register(self, repo_name, initial_sha):
+        '''
+        Records that `repo_name` was created with `initial_sha` as its initial commit.
+
+        :param str repo_name: name of a repo fixture
+        :param str initial_sha: SHA of the initial commit of `repo_name`
+        '''
+        self._initial_sha_dict[repo_name]           = initial_sha
+        self._changes_dict[repo_name]               = initial_sha
+
+    def forget(self, repo_name):
+        '''
+        Removes `repo_name` from the registry, typically because it was deleted.
+
+        :param str repo_name: name of a repo fixture
+        '''
+        self._initial_sha_dict.pop(repo_name, None)
+        self._changes_dict[repo_name]               = None
+
+    def save(self):
+        '''
+        Persists the changes made through this instance to `self.registry_path`, merging them with the entries
+        that are in it at that time.
+        '''
+        _os.makedirs(_os.path.dirname(self.registry_path), exist_ok=True)
+
+        merged_dict                                 = self._load()
+        for repo_name, initial_sha in self._changes_dict.items():
+            if initial_sha is None:
+                merged_dict.pop(repo_name, None)
+            else:
+                merged_dict[repo_name]              = initial_sha
+
+        # Write to a private file and rename it, which is atomic
+        tmp_path                                    = f"{self.registry_path}.{_uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as file:
+            _json.dump(merged_dict, file, indent=4, sort_keys=True)
+        _os.replace(tmp_path, self.registry_path)
+
+        self._initial_sha_dict                      = merged_dict
+        self._changes_dict                          = {}
+
+    def _load(self):
+        if not _os.path.exists(self.registry_path):
+            return {}
+        with open(self.registry_path, "r") as file:
+            return _json.load(file)
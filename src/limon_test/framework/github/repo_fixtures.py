@@ -0,0 +1,260 @@
+import json                                                         as _json
+import time                                                         as _time
+
+from limon_test.framework.github.github_scheduler                   import GitHub_Scheduler
+
+class Repo_Fixtures():
+
+    '''
+    Sets up the GitHub repos that repo manipulation tests use as fixtures, so that each of them has a master
+    branch with just an initial commit, and an integration branch pointing to that same commit.
+
+    Repos are either created (deleting them first if they already existed), or, if they were created earlier by
+    the harness and re-use is requested, reset in place. Please refer to :meth:`create` and :meth:`reset`.
+
+    :param github: object through which GitHub is accessed, normally a :class:`GitHub_Scheduler`
+    :param Repo_Fixture_Registry registry: where the initial commit of each repo fixture is recorded, so that
+        repos can later be reset in place.
+    :param str integration_branch: name of the integration branch, normally ``GitBranches.INTEGRATION_BRANCH.value``
+    :param log: optional callable to log progress, taking a message and keyword fields such as `repo` or
+        `latency`. The message is either a string, or a callable without arguments that returns it.
+    '''
+
+    # HTTP statuses with which GitHub answers when a repo can't be reset in place: 404 if the repo (or branch) is
+    # no longer there, and 422 if the initial commit recorded for the repo is not in it.
+    #
+    RESET_FAILURE_STATUSES                          = [404, 422]
+
+    def __init__(self, github, registry, integration_branch, log=None):
+
+        self.github                                 = github
+        self.registry                               = registry
+        self.integration_branch                     = integration_branch
+        self.log                                    = log if log is not None else lambda message, **fields: None
+
+    def can_reset(self):
+        '''
+        :returns: True if repos can be reset in place through `self.github`, which requires it to support
+            ``PATCH``. Otherwise pre-existing repos can only be re-created.
+        :rtype: bool
+        '''
+        supports                                    = getattr(self.github, "supports", None)
+        if supports is not None:
+            return supports("PATCH")
+        return callable(getattr(self.github, "PATCH", None))
+
+    async def pre_existing_repos(self):
+        '''
+        :returns: the names of the repos that currently exist in GitHub for the owner of `self.github`
+        :rtype: list
+        '''
+        # GitHub HTTP calls are something like
+        #
+        #   'GET https://api.github.com/users/testrobot-ccl/repos?per_page=100&page=1'
+        #
+        # with as many pages as needed to list all the repos of the test account
+        #
+        return [r["name"] async for r in self.github.paginate(resource="users", sub_path="/repos")]
+
+    def setup_coroutines(self, repo_names_l, pre_existing_repos_names, reuse_repos):
+        '''
+        :param list repo_names_l: names of the repos to set up
+        :param list pre_existing_repos_names: names of the repos that existed in GitHub before setting up fixtures
+        :param bool reuse_repos: if True, repos in `pre_existing_repos_names` that the harness created earlier
+            are reset in place, if `self.github` allows it. Otherwise all repos are (re-)created.
+        :returns: one coroutine per repo in `repo_names_l` which, when awaited, sets up that repo and returns
+            its name. They are independent of each other, so they can be awaited concurrently.
+        :rtype: list
+        '''
+        if reuse_repos and not self.can_reset():
+            self.log("Repos will be re-created rather than reset in place, since the GitHub client does not "
+                     + "support PATCH")
+            reuse_repos                             = False
+
+        coroutines_l                                = []
+        for repo_name in repo_names_l:
+            if reuse_repos and repo_name in pre_existing_repos_names \
+                           and self.registry.initial_sha(repo_name) is not None:
+                coroutines_l.append(self.reset(repo_name))
+            else:
+                coroutines_l.append(self.create(repo_name, pre_existing_repos_names))
+        return coroutines_l
+
+    async def create(self, repo_name, pre_existing_repos_names):
+        '''
+        Creates the GitHub repo `repo_name` with a first commit in the master branch, and creates the integration
+        branch pointing to that same commit. If the repo already existed, it is deleted first.
+
+        :param str repo_name: name of the repo to create
+        :param list pre_existing_repos_names: names of the repos that existed in GitHub before setting up fixtures
+        :returns: `repo_name`
+        :rtype: str
+        '''
+        github                                      = self.github
+        if repo_name in pre_existing_repos_names:
+
+            # Must delete this old repo, so that we can subsequently create it fresh. We do a
+            #
+            #   DELETE https://api.github.com/repos/testrobot-ccl/{repo_name}
+            #
+            start                                   = _time.perf_counter()
+            removal_data                            = await github.DELETE(
+                                                                    resource = "repos",
+                                                                    sub_path = f"/{repo_name}")
+            self.registry.forget(repo_name)
+            self.log(lambda: f"Removed pre-existing repo '{repo_name}' so we can re-create it - response was "
+                                + _json.dumps(removal_data, indent=4),
+                     repo = repo_name, latency = f"{_time.perf_counter() - start:.3f}s")
+
+        # Create the repo. We do
+        #
+        #       POST https://api.github.com/user/repos
+        #
+        # GOTCHA: the "user" resource is treated differenty by the GitHub_RepoInspector because the
+        #           {owner} is not added to the URL
+        #
+        start                                       = _time.perf_counter()
+        repo_creation_result                        = await github.POST(
+                                                            resource        = "user",
+                                                            sub_path        = "/repos",
+                                                            body            =
+                                                                {"name":            repo_name,
+                                                                "description":      "Repo used as a fixture by Conway tests",
+                                                                "auto_init":        True, # So a first commit with empty README is done
+                                                                })
+
+        repo_url                                    = repo_creation_result["html_url"]
+        self.log(f"Created repo '{repo_name}' with URL {repo_url}",
+                 repo = repo_name, latency = f"{_time.perf_counter() - start:.3f}s")
+
+
+        # We need to create the integration branch, but for that we first need to get the
+        # the sha for the last commit on the master branch. For that we do:
+        #
+        #       GET https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs/heads
+        #
+        start                                       = _time.perf_counter()
+        heads_data                                  = await github.GET(
+                                                            resource        = "repos",
+                                                            sub_path        = f"/{repo_name}/git/refs/heads",
+                                                            )
+        # heads_data is something like
+        #
+        #    [
+        #        {
+        #            "ref": "refs/heads/master",
+        #            "node_id": "REF_kwDOL6SBFbFyZWZzL2hlYWRzL21hc3Rlcg",
+        #            "url": "https://api.github.com/repos/testrobot-ccl/scenario_8002.svc/git/refs/heads/master",
+        #            "object": {
+        #                "sha": "3f69985b23cf38dca098b3b867e28bf06a8a0aa5",
+        #                "type": "commit",
+        #                "url": "https://api.github.com/repos/testrobot-ccl/scenario_8002.svc/git/commits/3f69985b23cf38dca098b3b867e28bf06a8a0aa5"
+        #            }
+        #        },
+        #           ...
+        #    ]
+        #
+        # So we extract the master branch, and from it get the SHA of interest
+        #
+        master                                      = [elt for elt in heads_data if elt["ref"]  == "refs/heads/master"][0]
+        sha                                         = master["object"]["sha"]
+        self.registry.register(repo_name, sha)
+
+        # Now create the integration branch on the repo. We will do a
+        #
+        #       POST https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs
+        #
+        integration                                 = self.integration_branch
+        branch_creation_result                      = await github.POST(
+                                                            resource        = "repos",
+                                                            sub_path        = f"/{repo_name}/git/refs",
+                                                            body            = {
+                                                                "ref":      f"refs/heads/{integration}",
+                                                                "sha":      f"{sha}"
+                                                            })
+
+        branch_url                                  = branch_creation_result["url"]
+        self.log(f"Created '{integration}' branch in '{repo_name}' with URL {branch_url}",
+                 repo = repo_name, latency = f"{_time.perf_counter() - start:.3f}s")
+
+        # By away of status, return the repo_name so the caller knows which repo was created
+        return repo_name
+
+    async def reset(self, repo_name):
+        '''
+        Resets a pre-existing GitHub repo `repo_name` to the state it had when it was created by :meth:`create`,
+        without deleting it: the master and integration branches are force-moved to the repo's initial commit, and
+        any other branch is deleted.
+
+        This is normally just one round trip to GitHub (to get the branches), plus one more for each branch that
+        is not where it should be. That is much cheaper than deleting and re-creating the repo, and it is not
+        exposed to GitHub's eventual consistency after a DELETE.
+
+        If GitHub answers that the repo cannot be reset (i.e., with a status in
+        `Repo_Fixtures.RESET_FAILURE_STATUSES`, e.g. because the repo was re-created outside the harness and its
+        initial commit is not the one recorded in the registry), it is deleted and created afresh. Any other
+        error is raised.
+
+        GOTCHA: only branches are reset. Tags, issues, pull requests and other GitHub artifacts are left
+        as they are, since the tests don't create them.
+
+        :param str repo_name: name of the repo to reset
+        :returns: `repo_name`
+        :rtype: str
+        '''
+        github                                      = self.github
+        start                                       = _time.perf_counter()
+        initial_sha                                 = self.registry.initial_sha(repo_name)
+        expected_refs_l                             = ["refs/heads/master", f"refs/heads/{self.integration_branch}"]
+
+        try:
+            # We do
+            #
+            #       GET https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs/heads
+            #
+            heads_data                              = await github.GET(
+                                                            resource        = "repos",
+                                                            sub_path        = f"/{repo_name}/git/refs/heads",
+                                                            )
+            existing_refs_dict                      = {elt["ref"]: elt["object"]["sha"] for elt in heads_data}
+
+            for ref in expected_refs_l:
+                if not ref in existing_refs_dict:
+                    # Branch is missing, so create it with
+                    #
+                    #       POST https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs
+                    #
+                    await github.POST(  resource        = "repos",
+                                        sub_path        = f"/{repo_name}/git/refs",
+                                        body            = {"ref": ref, "sha": initial_sha})
+                elif existing_refs_dict[ref] != initial_sha:
+                    # Branch has moved on, so force it back with
+                    #
+                    #       PATCH https://api.github.com/repos/testrobot-ccl/{repo_name}/git/{ref}
+                    #
+                    await github.PATCH( resource        = "repos",
+                                        sub_path        = f"/{repo_name}/git/{ref}",
+                                        body            = {"sha": initial_sha, "force": True})
+
+            for ref in existing_refs_dict.keys():
+                if not ref in expected_refs_l:
+                    # Branch was created by some earlier test, so remove it with
+                    #
+                    #       DELETE https://api.github.com/repos/testrobot-ccl/{repo_name}/git/{ref}
+                    #
+                    await github.DELETE(resource        = "repos",
+                                        sub_path        = f"/{repo_name}/git/{ref}")
+
+        except Exception as ex:
+            status, _                               = GitHub_Scheduler.http_error(ex)
+            if not status in self.RESET_FAILURE_STATUSES:
+                raise
+            self.log(f"Could not reset repo '{repo_name}' in place, so will re-create it - error was {ex}",
+                     repo = repo_name)
+            # After a 404 the repo itself might be gone, in which case there is nothing to delete first
+            return await self.create(repo_name, await self.pre_existing_repos())
+
+        self.log(f"Reset repo '{repo_name}' in place to initial commit {initial_sha}",
+                 repo = repo_name, latency = f"{_time.perf_counter() - start:.3f}s")
+
+        return repo_name
@@ -0,0 +1,139 @@
+import collections                                                  as _collections
+import queue                                                        as _queue
+import sys                                                          as _sys
+import threading                                                    as _threading
+import time                                                         as _time
+import weakref                                                      as _weakref
+
+class Async_Log_Sink():
+
+    '''
+    Delivers log records to a writer from a background thread, so that logging doesn't block the code that logs.
+
+    Records are tuples (timestamp, message, fields, log_level), where:
+
+    * `timestamp` is the time (in seconds since the epoch) at which the record was logged
+    * `message` is the text to log, or a callable without arguments that returns it. In the latter case, it is
+      only called when the record is formatted, i.e., by the background thread, so that the cost of formatting
+      (e.g., prettifying a big JSON response) is not paid by the code that logs.
+    * `fields` is a dictionary with structured data about the record, like the repo or latency of what is logged
+    * `log_level` is the level at which to log the record
+
+    The last `ring_buffer_size` records are also kept in memory, so that they can be dumped with
+    :meth:`dump_ring_buffer` when a test fails.
+
+    Since records are delivered asynchronously, code that captures the output of the writer (e.g., to report
+    the output of each test separately) must call :meth:`flush`, or :meth:`flush_all`, before it stops capturing.
+
+    :param write: callable that takes the formatted text of a record and its log level, and writes it. It is
+        only called from the background thread.
+    :param int ring_buffer_size: how many of the most recent records to keep in memory.
+    '''
+    # All sinks that have not been garbage collected, for `flush_all`
+    _INSTANCES                                      = _weakref.WeakSet()
+
+    def __init__(self, write, ring_buffer_size=2000):
+
+        self.write                                  = write
+
+        self._ring_buffer                           = _collections.deque(maxlen=ring_buffer_size)
+        self._queue                                 = _queue.SimpleQueue()
+        self._sink_thread                           = None
+        self._sink_lock                             = _threading.Lock()
+
+        Async_Log_Sink._INSTANCES.add(self)
+
+    def flush_all():
+        '''
+        Waits until all the records put so far in any sink have been written.
+        '''
+        for sink in list(Async_Log_Sink._INSTANCES):
+            sink.flush()
+
+    def put(self, record):
+        '''
+        Enqueues `record` to be written by the background thread, without waiting for it to be written.
+
+        :param tuple record: the record to write, as described for this class
+        '''
+        self._ring_buffer.append(record)
+
+        self._start_sink()
+        self._queue.put(record)
+
+    def flush(self):
+        '''
+        Waits until all the records put so far have been written.
+        '''
+        if self._sink_thread is None:
+            return
+        done                                        = _threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        '''
+        Writes any pending records and stops the background thread. It is safe to call it more than once.
+        '''
+        with self._sink_lock:
+            if self._sink_thread is None:
+                return
+            self._queue.put(None)
+            self._sink_thread.join()
+            self._sink_thread                       = None
+
+    def clear_ring_buffer(self):
+        '''
+        Forgets the records in the ring buffer, e.g., when a new test starts.
+        '''
+        self._ring_buffer.clear()
+
+    def dump_ring_buffer(self, stream=None):
+        '''
+        Writes all the records in the ring buffer, with their fields, to `stream`.
+
+        :param stream: where to write the records. Defaults to stderr.
+        '''
+        stream                                      = stream if stream is not None else _sys.stderr
+        self.flush()
+        stream.write(f"-------- Last {len(self._ring_buffer)} log records --------\n")
+        for record in list(self._ring_buffer):
+            timestamp                               = _time.strftime("%H:%M:%S", _time.localtime(record[0]))
+            stream.write(f"{timestamp}.{int(record[0] * 1000) % 1000:03d} {self.format(record)}\n")
+        stream.flush()
+
+    def format(self, record):
+        '''
+        :param tuple record: a record, as described for this class
+        :returns: the text of the record, followed by its fields (if any)
+        :rtype: str
+        '''
+        timestamp, message, fields, log_level       = record
+        text                                        = message() if callable(message) else message
+        if len(fields) == 0:
+            return text
+        fields_text                                 = " ".join([f"{k}={v}" for k, v in fields.items()])
+        return f"{text} [{fields_text}]"
+
+    def _start_sink(self):
+        if self._sink_thread is not None:
+            return
+        with self._sink_lock:
+            if self._sink_thread is None:
+                self._sink_thread                   = _threading.Thread(target=self._drain, name="Async_Log_Sink",
+                                                                        daemon=True)
+                self._sink_thread.start()
+
+    def _drain(self):
+        while True:
+            record                                  = self._queue.get()
+            if record is None:
+                return
+            if isinstance(record, _threading.Event):
+                record.set()
+                continue
+            try:
+                self.write(self.format(record), record[3])
+            except Exception as ex:
+                # A faulty record must not stop the writing of later ones
+                _sys.stderr.write(f"Async_Log_Sink could not write a record: {ex}\n")
@@ -0,0 +1,83 @@
+import contextlib                                                   as _contextlib
+import contextvars                                                  as _contextvars
+import json                                                         as _json
+import os                                                           as _os
+import threading                                                    as _threading
+import time                                                         as _time
+
+class Span_Timer():
+
+    '''
+    Records how long each step ("span") of a test takes, where spans can be nested within each other.
+
+    Each span has a name, and its "path" is made of the names of the spans that enclose it, like
+    ``test_repo_setup/github_fixtures/github.POST``. Nesting is tracked per thread and per asyncio task, so
+    spans opened by concurrent tasks (e.g., one per repo) are attributed to the span that was open when the
+    tasks were created, and don't get nested within each other.
+
+    Spans may also have attributes, like the repo they are about, to tell apart spans with the same path.
+
+    Recorded spans can be saved as a JSON timing record, which the :mod:`timing_report` tool can compare across
+    runs to flag performance regressions.
+    '''
+    # Path of the innermost span open in the current thread or asyncio task
+    _CURRENT_PATH                                   = _contextvars.ContextVar("limon_test_span_path", default="")
+
+    def __init__(self):
+
+        self._records_l                             = []
+        self._lock                                  = _threading.Lock()
+
+    @_contextlib.contextmanager
+    def span(self, name, **attributes):
+        '''
+        Context manager that records the time spent within it as a span called `name`, nested under whatever
+        span is currently open.
+
+        :param str name: the name of the span, such as "github.POST" or "create_repo_report"
+        :param attributes: optional data about the span, such as `repo="scenario_8002.svc"`
+        '''
+        parent_path                                 = Span_Timer._CURRENT_PATH.get()
+        path                                        = name if parent_path == "" else f"{parent_path}/{name}"
+        token                                       = Span_Timer._CURRENT_PATH.set(path)
+
+        start_time                                  = _time.time()
+        start                                       = _time.perf_counter()
+        try:
+            yield
+        finally:
+            duration                                = _time.perf_counter() - start
+            Span_Timer._CURRENT_PATH.reset(token)
+            with self._lock:
+                self._records_l.append({"path":         path,
+                                        "start":        start_time,
+                                        "duration":     duration,
+                                        "attributes":   {k: str(v) for k, v in attributes.items()}})
+
+    def records(self):
+        '''
+        :returns: the spans recorded so far, each as a dictionary with the path, start time (in seconds since the
+            epoch), duration (in seconds) and attributes of the span.
+        :rtype: list
+        '''
+        with self._lock:
+            return list(self._records_l)
+
+    def reset(self):
+        '''
+        Forgets the spans recorded so far.
+        '''
+        with self._lock:
+            self._records_l                         = []
+
+    def save(self, path, run_info=None):
+        '''
+        Writes the spans recorded so far to a JSON timing record.
+
+        :param str path: the JSON file to write
+        :param dict run_info: optional data about the run, such as the test that was run
+        '''
+        _os.makedirs(_os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            _json.dump({"run_info":     run_info if run_info is not None else {},
+                        "spans":        self.records()}, file, indent=4)
@@ -0,0 +1,121 @@
+import argparse                                                     as _argparse
+import json                                                         as _json
+import os                                                           as _os
+import sys                                                          as _sys
+
+class Timing_Report():
+
+    '''
+    Compares timing records written by :class:`Span_Timer`, to see where the time of a run goes and to flag
+    performance regressions against a baseline.
+
+    Spans are compared by path, adding up the durations of all the spans with the same path in a run (e.g., all
+    the ``github.POST`` calls made while setting up repo fixtures).
+
+    :param float threshold: a path regresses if it takes more than `threshold` times as long as in the baseline...
+    :param float min_secs: ...and at least `min_secs` seconds more than in the baseline. This keeps the noise in
+        very short spans from being flagged.
+    '''
+    def __init__(self, threshold=1.25, min_secs=0.1):
+
+        self.threshold                              = threshold
+        self.min_secs                               = min_secs
+
+    def load(self, path):
+        '''
+        :param str path: a JSON timing record written by :meth:`Span_Timer.save`
+        :returns: a dictionary whose keys are span paths, and whose values are dictionaries with the number of
+            spans with that path and their total duration in seconds.
+        :rtype: dict
+        '''
+        with open(path, "r") as file:
+            spans_l                                 = _json.load(file)["spans"]
+
+        totals_dict                                 = {}
+        for span in spans_l:
+            entry                                   = totals_dict.setdefault(span["path"], {"count": 0, "total": 0.0})
+            entry["count"]                          += 1
+            entry["total"]                          += span["duration"]
+        return totals_dict
+
+    def compare(self, baseline_path, current_path):
+        '''
+        :param str baseline_path: the timing record to compare against
+        :param str current_path: the timing record of the run being checked
+        :returns: a list with one dictionary per span path, sorted by path, with the baseline and current
+            total durations and whether the path regressed.
+        :rtype: list
+        '''
+        baseline_dict                               = self.load(baseline_path)
+        current_dict                                = self.load(current_path)
+
+        rows_l                                      = []
+        for path in sorted(set(baseline_dict.keys()).union(current_dict.keys())):
+            baseline                                = baseline_dict.get(path, {}).get("total")
+            current                                 = current_dict.get(path, {}).get("total")
+            regressed                               = baseline is not None and current is not None \
+                                                            and current > baseline * self.threshold \
+                                                            and current - baseline > self.min_secs
+            rows_l.append({"path":                  path,
+                           "baseline":              baseline,
+                           "current":               current,
+                           "regressed":             regressed})
+        return rows_l
+
+    def trend(self, records_folder):
+        '''
+        :param str records_folder: a folder with timing records of successive runs of the same test
+        :returns: a list with one entry per timing record in `records_folder`, sorted by file name (which for
+            records written by the harness is chronological). Each entry is a tuple made of the file name and
+            the span totals of that run, as returned by :meth:`load`.
+        :rtype: list
+        '''
+        names_l                                     = sorted([n for n in _os.listdir(records_folder) if n.endswith(".json")])
+        return [(name, self.load(f"{records_folder}/{name}")) for name in names_l]
+
+def _secs(value):
+    return "-" if value is None else f"{value:.3f}"
+
+def main(args):
+    parser                                          = _argparse.ArgumentParser(
+                                                            description = "Compares timing records of limon test runs")
+    sub_parsers                                     = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser                                  = sub_parsers.add_parser("compare",
+                                                            help="flags regressions of a run against a baseline")
+    compare_parser.add_argument("baseline", help="timing record to compare against")
+    compare_parser.add_argument("current", help="timing record of the run to check")
+    compare_parser.add_argument("--threshold", type=float, default=1.25,
+                                help="ratio over the baseline from which a span regresses (default 1.25)")
+    compare_parser.add_argument("--min-secs", type=float, default=0.1,
+                                help="minimum increase, in seconds, for a span to regress (default 0.1)")
+
+    trend_parser                                    = sub_parsers.add_parser("trend",
+                                                            help="shows how top-level spans evolve across runs")
+    trend_parser.add_argument("records_folder", help="folder with the timing records of a test")
+    trend_parser.add_argument("--depth", type=int, default=2, help="deepest span level to show (default 2)")
+
+    parsed                                          = parser.parse_args(args)
+
+    if parsed.command == "compare":
+        report                                      = Timing_Report(threshold=parsed.threshold, min_secs=parsed.min_secs)
+        rows_l                                      = report.compare(parsed.baseline, parsed.current)
+        for row in rows_l:
+            flag                                    = "REGRESSED" if row["regressed"] else ""
+            print(f"{_secs(row['baseline']):>10} {_secs(row['current']):>10}  {flag:9}  {row['path']}")
+        regressions_l                               = [row for row in rows_l if row["regressed"]]
+        print(f"{len(regressions_l)} regressions found")
+        return 1 if len(regressions_l) > 0 else 0
+
+    else:
+        runs_l                                      = Timing_Report().trend(parsed.records_folder)
+        paths_l                                     = sorted(set([p for name, totals in runs_l for p in totals.keys()
+                                                                    if p.count("/") < parsed.depth]))
+        for path in paths_l:
+            print(path)
+            for name, totals in runs_l:
+                print(f"    {name:40} {_secs(totals.get(path, {}).get('total')):>10}")
+        return 0
+
+if __name__ == "__main__":
+    _sys.exit(main(_sys.argv[1:]))
@@ -0,0 +1,238 @@
+import argparse                                                     as _argparse
+import concurrent.futures                                           as _futures
+import contextlib                                                   as _contextlib
+import io                                                           as _io
+import json                                                         as _json
+import multiprocessing                                              as _multiprocessing
+import os                                                           as _os
+import shutil                                                       as _shutil
+import sys                                                          as _sys
+import time                                                         as _time
+import unittest                                                     as _unittest
+
+from limon_test.framework.observability.async_log_sink              import Async_Log_Sink
+from limon_test.framework.observability.timing_report               import Timing_Report
+from limon_test.framework.util.file_cloning                         import File_Cloning
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+
+class Parallel_Scenario_Runner():
+
+    '''
+    Runs test scenarios in parallel, in a pool of worker processes.
+
+    Running scenarios one after the other is needed within a process, because the :class:`Limon_Test_Application`
+    is a process-wide singleton and the harness assumes a single scenarios repo. So this class gives each worker
+    its own process, and hence its own application, plus its own isolated copy of the scenarios repo:
+
+    * The copy is made once per worker, when the worker starts, by reflinking the files of the scenarios
+      repo (see :class:`File_Cloning`). So on file systems that support it, the copy is almost free.
+    * Since the test database (including the local and remote repo hubs) lives under the scenarios repo, each
+      worker also gets its own hubs.
+    * If the harness uses a stand-in for GitHub, each worker gets its own stand-in.
+
+    The results of all the scenarios are merged into a single summary, written as a JSON file under `work_root`.
+    For each test it has the status, duration and captured output (which includes its logs), plus the timing
+    records the test wrote (see :meth:`RepoManipulationTestCase._save_timings`), with their span totals. The
+    span totals of all tests are also added up, per span path, at the top of the summary.
+
+    Workers do not add a suffix of their own to the names of the GitHub repos they use as fixtures. Those names
+    come from the user profile in each scenario's seed (e.g., ``scenario_8002.svc``), and they appear in the
+    scenario's expected outputs, so a suffix would make every scenario's outputs differ from what is expected.
+    Suffixes are not needed either: repos are named after the scenario id, so workers can only clash if they run
+    the same scenario at the same time. Instead, the runner rejects a run that requests the same test more than
+    once. With the "fake" GitHub backend, each worker also has its own stand-in, so not even that could clash.
+
+    :param int workers: how many worker processes to use. If None, the number of CPUs is used.
+    :param str scenarios_repo: the scenarios repo that workers should copy. If None, it is the one configured
+        through the environment variable named by `TestStatics.SCENARIOS_REPO`.
+    :param str work_root: folder under which to put the workers' copies and the summary. If None, it is a
+        ``.limon_test_workers`` folder next to `scenarios_repo`, so that the copies are at the same folder depth
+        and under the same parent folders (which matters to tests that infer things from their location, like
+        whether they are in an operate branch).
+    '''
+    def __init__(self, workers=None, scenarios_repo=None, work_root=None):
+
+        # Import here, so that the runner's command line stays fast and does not need the Conway modules
+        from conway_acceptance.util.test_statics                    import TestStatics
+
+        self.workers                                = workers if workers is not None else _os.cpu_count()
+        self.scenarios_repo                         = scenarios_repo if scenarios_repo is not None \
+                                                            else _os.environ.get(TestStatics.SCENARIOS_REPO)
+        if self.scenarios_repo is None:
+            raise ValueError(f"Can't find the scenarios repo since ${TestStatics.SCENARIOS_REPO} is not set")
+
+        self.work_root                              = work_root if work_root is not None \
+                                                            else f"{_os.path.dirname(self.scenarios_repo)}/.limon_test_workers"
+
+        self.scenarios_repo_var                     = TestStatics.SCENARIOS_REPO
+
+    def run(self, test_ids):
+        '''
+        Runs the tests `test_ids` in parallel, and returns the merged results.
+
+        :param list test_ids: dotted names of the tests to run, as accepted by `unittest`, such as
+            ``limon_test.tests_conway_ops.onboarding.test_repo_setup.TestRepoSetup.test_repo_setup``
+        :returns: a dictionary with the overall wall-clock time of the run, and a list with a dictionary
+            for the result of each test, in the same order as `test_ids`.
+        :rtype: dict
+        '''
+        duplicates_l                                = sorted(set([t for t in test_ids if test_ids.count(t) > 1]))
+        if len(duplicates_l) > 0:
+            raise ValueError(f"These tests were requested more than once, so they would clash: {duplicates_l}")
+
+        start                                       = _time.perf_counter()
+
+        # Workers are started with "spawn", so that none inherits the parent's application singleton
+        mp_context                                  = _multiprocessing.get_context("spawn")
+        slot_queue                                  = mp_context.Queue()
+        for slot in range(self.workers):
+            slot_queue.put(slot)
+
+        with _futures.ProcessPoolExecutor(max_workers       = self.workers,
+                                          mp_context        = mp_context,
+                                          initializer       = _initialize_worker,
+                                          initargs          = (slot_queue, self.scenarios_repo, self.work_root,
+                                                               self.scenarios_repo_var)) as executor:
+            futures_l                               = [executor.submit(_run_one_test, test_id) for test_id in test_ids]
+            results_l                               = [future.result() for future in futures_l]
+
+        # Add up the span totals of all tests, per span path
+        timings_dict                                = {}
+        for result in results_l:
+            for timing_record in result["timing_records"]:
+                for path, totals in timing_record["totals"].items():
+                    entry                           = timings_dict.setdefault(path, {"count": 0, "total": 0.0})
+                    entry["count"]                  += totals["count"]
+                    entry["total"]                  += totals["total"]
+
+        summary                                     = {"workers":           self.workers,
+                                                       "wall_clock_secs":   _time.perf_counter() - start,
+                                                       "timings":           timings_dict,
+                                                       "results":           results_l}
+
+        _os.makedirs(self.work_root, exist_ok=True)
+        with open(f"{self.work_root}/results.json", "w") as file:
+            _json.dump(summary, file, indent=4)
+
+        return summary
+
+def _initialize_worker(slot_queue, scenarios_repo, work_root, scenarios_repo_var):
+    '''
+    Runs in each worker process when it starts, to give it its own copy of the scenarios repo and to point the
+    harness to it.
+    '''
+    worker_id                                       = str(slot_queue.get())
+    worker_scenarios_repo                           = f"{work_root}/worker_{worker_id}/{_os.path.basename(scenarios_repo)}"
+
+    if _os.path.exists(worker_scenarios_repo):
+        _shutil.rmtree(worker_scenarios_repo)
+    File_Cloning.clone_tree(scenarios_repo, worker_scenarios_repo, ignore=_ignore_top_level_git(scenarios_repo))
+
+    _os.environ[scenarios_repo_var]                 = worker_scenarios_repo
+    _os.environ[LimonTestStatics.WORKER_ID_VAR]     = worker_id
+
+def _ignore_top_level_git(scenarios_repo):
+    '''
+    :returns: a callable for the `ignore` parameter of `shutil.copytree` that skips the ".git" folder of
+        `scenarios_repo` itself, but not any ".git" folder within it, since seeds may contain GIT repos of
+        their own.
+    '''
+    def ignore(folder, names_l):
+        if _os.path.normpath(folder) == _os.path.normpath(scenarios_repo) and ".git" in names_l:
+            return [".git"]
+        return []
+
+    return ignore
+
+def _run_one_test(test_id):
+    '''
+    Runs in a worker process, to run one test and report its result.
+    '''
+    output                                          = _io.StringIO()
+    start                                           = _time.perf_counter()
+
+    # Timing records that exist before the test runs are not the test's
+    stamps_before_dict                              = _timing_record_stamps(test_id)
+
+    # Capture the logs too, which go to stdout or stderr, so that the output of concurrent tests is not interleaved
+    with _contextlib.redirect_stdout(output), _contextlib.redirect_stderr(output):
+        suite                                       = _unittest.defaultTestLoader.loadTestsFromName(test_id)
+        result                                      = _unittest.TextTestRunner(stream=output, verbosity=2).run(suite)
+
+        # Logging is asynchronous, so wait for records still in flight before output stops being captured
+        Async_Log_Sink.flush_all()
+
+    if len(result.errors) > 0:
+        status                                      = "error"
+    elif len(result.failures) > 0:
+        status                                      = "failed"
+    elif len(result.skipped) > 0 and result.testsRun == len(result.skipped):
+        status                                      = "skipped"
+    else:
+        status                                      = "passed"
+
+    return {"test_id":                              test_id,
+            "worker":                               _os.environ.get(LimonTestStatics.WORKER_ID_VAR),
+            "status":                               status,
+            "duration_secs":                        _time.perf_counter() - start,
+            "output":                               output.getvalue(),
+            "timing_records":                       [{"path": path, "totals": Timing_Report().load(path)}
+                                                            for path, stamp in sorted(_timing_record_stamps(test_id).items())
+                                                            if stamps_before_dict.get(path) != stamp]}
+
+def _timing_record_stamps(test_id):
+    '''
+    :param str test_id: dotted name of a test, or of a test module or class, as accepted by `unittest`
+    :returns: a dictionary whose keys are the paths of the timing records of the tests that `test_id` names (see
+        :meth:`RepoManipulationTestCase._save_timings`), and whose values change whenever a record is written.
+    :rtype: dict
+    '''
+    timings_root                                    = f"{LimonTestStatics.CACHE_ROOT()}/timings"
+    if not _os.path.isdir(timings_root):
+        return {}
+
+    stamps_dict                                     = {}
+    for test_folder in _os.listdir(timings_root):
+        # Timing records are in a folder per test id, so those of a module or class are in several folders
+        if test_folder != test_id and not test_folder.startswith(f"{test_id}."):
+            continue
+        for name in _os.listdir(f"{timings_root}/{test_folder}"):
+            path                                    = f"{timings_root}/{test_folder}/{name}"
+            if name.endswith(".json"):
+                stat                                = _os.stat(path)
+                stamps_dict[path]                   = (stat.st_mtime_ns, stat.st_size)
+    return stamps_dict
+
+def main(args):
+    parser                                          = _argparse.ArgumentParser(
+                                                            description = "Runs limon test scenarios in parallel")
+    parser.add_argument("test_ids", nargs="+",
+                        help="dotted names of the tests to run, as accepted by unittest")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (defaults to the number of CPUs)")
+    parser.add_argument("--work-root", default=None,
+                        help="folder for the workers' copies of the scenarios repo and for the results")
+    parser.add_argument("--force", action="store_true",
+                        help="run tests even if their inputs are unchanged since they last passed")
+    parsed                                          = parser.parse_args(args)
+
+    if parsed.force:
+        # Inherited by the worker processes
+        _os.environ[LimonTestStatics.FORCE_VAR]     = "true"
+
+    runner                                          = Parallel_Scenario_Runner(workers   = parsed.workers,
+                                                                               work_root = parsed.work_root)
+    summary                                         = runner.run(parsed.test_ids)
+
+    for result in summary["results"]:
+        print(f"[worker {result['worker']}] {result['status']:8} {result['duration_secs']:8.2f}s  {result['test_id']}")
+        if result["status"] in ["failed", "error"]:
+            print(result["output"])
+    print(f"Ran {len(summary['results'])} tests with {summary['workers']} workers "
+          f"in {summary['wall_clock_secs']:.2f}s - results in {runner.work_root}/results.json")
+
+    succeeded                                       = all([r["status"] in ["passed", "skipped"] for r in summary["results"]])
+    return 0 if succeeded else 1
+
+if __name__ == "__main__":
+    _sys.exit(main(_sys.argv[1:]))
@@ -0,0 +1,125 @@
+import hashlib                                                      as _hashlib
+import json                                                         as _json
+import os                                                           as _os
+import zipfile                                                      as _zipfile
+
+from limon_test.framework.util.tree_walker                          import Tree_Walker
+
+class Content_Manifest():
+
+    '''
+    Persistent record of the content hashes of the files in one or more folder structures ("trees"), used to
+    find out cheaply whether a tree has changed since some earlier point in time.
+
+    For each tree, identified by a label, the manifest remembers the size, modification time and content hash of
+    each file. When a tree is hashed again, files whose size and modification time are unchanged are not read
+    again: their hash is taken from the manifest.
+
+    It also remembers which combinations of trees were verified to match, so that callers can skip an
+    expensive comparison if neither tree has changed since it last succeeded.
+
+    GOTCHA: Excel files (``.xlsx``) embed their creation time in their document properties, so two workbooks
+    with the same data would hash differently if hashed as raw bytes. So for them the hash is computed over the
+    content of the zip members, excluding the document properties.
+
+    :param str manifest_path: path to the JSON file in which the manifest is persisted.
+    '''
+    def __init__(self, manifest_path):
+
+        self.manifest_path                          = manifest_path
+
+        self._trees_dict                            = {}
+        self._verified_dict                         = {}
+        if _os.path.exists(manifest_path):
+            with open(manifest_path, "r") as file:
+                data                                = _json.load(file)
+            self._trees_dict                        = data.get("trees", {})
+            self._verified_dict                     = data.get("verified", {})
+
+    def hash_tree(self, label, root_folder, walker=None):
+        '''
+        Computes the content hash of every file under `root_folder`, re-using the hashes remembered for
+        the tree `label` for files whose size and modification time have not changed.
+
+        :param str label: identifies the tree in the manifest, e.g., "expected" or "actual"
+        :param str root_folder: the root of the folder structure to hash
+        :param Tree_Walker walker: used to list the files under `root_folder`. If None, a :class:`Tree_Walker`
+            with default exclusions is used.
+        :returns: a dictionary whose keys are the paths of files relative to `root_folder`, and whose values are
+            their content hashes.
+        :rtype: dict
+        '''
+        walker                                      = walker if walker is not None else Tree_Walker()
+        previous_dict                               = self._trees_dict.get(label, {})
+        current_dict                                = {}
+
+        prefix_length                               = len(root_folder) + 1
+        for path in walker.walk(root_folder):
+            relative_path                           = path[prefix_length:]
+            stat                                    = _os.stat(path)
+
+            previous                                = previous_dict.get(relative_path)
+            if previous is not None and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+                content_hash                        = previous[2]
+            else:
+                content_hash                        = self._content_hash(path)
+
+            current_dict[relative_path]             = [stat.st_size, stat.st_mtime_ns, content_hash]
+
+        self._trees_dict[label]                     = current_dict
+
+        return {relative_path: entry[2] for relative_path, entry in current_dict.items()}
+
+    def digest(self, hashes_dict):
+        '''
+        :param dict hashes_dict: content hashes of a tree, as returned by :meth:`hash_tree`
+        :returns: a single hash for the whole tree, which changes if any file is added, removed, renamed or modified.
+        :rtype: str
+        '''
+        hasher                                      = _hashlib.sha256()
+        for relative_path in sorted(hashes_dict.keys()):
+            hasher.update(f"{relative_path}\0{hashes_dict[relative_path]}\n".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def is_verified(self, check_name, *digests):
+        '''
+        :param str check_name: identifies the comparison, e.g., the name of the test case that does it
+        :param digests: the digests (as returned by :meth:`digest`) of the trees being compared
+        :returns: True if the comparison `check_name` was previously recorded as successful for these same digests.
+        :rtype: bool
+        '''
+        return self._verified_dict.get(check_name) == list(digests)
+
+    def mark_verified(self, check_name, *digests):
+        '''
+        Records that the comparison `check_name` was successful for trees with the given `digests`.
+
+        :param str check_name: identifies the comparison, e.g., the name of the test case that does it
+        :param digests: the digests (as returned by :meth:`digest`) of the trees being compared
+        '''
+        self._verified_dict[check_name]             = list(digests)
+
+    def save(self):
+        '''
+        Persists the manifest to `self.manifest_path`
+        '''
+        _os.makedirs(_os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(self.manifest_path, "w") as file:
+            _json.dump({"trees": self._trees_dict, "verified": self._verified_dict}, file)
+
+    def _content_hash(self, path):
+        hasher                                      = _hashlib.sha256()
+
+        if path.endswith(".xlsx") and _zipfile.is_zipfile(path):
+            with _zipfile.ZipFile(path) as workbook:
+                for member in sorted(workbook.namelist()):
+                    if member.startswith("docProps/"):
+                        continue
+                    hasher.update(member.encode("utf-8") + b"\0")
+                    hasher.update(workbook.read(member))
+            return hasher.hexdigest()
+
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
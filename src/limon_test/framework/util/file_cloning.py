@@ -0,0 +1,81 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+
+try:
+    import fcntl                                                    as _fcntl
+except ImportError:
+    # Not available on Windows, where files are always copied normally
+    _fcntl                                          = None
+
+class File_Cloning():
+
+    '''
+    Utilities to copy files and folder structures as cheaply as the file system allows.
+
+    On file systems that support it (e.g., Btrfs or XFS on Linux), files are "reflinked": the copy shares the
+    data blocks of the original, and the file system makes a private copy of a block only when either file is
+    written to it. Elsewhere, files are copied normally.
+
+    Either way the result is an independent copy, so writing to it never affects the original.
+    '''
+
+    # Linux ioctl request to clone a file's data blocks into another file, as defined in <linux/fs.h>
+    FICLONE                                         = 0x40049409
+
+    def clone(src_path, dst_path):
+        '''
+        Copies the file `src_path` to `dst_path`, including its metadata, by reflinking it if possible.
+
+        It has the same signature as `shutil.copy2`, so it can be used as the `copy_function` of `shutil.copytree`.
+
+        :param str src_path: the file to copy
+        :param str dst_path: the path of the copy
+        :returns: `dst_path`
+        :rtype: str
+        '''
+        if File_Cloning.reflink(src_path, dst_path):
+            _shutil.copystat(src_path, dst_path)
+        else:
+            _shutil.copy2(src_path, dst_path)
+
+        return dst_path
+
+    def reflink(src_path, dst_path):
+        '''
+        Makes `dst_path` a reflink of the file `src_path`, if the file system supports it. Unlike :meth:`clone`,
+        it doesn't fall back to a normal copy, nor copies metadata other than the permission bits.
+
+        :param str src_path: the file to reflink
+        :param str dst_path: the path of the reflink. If the reflink can't be made, nothing is left at this path.
+        :returns: True if the reflink was made, False otherwise
+        :rtype: bool
+        '''
+        if _fcntl is None:
+            return False
+
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                _fcntl.ioctl(dst.fileno(), File_Cloning.FICLONE, src.fileno())
+        except OSError:
+            # Reflinks are not supported by this file system (or not across these two paths)
+            if _os.path.exists(dst_path):
+                _os.remove(dst_path)
+            return False
+
+        _shutil.copymode(src_path, dst_path)
+        return True
+
+    def clone_tree(src_folder, dst_folder, ignore=None):
+        '''
+        Copies the folder structure `src_folder` to `dst_folder`, which must not exist yet, reflinking files
+        if possible.
+
+        :param str src_folder: the root of the folder structure to copy
+        :param str dst_folder: where to create the copy
+        :param ignore: optional callable to choose which files not to copy, as in `shutil.copytree`
+        :returns: `dst_folder`
+        :rtype: str
+        '''
+        _os.makedirs(_os.path.dirname(dst_folder), exist_ok=True)
+        return _shutil.copytree(src_folder, dst_folder, symlinks=True, ignore=ignore,
+                                copy_function=File_Cloning.clone)
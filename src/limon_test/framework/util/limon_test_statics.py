@@ -0,0 +1,187 @@
+import os                                                           as _os
+
+class LimonTestStatics():
+
+    '''
+    Static values (mostly names of environment variables) that configure the behaviour of the :class:`limon_test`
+    harness.
+
+    They complement the ones in :class:`conway_acceptance.util.test_statics.TestStatics`, which are about
+    the Conway acceptance framework in general. The ones here are specific to the limon test harness.
+    '''
+
+    # Environment variable for the folder under which the harness keeps state that should survive across test runs
+    # (GitHub stand-in stores, recorded GitHub responses, etc.). If not set, it defaults to a `.limon_test_cache`
+    # folder at the root of the repo containing this file.
+    #
+    CACHE_ROOT_VAR                                  = "LIMON_TEST_CACHE"
+
+    # Environment variable to choose how the harness talks to GitHub. Possible values are:
+    #
+    #   * "live"    - real HTTP calls to GitHub through :class:`limon_ops.util.github_client.GitHub_Client`.
+    #                 This is the default.
+    #   * "fake"    - an in-process stand-in for GitHub, persisted under the cache root.
+    #   * "record"  - like "live", but each response is recorded so that it can later be replayed.
+    #   * "replay"  - serves previously recorded responses, without any network access.
+    #
+    GITHUB_BACKEND_VAR                              = "LIMON_TEST_GITHUB_BACKEND"
+
+    GITHUB_BACKEND_LIVE                             = "live"
+    GITHUB_BACKEND_FAKE                             = "fake"
+    GITHUB_BACKEND_RECORD                           = "record"
+    GITHUB_BACKEND_REPLAY                           = "replay"
+
+    # Environment variables to configure how calls to GitHub are scheduled: how many can be in flight at the same
+    # time, and how many times to retry a call rejected by GitHub due to rate limits.
+    #
+    GITHUB_CONCURRENCY_VAR                          = "LIMON_TEST_GITHUB_CONCURRENCY"
+    GITHUB_RETRIES_VAR                              = "LIMON_TEST_GITHUB_RETRIES"
+
+    # Environment variable for how many seconds each call to the "fake" GitHub backend takes, so that it can stand
+    # in for the latency of calls over the network (e.g., in benchmarks). Defaults to 0.
+    #
+    FAKE_GITHUB_LATENCY_VAR                         = "LIMON_TEST_FAKE_GITHUB_LATENCY"
+
+    # Environment variable to turn on the re-use of repo fixtures. If set to "true", repo fixtures that already
+    # exist in GitHub are reset in place (i.e., their branches are moved back to the initial commit) instead of
+    # being deleted and created again.
+    #
+    REUSE_REPOS_VAR                                 = "LIMON_TEST_REUSE_REPOS"
+
+    # Environment variable to turn on the clone cache. If set to "true", repos that tests clone from GitHub are
+    # cloned from local mirrors under the cache root instead, after refreshing the mirrors' refs from GitHub.
+    #
+    MIRROR_CACHE_VAR                                = "LIMON_TEST_MIRROR_CACHE"
+
+    # Environment variable to control whether seed files materialized by tests may be hardlinks to the harness's
+    # store of seed files, when the file system doesn't support reflinks. Defaults to "false", i.e., plain copies.
+    # Only set it to "true" if no code under test writes to seed files in place (rather than replacing them),
+    # since such writes would go to the shared store.
+    #
+    SEED_HARDLINKS_VAR                              = "LIMON_TEST_SEED_HARDLINKS"
+
+    # Environment variable to choose how Excel outputs of tests are compared to their expected values. Possible
+    # values are:
+    #
+    #   * "conway"  - with the Conway acceptance framework, as driven by the `Chassis_ExcelsToCompare` of each test.
+    #                 This is the default.
+    #   * "limon"   - with the :class:`Excel_Comparison_Engine`, which caches parsed workbooks. It ignores the
+    #                 `Chassis_ExcelsToCompare` of each test, and instead compares every Excel file that is both in
+    #                 the expected and in the actual outputs, so it is only suitable for tests that register all
+    #                 their Excel outputs for comparison.
+    #
+    EXCEL_ENGINE_VAR                                = "LIMON_TEST_EXCEL_ENGINE"
+
+    EXCEL_ENGINE_LIMON                              = "limon"
+    EXCEL_ENGINE_CONWAY                             = "conway"
+
+    # Environment variable to force tests to run even if none of their inputs changed since they last passed. If
+    # set to "true", previous passes are not re-used.
+    #
+    FORCE_VAR                                       = "LIMON_TEST_FORCE"
+
+    # Environment variable set by the :class:`Parallel_Scenario_Runner` in each of its worker processes, to
+    # identify the worker. Resources that a worker must not share with others (like the state of a GitHub
+    # stand-in) are kept apart based on it.
+    #
+    WORKER_ID_VAR                                   = "LIMON_TEST_WORKER_ID"
+
+    def CACHE_ROOT():
+        '''
+        :returns: the folder under which the harness keeps state that should survive across test runs.
+        :rtype: str
+        '''
+        cache_root                                  = _os.environ.get(LimonTestStatics.CACHE_ROOT_VAR)
+        if cache_root is None:
+            # __file__ is something like
+            #
+            #       /home/alex/dev/scratch.test/src/limon_test/framework/util/limon_test_statics.py
+            #
+            # so the root of the repo is reached after stripping the last 5 components of the path.
+            #
+            repo_root                               = __file__
+            for idx in range(5):
+                repo_root                           = _os.path.dirname(repo_root)
+            cache_root                              = f"{repo_root}/.limon_test_cache"
+
+        return cache_root
+
+    def GITHUB_BACKEND():
+        '''
+        :returns: the kind of GitHub backend the harness should use, as configured by the environment variable
+            named by `LimonTestStatics.GITHUB_BACKEND_VAR`.
+        :rtype: str
+        '''
+        return _os.environ.get(LimonTestStatics.GITHUB_BACKEND_VAR, LimonTestStatics.GITHUB_BACKEND_LIVE).lower()
+
+    def GITHUB_CONCURRENCY():
+        '''
+        :returns: the maximum number of calls to GitHub that the harness may have in flight at the same time, as
+            configured by the environment variable named by `LimonTestStatics.GITHUB_CONCURRENCY_VAR`.
+        :rtype: int
+        '''
+        return int(_os.environ.get(LimonTestStatics.GITHUB_CONCURRENCY_VAR, "8"))
+
+    def GITHUB_RETRIES():
+        '''
+        :returns: how many times the harness should retry a call to GitHub that was rejected due to rate limits,
+            as configured by the environment variable named by `LimonTestStatics.GITHUB_RETRIES_VAR`.
+        :rtype: int
+        '''
+        return int(_os.environ.get(LimonTestStatics.GITHUB_RETRIES_VAR, "5"))
+
+    def FAKE_GITHUB_LATENCY():
+        '''
+        :returns: how many seconds each call to the "fake" GitHub backend should take, as configured by the
+            environment variable named by `LimonTestStatics.FAKE_GITHUB_LATENCY_VAR`.
+        :rtype: float
+        '''
+        return float(_os.environ.get(LimonTestStatics.FAKE_GITHUB_LATENCY_VAR, "0"))
+
+    def REUSE_REPOS():
+        '''
+        :returns: True if the harness should reset pre-existing repo fixtures in place instead of re-creating them,
+            as configured by the environment variable named by `LimonTestStatics.REUSE_REPOS_VAR`.
+        :rtype: bool
+        '''
+        return _os.environ.get(LimonTestStatics.REUSE_REPOS_VAR, "false").lower() in ["true", "1", "yes"]
+
+    def WORKER_ID():
+        '''
+        :returns: the id of the worker process in which the harness is running, if run by the
+            :class:`Parallel_Scenario_Runner`. Otherwise returns None.
+        :rtype: str
+        '''
+        return _os.environ.get(LimonTestStatics.WORKER_ID_VAR)
+
+    def MIRROR_CACHE():
+        '''
+        :returns: True if tests should clone repos from local mirrors, as configured by the environment variable
+            named by `LimonTestStatics.MIRROR_CACHE_VAR`.
+        :rtype: bool
+        '''
+        return _os.environ.get(LimonTestStatics.MIRROR_CACHE_VAR, "false").lower() in ["true", "1", "yes"]
+
+    def SEED_HARDLINKS():
+        '''
+        :returns: True if seed files materialized by tests may be hardlinks to the harness's store of seed files,
+            as configured by the environment variable named by `LimonTestStatics.SEED_HARDLINKS_VAR`.
+        :rtype: bool
+        '''
+        return _os.environ.get(LimonTestStatics.SEED_HARDLINKS_VAR, "false").lower() in ["true", "1", "yes"]
+
+    def EXCEL_ENGINE():
+        '''
+        :returns: how Excel outputs of tests should be compared to their expected values, as configured by the
+            environment variable named by `LimonTestStatics.EXCEL_ENGINE_VAR`.
+        :rtype: str
+        '''
+        return _os.environ.get(LimonTestStatics.EXCEL_ENGINE_VAR, LimonTestStatics.EXCEL_ENGINE_CONWAY).lower()
+
+    def FORCE():
+        '''
+        :returns: True if tests should run even if their inputs are unchanged since they last passed, as configured
+            by the environment variable named by `LimonTestStatics.FORCE_VAR`.
+        :rtype: bool
+        '''
+        return _os.environ.get(LimonTestStatics.FORCE_VAR, "false").lower() in ["true", "1", "yes"]
@@ -0,0 +1,169 @@
+import hashlib                                                      as _hashlib
+import json                                                         as _json
+import os                                                           as _os
+import shutil                                                       as _shutil
+import stat                                                         as _stat
+import uuid                                                         as _uuid
+
+from limon_test.framework.util.file_cloning                         import File_Cloning
+from limon_test.framework.util.tree_walker                          import Tree_Walker
+
+class Seed_Materializer():
+
+    '''
+    Materializes the seed folders of test scenarios (i.e., copies them to where a test needs them) without
+    duplicating their content on each run.
+
+    It keeps a content-addressed store of "blobs": each distinct file content is stored once, under a name
+    derived from its hash, and is shared by all the seeds (and all the scenarios) that have a file with that
+    content. Materializing a seed then means placing, for each of its files, a link to the corresponding blob:
+
+    * A reflink, if the file system supports them. The file behaves like an independent copy, and the file system
+      copies its data only when it is first written to.
+    * Otherwise, a plain copy, unless the caller opts in to hardlinks with `allow_hardlinks`. A hardlinked file
+      is not a copy: writing to it in place writes to the blob, and so to every file linked to it. Blobs are
+      read-only, which prevents that for most users but not for root (the usual user in CI). So hardlinks are
+      only safe if the code under test never writes to seed files in place, or calls :meth:`detach` on them first.
+
+    Since a blob written through a hardlink no longer has the content its name says, blobs are checked before
+    being re-used: their modification time is set to `Seed_Materializer.BLOB_MTIME_NS` when they are stored, and
+    any write changes it. A blob found changed is rebuilt from the seed file.
+
+    To avoid hashing seed files on every run, their hashes are remembered in an index, together with their size
+    and modification time.
+
+    :param str store_root: the folder under which the blobs and the index are kept
+    :param bool allow_hardlinks: whether files can be hardlinked to blobs when reflinks are not supported
+    '''
+
+    # Modification time (in nanoseconds since the epoch) of every blob, as long as it is not written to
+    BLOB_MTIME_NS                                   = 0
+
+    def __init__(self, store_root, allow_hardlinks=False):
+
+        self.store_root                             = store_root
+        self.allow_hardlinks                        = allow_hardlinks
+
+        self._index_path                            = f"{store_root}/index.json"
+        self._index_dict                            = {}
+        if _os.path.exists(self._index_path):
+            with open(self._index_path, "r") as file:
+                self._index_dict                    = _json.load(file)
+
+    def materialize(self, src_folder, dst_folder):
+        '''
+        Makes the content of `src_folder` appear under `dst_folder`, merging it with whatever `dst_folder` already
+        contains, and replacing files that exist in both.
+
+        :param str src_folder: the seed folder to materialize
+        :param str dst_folder: where to materialize it
+        :returns: the number of files materialized
+        :rtype: int
+        '''
+        walker                                      = Tree_Walker(exclude_patterns = [])
+        prefix_length                               = len(src_folder) + 1
+        count                                       = 0
+        for src_path in walker.walk(src_folder):
+            dst_path                                = f"{dst_folder}/{src_path[prefix_length:]}"
+            blob_path                               = self._store(src_path)
+
+            _os.makedirs(_os.path.dirname(dst_path), exist_ok=True)
+            if _os.path.lexists(dst_path):
+                _os.remove(dst_path)
+            self._link(blob_path, dst_path)
+            count                                   += 1
+
+        self._save_index()
+        return count
+
+    def detach(self, path):
+        '''
+        Makes `path` (a file materialized by this class) independent from the store, so that it can be written to
+        in place. It is a no-op for files that are not hardlinked to a blob.
+
+        :param str path: a materialized file
+        '''
+        if _os.stat(path).st_nlink < 2:
+            return
+        private_path                                = f"{path}.{_uuid.uuid4().hex}.tmp"
+        _shutil.copy2(path, private_path)
+        _os.chmod(private_path, _os.stat(private_path).st_mode | _stat.S_IWUSR)
+        _os.replace(private_path, path)
+
+    def _store(self, src_path):
+        '''
+        :returns: the path of the blob with the content of `src_path`, adding it to the store if needed.
+        :rtype: str
+        '''
+        stat                                        = _os.stat(src_path)
+        executable                                  = bool(stat.st_mode & _stat.S_IXUSR)
+
+        indexed                                     = self._index_dict.get(src_path)
+        if indexed is not None and indexed[0] == stat.st_size and indexed[1] == stat.st_mtime_ns:
+            content_hash                            = indexed[2]
+        else:
+            content_hash                            = self._hash(src_path)
+            self._index_dict[src_path]              = [stat.st_size, stat.st_mtime_ns, content_hash]
+
+        # Blobs are shared by all files with the same content and the same executable bit, since hardlinks
+        # share their permissions
+        #
+        suffix                                      = ".x" if executable else ""
+        blob_path                                   = f"{self.store_root}/blobs/{content_hash[:2]}/{content_hash[2:]}{suffix}"
+
+        if not self._is_intact(blob_path, stat.st_size):
+            # Write to a temporary file first, so that concurrent test processes never see a partial blob. If the
+            # blob was corrupted, replacing it also detaches it from the files hardlinked to it
+            #
+            _os.makedirs(_os.path.dirname(blob_path), exist_ok=True)
+            tmp_path                                = f"{blob_path}.{_uuid.uuid4().hex}.tmp"
+            _shutil.copyfile(src_path, tmp_path)
+            _os.chmod(tmp_path, 0o555 if executable else 0o444)
+            _os.utime(tmp_path, ns=(self.BLOB_MTIME_NS, self.BLOB_MTIME_NS))
+            _os.replace(tmp_path, blob_path)
+
+        return blob_path
+
+    def _is_intact(self, blob_path, size):
+        '''
+        :returns: True if `blob_path` exists and was not written to since it was stored.
+        :rtype: bool
+        '''
+        try:
+            blob_stat                               = _os.stat(blob_path)
+        except FileNotFoundError:
+            return False
+        return blob_stat.st_size == size and blob_stat.st_mtime_ns == self.BLOB_MTIME_NS
+
+    def _link(self, blob_path, dst_path):
+        if File_Cloning.reflink(blob_path, dst_path):
+            # A reflink is an independent file, so it can be writable
+            _os.chmod(dst_path, _os.stat(dst_path).st_mode | _stat.S_IWUSR)
+            return
+
+        if self.allow_hardlinks:
+            try:
+                _os.link(blob_path, dst_path)
+                return
+            except OSError:
+                # E.g., the store and the destination are in different file systems
+                pass
+
+        _shutil.copyfile(blob_path, dst_path)
+        _shutil.copymode(blob_path, dst_path)
+        _os.chmod(dst_path, _os.stat(dst_path).st_mode | _stat.S_IWUSR)
+
+    def _hash(self, path):
+        hasher                                      = _hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _save_index(self):
+        # Replace the index atomically, since several test processes may share the store
+        _os.makedirs(self.store_root, exist_ok=True)
+        tmp_path                                    = f"{self._index_path}.{_uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as file:
+            _json.dump(self._index_dict, file)
+        _os.replace(tmp_path, self._index_path)
@@ -0,0 +1,46 @@
+import fnmatch                                                      as _fnmatch
+import os                                                           as _os
+
+class Tree_Walker():
+
+    '''
+    Utility to list the files under a folder, skipping files and folders whose names match some exclusion patterns.
+
+    It lists exactly what filtering the output of `os.walk` would, with the same paths and in the same order, but
+    excluded folders are pruned before descending into them, so their content is never visited. That matters for
+    folders like ``.git``, whose object store can be much bigger than the rest of the repo.
+
+    Files are produced lazily.
+
+    :param list exclude_patterns: glob-style patterns (as in :mod:`fnmatch`) for the names of files and folders
+        to skip. Patterns are matched against names, not against full paths. If None, `DEFAULT_EXCLUDES` is used.
+    '''
+    DEFAULT_EXCLUDES                                = [".git"]
+
+    def __init__(self, exclude_patterns=None):
+
+        self.exclude_patterns                       = exclude_patterns if exclude_patterns is not None \
+                                                            else Tree_Walker.DEFAULT_EXCLUDES
+
+    def walk(self, root_folder):
+        '''
+        Generator that yields the path of each file under `root_folder` that is not excluded.
+
+        Paths are built like `os.walk` does, i.e., by joining the folder and file names with `os.path.join`, and
+        they come in the order in which `os.walk` visits them: top-down, with the files of each folder before
+        those of its sub-folders.
+
+        :param str root_folder: the root of the folder structure to walk
+        '''
+        for folder, sub_folders_l, file_names_l in _os.walk(root_folder):
+            # Removing sub-folders in place is how `os.walk` is told not to descend into them
+            sub_folders_l[:]                        = [name for name in sub_folders_l if not self._is_excluded(name)]
+            for name in file_names_l:
+                if not self._is_excluded(name):
+                    yield _os.path.join(folder, name)
+
+    def _is_excluded(self, name):
+        for pattern in self.exclude_patterns:
+            if _fnmatch.fnmatchcase(name, pattern):
+                return True
+        return False
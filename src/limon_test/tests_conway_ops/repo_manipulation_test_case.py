@@ -1,15 +1,31 @@
 import abc
-import asyncio
+import contextlib                                                   as _contextlib
+import hashlib                                                      as _hashlib
+import importlib.metadata                                           as _importlib_metadata
+import importlib.util                                               as _importlib_util
+import os                                                           as _os
+import time                                                         as _time
 
 from conway.application.application                                 import Application
 from conway.async_utils.ushering_to                                 import UsheringTo
-from conway.util.json_utils                                         import JSON_Utils
+from conway.observability.logger                                    import Logger
 
 from conway_acceptance.test_logic.acceptance_test_case              import AcceptanceTestCase
+from conway_acceptance.util.test_statics                            import TestStatics
 
 from conway_ops.onboarding.user_profile                             import UserProfile
 from conway_ops.util.git_branches                                   import GitBranches
-from limon_ops.util.github_client                                  import GitHub_Client
+
+import limon_test
+from limon_test.framework.excel.excel_comparison_engine             import Excel_Comparison_Engine
+from limon_test.framework.git.mirror_cache                          import Mirror_Cache
+from limon_test.framework.github.github_backends                    import GitHub_Backends
+from limon_test.framework.github.repo_fixture_registry              import Repo_Fixture_Registry
+from limon_test.framework.github.repo_fixtures                      import Repo_Fixtures
+from limon_test.framework.util.content_manifest                     import Content_Manifest
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+from limon_test.framework.util.seed_materializer                    import Seed_Materializer
+from limon_test.framework.util.tree_walker                          import Tree_Walker
 
 # GOTCHA
 #
@@ -29,13 +45,102 @@ class RepoManipulationTestCase(AcceptanceTestCase, abc.ABC):
     It implements some useful methods that such tests cases usually need.
     '''
 
+    # Names (or glob-style patterns for names) of files and folders that are ignored when comparing folder
+    # structures. Derived classes may override it.
+    #
+    EXCLUDED_FROM_COMPARISON                        = [".git"]
+
+    # Glob-style patterns for the labels (i.e., first-row values) of Excel columns that are not compared, such as
+    # columns with non-deterministic data that the code under test does not mask. Derived classes may override it.
+    #
+    EXCEL_MASKED_COLUMNS                            = []
+
+    # Packages whose code a test's outcome depends on. A previous pass of a test is only re-used if none of them
+    # changed since. Derived classes may override it.
+    #
+    FINGERPRINTED_PACKAGES                          = ["limon_ops", "conway_ops", "limon_test"]
+
     def setUp(self):
         '''
         '''
+        # The application is started lazily, so make sure it exists before the parent's setup needs it
+        limon_test.bootstrap()
+
+        # So that if this test fails, only its own log records are dumped
+        Application.app().test_logger.clear_ring_buffer()
+
         super().setUp()
 
         self.profile_name                           = "TestRobot@CCL"
 
+    def run(self, result=None):
+        '''
+        Overwrites parent to:
+
+        * Dump the recent log records kept in memory by the :class:`Test_Logger`, if this test fails. That way the
+          details are available when needed, without slowing down tests that pass.
+        * Write a timing record with the spans timed during the test. Please refer to :meth:`_save_timings`.
+        * Remember that the test passed, if it did, for the fingerprint of its inputs. Please refer to
+          :meth:`_passed_before`.
+        '''
+        problems_before                             = self._problem_count(result)
+        skipped_before                              = len(result.skipped) if result is not None else 0
+        self._fingerprint                           = None
+
+        # Time the whole test as the root span of its timing record. The application may not exist yet, since
+        # it is created lazily
+        #
+        span_timer                                  = limon_test.bootstrap().span_timer
+        span_timer.reset()
+        with span_timer.span(self._testMethodName):
+            result                                  = super().run(result)
+
+        if self._problem_count(result) > problems_before:
+            Application.app().test_logger.dump_ring_buffer()
+        elif self._fingerprint is not None and len(result.skipped) == skipped_before:
+            manifest_path, digests_l                = self._fingerprint
+            manifest                                = Content_Manifest(manifest_path)
+            manifest.mark_verified(self.id(), *digests_l)
+            manifest.save()
+
+        self._save_timings(span_timer)
+
+        return result
+
+    def _problem_count(self, result):
+        if result is None:
+            return 0
+        return len(result.failures) + len(result.errors)
+
+    def _save_timings(self, span_timer):
+        '''
+        Writes the spans timed by `span_timer` during this test to a JSON timing record, under the folder
+        ``timings/<test id>`` of the harness cache root. There is one record per run, named after the time of the
+        run, so that runs can be compared with the :mod:`timing_report` tool.
+
+        :param Span_Timer span_timer: the timer with which the test's steps were timed
+        '''
+        run_time                                    = _time.strftime("%Y%m%d_%H%M%S")
+        span_timer.save(f"{LimonTestStatics.CACHE_ROOT()}/timings/{self.id()}/{run_time}.json",
+                        run_info = {"test_id": self.id(), "run_time": run_time})
+
+    def _span(self, name, **attributes):
+        '''
+        :returns: a context manager that times the code within it as a span called `name`, nested under the
+            span that is currently open. Please refer to :class:`Span_Timer`.
+        '''
+        return Application.app().span_timer.span(name, **attributes)
+
+    def _log(self, message, **fields):
+        '''
+        Logs `message` through the :class:`Test_Logger`, without waiting for it to be written.
+
+        :param message: the text to log, or a callable without arguments that returns it. The latter is preferable
+            when formatting the text is expensive, since then it is formatted outside the critical path.
+        :param fields: structured data about what is logged, such as `repo`, `phase` or `latency`
+        '''
+        Application.app().test_logger.log_async(message, log_level=Logger.LEVEL_INFO, fields=fields, stack_level=2)
+
     def _create_github_repos(self, ctx):
         '''
         Creates a collection of GitHub repos for the test case identified by `ctx.scenario_id`, 
@@ -64,13 +169,186 @@ class RepoManipulationTestCase(AcceptanceTestCase, abc.ABC):
         '''
         #Application.app().log(f"~~~~    limon      RepoManipulatonTestCase::_create_github_repos   ~~~~ ")
 
-        return asyncio.run(self._supervisor(ctx))
-
-    async def _supervisor(self, ctx):
+        # Run in the event loop shared by all test cases, so that connections to GitHub opened by earlier
+        # test cases are re-used
+        #
+        with self._span("github_fixtures"):
+            return Application.app().harness_runtime.run(self._supervisor(ctx))
 
+    def _profile(self, ctx):
+        '''
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        :returns: the user profile identified by `self.profile_name`, from the seed of the test case. It is only
+            parsed the first time, or if it changed since then, since the application caches it.
+        :rtype: UserProfile
+        '''
         sdlc_root                                   = f"{ctx.manifest.path_to_seed()}/sdlc_root"
         profile_path                                = f"{sdlc_root}/sdlc.profiles/{self.profile_name}/profile.toml" 
-        P                                           = UserProfile(profile_path)  
+        return Application.app().config_cache.get(profile_path, UserProfile)
+
+    def _manifest_profile(self, ctx):
+        '''
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        :returns: the user profile that the manifest of the test case points to, i.e., `ctx.manifest.profile`.
+            It is only built the first time for the scenario's seed and the current environment, or again if any
+            of the seed's profiles changed since then, since the application caches it.
+        :rtype: UserProfile
+        '''
+        profiles_folder                             = f"{ctx.manifest.path_to_seed()}/sdlc_root/sdlc.profiles"
+        config_cache                                = Application.app().config_cache
+        return config_cache.memoize(key                 = ("manifest_profile", profiles_folder,
+                                                           config_cache.environment_key()),
+                                    producer            = lambda: ctx.manifest.profile,
+                                    dependency_paths    = list(Tree_Walker(exclude_patterns = []).walk(profiles_folder)))
+
+    def _redirect_remotes(self, ctx):
+        '''
+        For the rest of this test, makes GIT commands that clone, fetch from or push to the GitHub repos of the
+        user profile use instead the repos of the configured GitHub backend. This only matters for the "fake"
+        backend, whose repos are local bare repos, so that the test runs without network access. Please refer to
+        :meth:`GitHub_Backends.remote_redirect`.
+
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        '''
+        P                                           = self._profile(ctx)
+        redirect                                    = GitHub_Backends.remote_redirect(remote_root    = P.REMOTE_ROOT,
+                                                                                      github_owner   = P.GH_ORGANIZATION)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+
+    def _local_mirrors(self, ctx, project_name):
+        '''
+        Returns a context manager within which the GitHub repos of `project_name` are cloned from local mirrors
+        kept by the harness, rather than from GitHub. This makes setting up local repos a disk-local operation.
+
+        When entering the context manager, the mirrors are created (the first time) or refreshed incrementally
+        from GitHub, so clones get the same refs they would get from GitHub.
+
+        It only does something if the clone cache is turned on through the environment variable named by
+        `LimonTestStatics.MIRROR_CACHE_VAR`. Otherwise clones are from GitHub, as usual.
+
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        :param str project_name: the project whose repos are to be cloned
+        '''
+        if not LimonTestStatics.MIRROR_CACHE() \
+                or LimonTestStatics.GITHUB_BACKEND() == LimonTestStatics.GITHUB_BACKEND_FAKE:
+            # With the "fake" backend, repos are already cloned from local repos. Please refer to
+            # `_redirect_remotes`
+            #
+            return _contextlib.nullcontext()
+
+        P                                           = self._profile(ctx)
+        remote_urls_l                               = [f"{P.REMOTE_ROOT}/{repo_name}.git" for repo_name in P.REPO_LIST(project_name)]
+
+        mirror_cache                                = Mirror_Cache(f"{LimonTestStatics.CACHE_ROOT()}/mirrors")
+        with self._span("refresh_mirrors", project=project_name):
+            mirror_cache.refresh_all(remote_urls_l)
+
+        return mirror_cache.redirect(remote_urls_l)
+
+    def _passed_before(self, ctx):
+        '''
+        Finds out whether this test already passed for the same inputs, in which case the caller may skip it.
+
+        The inputs are fingerprinted by hashing the content of the scenario's seed (which includes the user
+        profile), of its expected outputs, and of the packages in `self.FINGERPRINTED_PACKAGES`, together with
+        their versions. As for other hashing done by the harness, files whose size and modification time are
+        unchanged are not read again. The configuration of the harness that decides what a pass verified is part
+        of the fingerprint too. Please refer to :meth:`_harness_config_fingerprint`.
+
+        The fingerprint is also kept, so that if the test passes, :meth:`run` records that it passed for it.
+
+        Previous passes are never re-used if the environment variable named by `LimonTestStatics.FORCE_VAR`
+        is set.
+
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        :returns: True if this test passed before with the same fingerprint
+        :rtype: bool
+        '''
+        seed_folder                                 = ctx.manifest.path_to_seed()
+        scenarios_repo                              = _os.environ.get(TestStatics.SCENARIOS_REPO, "")
+        manifest_id                                 = _hashlib.sha1(f"{self.id()}:{_os.path.relpath(seed_folder, scenarios_repo)}"
+                                                                    .encode("utf-8")).hexdigest()
+        manifest_path                               = f"{LimonTestStatics.CACHE_ROOT()}/results/{manifest_id}.json"
+        manifest                                    = Content_Manifest(manifest_path)
+
+        with self._span("fingerprint_inputs"):
+            walker                                  = Tree_Walker(exclude_patterns = [".git", "__pycache__"])
+            digests_l                               = [manifest.digest(manifest.hash_tree("seed", seed_folder, walker)),
+                                                       manifest.digest(manifest.hash_tree("expected",
+                                                                                          ctx.manifest.path_to_expected(),
+                                                                                          walker))]
+            for package_name in self.FINGERPRINTED_PACKAGES:
+                digests_l.append(self._package_fingerprint(manifest, package_name, walker))
+            digests_l.append(self._harness_config_fingerprint())
+        manifest.save()
+
+        self._fingerprint                           = (manifest_path, digests_l)
+
+        if LimonTestStatics.FORCE():
+            return False
+        if manifest.is_verified(self.id(), *digests_l):
+            self._log(f"Inputs of scenario {ctx.scenario_id} are unchanged since it last passed",
+                      scenario_id = ctx.scenario_id)
+            return True
+        return False
+
+    def _package_fingerprint(self, manifest, package_name, walker):
+        '''
+        :returns: a string that changes if the version of the package `package_name`, or any file of its code,
+            changes. Source files are hashed too, since the version of packages installed in development mode
+            doesn't change as their code does.
+        :rtype: str
+        '''
+        try:
+            version                                 = _importlib_metadata.version(package_name)
+        except _importlib_metadata.PackageNotFoundError:
+            version                                 = "unknown"
+
+        spec                                        = _importlib_util.find_spec(package_name)
+        locations_l                                 = list(spec.submodule_search_locations or []) if spec is not None else []
+        hashes_dict                                 = {}
+        for idx, location in enumerate(locations_l):
+            for relative_path, content_hash in manifest.hash_tree(f"package:{package_name}:{idx}", location, walker).items():
+                hashes_dict[f"{idx}/{relative_path}"]   = content_hash
+
+        return f"{version}:{manifest.digest(hashes_dict)}"
+
+    def _harness_config_fingerprint(self):
+        '''
+        :returns: a string that changes if the harness is configured in a way that changes what a passing test
+            verified, i.e., if it talks to a different GitHub backend, compares Excel outputs with a different
+            engine, or turns the clone cache on or off. A pass with the "fake" backend, for example, says nothing
+            about a run against GitHub.
+        :rtype: str
+        '''
+        settings_l                                  = [(LimonTestStatics.GITHUB_BACKEND_VAR, LimonTestStatics.GITHUB_BACKEND()),
+                                                       (LimonTestStatics.EXCEL_ENGINE_VAR,   LimonTestStatics.EXCEL_ENGINE()),
+                                                       (LimonTestStatics.MIRROR_CACHE_VAR,   LimonTestStatics.MIRROR_CACHE())]
+        return " ".join([f"{name}={value}" for name, value in settings_l])
+
+    def _materialize_seed(self, src_folder, dst_folder):
+        '''
+        Copies the content of the seed folder `src_folder` into `dst_folder`, merging it with whatever `dst_folder`
+        already has.
+
+        Where the file system supports it, files are not actually copied, but reflinked from a store of seed files
+        shared by all scenarios (see :class:`Seed_Materializer`), so the cost of materializing a seed doesn't grow
+        with the size of its files. Otherwise they are copied, or hardlinked if `LimonTestStatics.SEED_HARDLINKS`
+        allows it.
+
+        :param str src_folder: the seed folder to copy
+        :param str dst_folder: where to copy it
+        '''
+        materializer                                = Seed_Materializer(
+                                                            store_root      = f"{LimonTestStatics.CACHE_ROOT()}/seed_store",
+                                                            allow_hardlinks = LimonTestStatics.SEED_HARDLINKS())
+        count                                       = materializer.materialize(src_folder, dst_folder)
+        self._log("Materialized seed", src_folder=src_folder, files=count)
+
+    async def _supervisor(self, ctx):
+
+        P                                           = self._profile(ctx)
 
         project_name                                = f"scenario_{ctx.scenario_id}"  
 
@@ -83,124 +361,151 @@ class RepoManipulationTestCase(AcceptanceTestCase, abc.ABC):
         # GOTCHA: P.REMOTE_ROOT is not used to create the URL of HTTP requests. It is only used to extract the
         #       owner of the repo.
         #
-        github                                      = GitHub_Client(github_owner = P.GH_ORGANIZATION)
-        result_l                                    =  []
-
-        # GitHub HTTP call is something like
+        # The connection is shared with other test cases for the same GitHub organization, and kept open by the
+        # harness runtime. Depending on how the harness is configured, it might be to a local stand-in for GitHub
+        # rather than to a real GitHub_Client. Please refer to GitHub_Backends for details.
         #
-        #   'GET https://api.github.com/users/testrobot-ccl/repos'
+        # All calls to GitHub go through a scheduler, which caps how many are in flight at once and backs off
+        # when GitHub signals rate limits
         #
-        async with github:
-            
-            pre_existing_repos                      = await github.GET( resource    = "users", 
-                                                                        sub_path    = "/repos")
-            pre_existing_repos_names                = [r["name"] for r in pre_existing_repos]
+        github                                      = await Application.app().harness_runtime.github(
+                                                                        github_owner      = P.GH_ORGANIZATION,
+                                                                        recording_name    = project_name)
+        result_l                                    =  []
 
+        # If fixture re-use is on, repos that already exist and that were created by the harness are reset in
+        # place. Only the others are (re-)created.
+        #
+        registry                                    = Repo_Fixture_Registry(
+                                                            GitHub_Backends.fixture_registry_path(P.GH_ORGANIZATION))
+        fixtures                                    = Repo_Fixtures(github              = github,
+                                                                    registry            = registry,
+                                                                    integration_branch  = GitBranches.INTEGRATION_BRANCH.value,
+                                                                    log                 = self._log)
+        pre_existing_repos_names                    = await fixtures.pre_existing_repos()
+
+        with Application.app().test_logger.context(scenario_id=ctx.scenario_id, phase="github_fixtures"):
             async with UsheringTo(result_l) as usher:
-                for repo_name in P.REPO_LIST(project_name):
-                    usher                           += self._create_one_repo(repo_name, github, pre_existing_repos_names)
+                for coroutine in fixtures.setup_coroutines(repo_names_l              = P.REPO_LIST(project_name),
+                                                           pre_existing_repos_names  = pre_existing_repos_names,
+                                                           reuse_repos               = LimonTestStatics.REUSE_REPOS()):
+                    usher                           += coroutine
 
+        registry.save()
 
-        Application.app().log(f"List of remote repos re-created: {result_l}")
+        self._log(f"List of remote repos re-created: {result_l}", scenario_id=ctx.scenario_id)
         return result_l
 
         
       
-    async def _create_one_repo(self, repo_name, github, pre_existing_repos_names):
+    def assert_database_structure(self, ctx, excels_to_compare):
         '''
+        Overwrites parent to skip the comparison of expected and actual outputs if neither has changed since the
+        last time that this comparison passed.
+
+        To find that out, the content of each file in the expected and actual outputs is hashed, and the hashes
+        are compared with those in a :class:`Content_Manifest` persisted by the harness. Files whose size and
+        modification time are unchanged are not even read. Only if some file differs from the last successful
+        comparison is the parent's (much more expensive) structural and Excel comparison done.
+
+        If so configured through the environment variable named by `LimonTestStatics.EXCEL_ENGINE_VAR`, Excel files
+        are not compared by the parent as per `excels_to_compare`, but by the :class:`Excel_Comparison_Engine`:
+        every Excel file that is both in the expected and in the actual outputs is compared, except for the columns
+        in `self.EXCEL_MASKED_COLUMNS`. Since the engines don't compare the same files, a successful comparison is
+        only re-used under the same configuration of the harness (see :meth:`_harness_config_fingerprint`).
+
+        :param Chassis_TestContext ctx: the context under which a test case is running
+        :param Chassis_ExcelsToCompare excels_to_compare: the Excel files to compare cell by cell
         '''
-        if repo_name in pre_existing_repos_names:
-
-            # Must delete this old repo, so that we can subsequently create it fresh. We do a
-            #
-            #   DELETE https://api.github.com/repos/testrobot-ccl/{repo_name}
-            #
-            removal_data                            = await github.DELETE(
-                                                                    resource = "repos",
-                                                                    sub_path = f"/{repo_name}")
-            nice_removal_data                       = JSON_Utils.nice(removal_data)
-            Application.app().log(f"Removed pre-existing repo '{repo_name}' so we can re-create it - response was {nice_removal_data}")
-
-        # Create the repo. We do 
-        #
-        #       POST https://api.github.com/user/repos
-        #
-        # GOTCHA: the "user" resource is treated differenty by the GitHub_RepoInspector because the
-        #           {owner} is not added to the URL
-        #
-        repo_creation_result                        = await github.POST(
-                                                            resource        = "user",
-                                                            sub_path        = "/repos",
-                                                            body            = 
-                                                                {"name":            repo_name,
-                                                                "description":      "Repo used as a fixture by Conway tests",
-                                                                "auto_init":        True, # So a first commit with empty README is done
-                                                                })
-            
-        repo_url                                    = repo_creation_result["html_url"]
-        Application.app().log(f"Created repo '{repo_name}' with URL {repo_url}")
-
-
-        # We need to create the integration branch, but for that we first need to get the
-        # the sha for the last commit on the master branch. For that we do:
-        #
-        #       GET https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs/heads
-        #
-        heads_data                                  = await github.GET(
-                                                            resource        = "repos",
-                                                            sub_path        = f"/{repo_name}/git/refs/heads",
-                                                            )
-        # heads_data is something like
-        #
-        #    [
-        #        {
-        #            "ref": "refs/heads/master",
-        #            "node_id": "REF_kwDOL6SBFbFyZWZzL2hlYWRzL21hc3Rlcg",
-        #            "url": "https://api.github.com/repos/testrobot-ccl/scenario_8002.svc/git/refs/heads/master",
-        #            "object": {
-        #                "sha": "3f69985b23cf38dca098b3b867e28bf06a8a0aa5",
-        #                "type": "commit",
-        #                "url": "https://api.github.com/repos/testrobot-ccl/scenario_8002.svc/git/commits/3f69985b23cf38dca098b3b867e28bf06a8a0aa5"
-        #            }
-        #        },
-        #           ...
-        #    ]     
-        #
-        # So we extract the master branch, and from it get the SHA of interest
-        #       
-        master                                      = [elt for elt in heads_data if elt["ref"]  == "refs/heads/master"][0]
-        sha                                         = master["object"]["sha"]
+        expected_folder                             = ctx.manifest.path_to_expected()
+        actual_folder                               = ctx.manifest.path_to_actuals()
 
-        # Now create the integration branch on the repo. We will do a 
+        # GOTCHA: the manifest is not kept in or near the expected outputs, since those are under source control
+        #       in the scenarios repo, and a file among them would break the structural comparison.
         #
-        #       POST https://api.github.com/repos/testrobot-ccl/{repo_name}/git/refs
+        #       It is identified by the location of the expected outputs relative to the scenarios repo, so that
+        #       the same manifest is used by workers of the Parallel_Scenario_Runner, each of which has its own copy
+        #       of the scenarios repo.
         #
-        integration                                 = GitBranches.INTEGRATION_BRANCH.value
-        branch_creation_result                      = await github.POST(
-                                                            resource        = "repos",
-                                                            sub_path        = f"/{repo_name}/git/refs",
-                                                            body            = {
-                                                                "ref":      f"refs/heads/{integration}",
-                                                                "sha":      f"{sha}"
-                                                            })
-        
-        branch_url                                  = branch_creation_result["url"]
-        Application.app().log(f"Created '{integration}' branch in '{repo_name}' with URL {branch_url}")
+        scenarios_repo                              = _os.environ.get(TestStatics.SCENARIOS_REPO, "")
+        manifest_id                                 = _hashlib.sha1(_os.path.relpath(expected_folder, scenarios_repo)
+                                                                    .encode("utf-8")).hexdigest()
+        manifest                                    = Content_Manifest(
+                                                            f"{LimonTestStatics.CACHE_ROOT()}/manifests/{manifest_id}.json")
+
+        with self._span("hash_outputs"):
+            walker                                  = Tree_Walker(exclude_patterns = self.EXCLUDED_FROM_COMPARISON)
+            expected_digest                         = manifest.digest(manifest.hash_tree("expected", expected_folder, walker))
+            actual_digest                           = manifest.digest(manifest.hash_tree("actual", actual_folder, walker))
+
+        check_name                                  = f"{type(self).__name__}.{ctx.scenario_id}"
+        harness_config                              = self._harness_config_fingerprint()
+        try:
+            if manifest.is_verified(check_name, expected_digest, actual_digest, harness_config):
+                Application.app().log(f"Outputs for scenario {ctx.scenario_id} are unchanged since they last matched "
+                                      + "expectations, so skipping their comparison")
+            else:
+                with self._span("compare_outputs"):
+                    if LimonTestStatics.EXCEL_ENGINE() != LimonTestStatics.EXCEL_ENGINE_LIMON:
+                        super().assert_database_structure(ctx, excels_to_compare)
+                    else:
+                        self._assert_excels_match(expected_folder, actual_folder)
+                        # The parent then only needs to compare the folder structures. `excels_to_compare` may only
+                        # be created without arguments, so an empty instance of its class is what it takes
+                        #
+                        super().assert_database_structure(ctx, type(excels_to_compare)())
+                manifest.mark_verified(check_name, expected_digest, actual_digest, harness_config)
+        finally:
+            # Save even if the comparison failed, so that next time unchanged files need not be hashed again
+            manifest.save()
+
+    def _assert_excels_match(self, expected_folder, actual_folder):
+        '''
+        Asserts that each Excel file in `expected_folder` that also exists in `actual_folder` has the same content
+        in both, except for the columns in `self.EXCEL_MASKED_COLUMNS`. Otherwise fails with a report of all the
+        differences found.
 
-        # By away of status, return the repo_name so the caller knows which repo was created
-        return repo_name
-       
-       
+        :param str expected_folder: root of the expected outputs
+        :param str actual_folder: root of the actual outputs
+        '''
+        engine                                      = Excel_Comparison_Engine(f"{LimonTestStatics.CACHE_ROOT()}/excel_cache")
+        walker                                      = Tree_Walker(exclude_patterns = self.EXCLUDED_FROM_COMPARISON)
+        prefix_length                               = len(expected_folder) + 1
+
+        report_l                                    = []
+        for expected_path in walker.walk(expected_folder):
+            relative_path                           = expected_path[prefix_length:]
+            actual_path                             = f"{actual_folder}/{relative_path}"
+            if not relative_path.endswith(".xlsx") or not _os.path.exists(actual_path):
+                continue
+
+            with self._span("compare_excel", file=relative_path):
+                differences_l                       = engine.compare(expected_path, actual_path,
+                                                                     masked_columns = self.EXCEL_MASKED_COLUMNS)
+            if len(differences_l) > 0:
+                report_l.append(f"{relative_path}:")
+                report_l.extend([f"    {difference}" for difference in differences_l])
+
+        if len(report_l) > 0:
+            self.fail("Excel outputs differ from expectations:\n" + "\n".join(report_l))
 
     def _get_files(self, root_folder):
         '''
         Overwrites parent to ignore files inside a ".git" folder, since GIT appears to use a non-deterministic
-        way to hash objects
+        way to hash objects. More generally, it ignores any file or folder whose name matches a pattern in
+        `self.EXCLUDED_FROM_COMPARISON`.
+
+        Excluded folders are not even visited, which matters for cloned repos with a long history: otherwise
+        most of the time would go to listing GIT objects only to discard them.
+
+        GOTCHA: the parent is not called, since it would visit excluded folders. Instead, files are listed as
+        the parent does, i.e., as `os.walk` lists them with paths joined by `os.path.join`: :class:`Tree_Walker`
+        produces that same listing, with the same paths in the same order, minus the excluded files.
 
         @param root_folder A string representing the root of a folder structure
         '''
-        all_files_l                                     = super()._get_files(root_folder)
+        walker                                          = Tree_Walker(exclude_patterns = self.EXCLUDED_FROM_COMPARISON)
 
-        files_l                                         = [f for f in all_files_l if not ".git" in f.split("/")]
+        files_l                                         = list(walker.walk(root_folder))
 
-        return files_l
\ No newline at end of file
+        return files_l
@@ -0,0 +1,82 @@
+import io                                                           as _io
+import threading                                                    as _threading
+import time                                                         as _time
+import unittest                                                     as _unittest
+
+from limon_test.framework.observability.async_log_sink              import Async_Log_Sink
+
+class TestAsyncLogSink(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Async_Log_Sink` writes records in order from a background thread, formats them
+    lazily, and keeps the most recent ones in its ring buffer.
+    '''
+
+    def test_records_are_written_in_the_background(self):
+        '''
+        Checks that records are written in order, by a thread other than the caller's, once flushed
+        '''
+        written_l                                   = []
+        sink                                        = Async_Log_Sink(
+                                                            write = lambda text, level: written_l.append(
+                                                                        (text, level, _threading.current_thread())))
+        self.addCleanup(sink.close)
+
+        sink.put((_time.time(), "Created repo", {"repo": "svc", "latency": "0.1s"}, 1))
+        sink.put((_time.time(), lambda: "Reset repo", {}, 2))
+        sink.flush()
+
+        self.assertEqual([(text, level) for text, level, _ in written_l],
+                         [("Created repo [repo=svc latency=0.1s]", 1), ("Reset repo", 2)])
+        self.assertNotIn(_threading.current_thread(), [thread for _, _, thread in written_l])
+
+    def test_flush_all(self):
+        '''
+        Checks that :meth:`Async_Log_Sink.flush_all` waits for the records of every sink
+        '''
+        written_l                                   = []
+        sinks_l                                     = [Async_Log_Sink(write = lambda text, level: written_l.append(text))
+                                                            for idx in range(2)]
+        for idx, sink in enumerate(sinks_l):
+            self.addCleanup(sink.close)
+            sink.put((_time.time(), lambda idx=idx: _time.sleep(0.05) or f"sink {idx}", {}, 1))
+
+        Async_Log_Sink.flush_all()
+        self.assertEqual(sorted(written_l), ["sink 0", "sink 1"])
+
+    def test_faulty_record(self):
+        '''
+        Checks that a record that can't be formatted does not stop later records from being written
+        '''
+        written_l                                   = []
+        sink                                        = Async_Log_Sink(write = lambda text, level: written_l.append(text))
+        self.addCleanup(sink.close)
+
+        sink.put((_time.time(), lambda: 1 / 0, {}, 1))
+        sink.put((_time.time(), "after", {}, 1))
+        sink.close()
+        self.assertEqual(written_l, ["after"])
+
+    def test_ring_buffer(self):
+        '''
+        Checks that the ring buffer keeps only the most recent records, and dumps them with their fields
+        '''
+        sink                                        = Async_Log_Sink(write = lambda text, level: None, ring_buffer_size=2)
+        self.addCleanup(sink.close)
+        for idx in range(3):
+            sink.put((_time.time(), f"record {idx}", {"idx": idx}, 1))
+
+        stream                                      = _io.StringIO()
+        sink.dump_ring_buffer(stream)
+        lines_l                                     = stream.getvalue().splitlines()
+        self.assertEqual(lines_l[0], "-------- Last 2 log records --------")
+        self.assertTrue(lines_l[1].endswith(" record 1 [idx=1]"))
+        self.assertTrue(lines_l[2].endswith(" record 2 [idx=2]"))
+
+        sink.clear_ring_buffer()
+        stream                                      = _io.StringIO()
+        sink.dump_ring_buffer(stream)
+        self.assertEqual(stream.getvalue(), "-------- Last 0 log records --------\n")
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,68 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.application.config_cache                  import Config_Cache
+
+class TestConfigCache(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Config_Cache` loads each file once, and loads it again when the file or the
+    environment changes.
+    '''
+
+    ENV_VAR                                         = "LIMON_TEST_CONFIG_CACHE_CHECK"
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+        self.addCleanup(_os.environ.pop, self.ENV_VAR, None)
+
+        self.path                                   = f"{self.tmp_folder}/profile.toml"
+        self._write("owner = '${LIMON_TEST_CONFIG_CACHE_CHECK}'")
+        self.loads_l                                = []
+
+    def test_file_changes(self):
+        '''
+        Checks that a file is only loaded again after it changes
+        '''
+        cache                                       = Config_Cache()
+        first                                       = cache.get(self.path, self._load)
+        self.assertIs(cache.get(self.path, self._load), first)
+        self.assertEqual(len(self.loads_l), 1)
+
+        self._write("owner = 'someone else'")
+        self.assertEqual(cache.get(self.path, self._load), "owner = 'someone else'")
+        self.assertEqual(len(self.loads_l), 2)
+
+    def test_environment_changes(self):
+        '''
+        Checks that a file is loaded again, with the expanded value, after an environment variable changes
+        '''
+        cache                                       = Config_Cache()
+        _os.environ[self.ENV_VAR]                   = "alice"
+        self.assertEqual(cache.get(self.path, self._load), "owner = 'alice'")
+
+        _os.environ[self.ENV_VAR]                   = "bob"
+        self.assertEqual(cache.get(self.path, self._load), "owner = 'bob'")
+        self.assertEqual(len(self.loads_l), 2)
+
+        _os.environ[self.ENV_VAR]                   = "alice"
+        self.assertEqual(cache.get(self.path, self._load), "owner = 'alice'")
+        self.assertEqual(len(self.loads_l), 2)
+
+    def _load(self, path):
+        self.loads_l.append(path)
+        with open(path, "r") as file:
+            return _os.path.expandvars(file.read())
+
+    def _write(self, content):
+        with open(self.path, "w") as file:
+            file.write(content)
+        # So that the change shows in the modification time even if it happens within the same clock tick
+        stat                                        = _os.stat(self.path)
+        _os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+if __name__ == "__main__":
+    _unittest.main()
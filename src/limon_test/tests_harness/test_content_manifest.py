@@ -0,0 +1,108 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+import zipfile                                                      as _zipfile
+
+from limon_test.framework.util.content_manifest                     import Content_Manifest
+
+class TestContentManifest(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Content_Manifest` detects changes to trees of files, re-hashes only files that may
+    have changed, and remembers successful comparisons across instances.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        self.tree_folder                            = f"{self.tmp_folder}/tree"
+        self.manifest_path                          = f"{self.tmp_folder}/cache/manifest.json"
+        self._write("a.txt", "a")
+        self._write("sub/b.txt", "b")
+
+    def test_hash_tree(self):
+        '''
+        Checks that files are listed relative to the root, and that the digest changes with content and names
+        '''
+        manifest                                    = Content_Manifest(self.manifest_path)
+        hashes_dict                                 = manifest.hash_tree("seed", self.tree_folder)
+        self.assertEqual(sorted(hashes_dict.keys()), ["a.txt", "sub/b.txt"])
+        digest                                      = manifest.digest(hashes_dict)
+
+        self._write("sub/b.txt", "changed")
+        changed_digest                              = manifest.digest(manifest.hash_tree("seed", self.tree_folder))
+        self.assertNotEqual(changed_digest, digest)
+
+        _os.rename(f"{self.tree_folder}/sub/b.txt", f"{self.tree_folder}/sub/c.txt")
+        renamed_digest                              = manifest.digest(manifest.hash_tree("seed", self.tree_folder))
+        self.assertNotEqual(renamed_digest, changed_digest)
+
+    def test_unchanged_files_are_not_read(self):
+        '''
+        Checks that only files whose size or modification time changed are hashed again
+        '''
+        manifest                                    = _Counting_Manifest(self.manifest_path)
+        manifest.hash_tree("seed", self.tree_folder)
+        manifest.save()
+        self.assertEqual(len(manifest.hashed_l), 2)
+
+        self._write("a.txt", "longer content")
+        manifest                                    = _Counting_Manifest(self.manifest_path)
+        manifest.hash_tree("seed", self.tree_folder)
+        self.assertEqual(manifest.hashed_l, [f"{self.tree_folder}/a.txt"])
+
+    def test_excel_document_properties_are_ignored(self):
+        '''
+        Checks that workbooks that only differ in their document properties hash the same
+        '''
+        self._write_workbook("x.xlsx", created="2024-01-01", data="1")
+        self._write_workbook("y.xlsx", created="2025-06-30", data="1")
+        self._write_workbook("z.xlsx", created="2024-01-01", data="2")
+
+        hashes_dict                                 = Content_Manifest(self.manifest_path).hash_tree("seed", self.tree_folder)
+        self.assertEqual(hashes_dict["x.xlsx"], hashes_dict["y.xlsx"])
+        self.assertNotEqual(hashes_dict["x.xlsx"], hashes_dict["z.xlsx"])
+
+    def test_verified_comparisons_persist(self):
+        '''
+        Checks that a successful comparison is remembered for the same digests only, after saving
+        '''
+        manifest                                    = Content_Manifest(self.manifest_path)
+        self.assertFalse(manifest.is_verified("check", "d1", "d2"))
+        manifest.mark_verified("check", "d1", "d2")
+        manifest.save()
+
+        manifest                                    = Content_Manifest(self.manifest_path)
+        self.assertTrue(manifest.is_verified("check", "d1", "d2"))
+        self.assertFalse(manifest.is_verified("check", "d1", "d3"))
+        self.assertFalse(manifest.is_verified("other_check", "d1", "d2"))
+
+    def _write(self, relative_path, content):
+        path                                        = f"{self.tree_folder}/{relative_path}"
+        _os.makedirs(_os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(content)
+
+    def _write_workbook(self, relative_path, created, data):
+        _os.makedirs(self.tree_folder, exist_ok=True)
+        with _zipfile.ZipFile(f"{self.tree_folder}/{relative_path}", "w") as workbook:
+            workbook.writestr("docProps/core.xml", f"<created>{created}</created>")
+            workbook.writestr("xl/worksheets/sheet1.xml", f"<v>{data}</v>")
+
+class _Counting_Manifest(Content_Manifest):
+
+    '''
+    Content manifest that remembers which files it read to hash them
+    '''
+    def __init__(self, manifest_path):
+        super().__init__(manifest_path)
+        self.hashed_l                               = []
+
+    def _content_hash(self, path):
+        self.hashed_l.append(path)
+        return super()._content_hash(path)
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,71 @@
+import importlib.util                                               as _importlib_util
+import os                                                           as _os
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import time                                                         as _time
+import unittest                                                     as _unittest
+
+from limon_test.framework.excel.excel_comparison_engine             import Excel_Comparison_Engine
+
+@_unittest.skipIf(_importlib_util.find_spec("pandas") is None or _importlib_util.find_spec("openpyxl") is None,
+                  "pandas and openpyxl are needed to parse workbooks")
+class TestExcelComparisonEngine(_unittest.TestCase):
+
+    '''
+    Checks the differences reported by the :class:`Excel_Comparison_Engine`, and that it only caches the parsed
+    expected workbooks.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        self.engine                                 = Excel_Comparison_Engine(f"{self.tmp_folder}/excel_cache")
+        self.expected_path                          = self._write_workbook("expected.xlsx", [["repo",     "branch",  "last_commit"],
+                                                                                              ["svc",      "master",  "3f69985b"],
+                                                                                              ["svc",      "feature", "0a1b2c3d"]])
+
+    def test_compare(self):
+        '''
+        Checks that differences are reported by sheet and column, except for masked columns
+        '''
+        actual_path                                 = self._write_workbook("actual.xlsx", [["repo",     "branch",  "last_commit"],
+                                                                                          ["svc",      "master",  "aaaaaaaa"],
+                                                                                          ["svc",      "develop", "bbbbbbbb"]])
+
+        self.assertEqual(self.engine.compare(self.expected_path, actual_path, masked_columns=["last_*"]),
+                         ["sheet 'Sheet1', column 2 ('branch'): 1 cells differ - row 3: expected 'feature', "
+                          + "got 'develop'"])
+        self.assertEqual(len(self.engine.compare(self.expected_path, actual_path)), 2)
+
+    def test_only_expected_workbooks_are_cached(self):
+        '''
+        Checks that actual workbooks, whose bytes change on every run, don't add entries to the cache
+        '''
+        for run in range(3):
+            actual_path                             = self._write_workbook(f"actual_{run}.xlsx",
+                                                                           [["repo", "branch", "last_commit"],
+                                                                            ["svc",  "master", "3f69985b"],
+                                                                            ["svc",  "feature", "0a1b2c3d"]])
+            self.assertEqual(self.engine.compare(self.expected_path, actual_path), [])
+
+        self.assertEqual(len(self._cache_entries()), 1)
+
+    def _cache_entries(self):
+        return [name for _, _, names_l in _os.walk(self.engine.cache_root) for name in names_l]
+
+    def _write_workbook(self, name, rows_l):
+        import xlsxwriter                                               as _xlsxwriter
+
+        path                                        = f"{self.tmp_folder}/{name}"
+        workbook                                    = _xlsxwriter.Workbook(path)
+        # Like real outputs, each workbook has a different creation time in its document properties
+        workbook.set_properties({"comments": f"Written at {_time.time()}"})
+        worksheet                                   = workbook.add_worksheet()
+        for idx, row in enumerate(rows_l):
+            worksheet.write_row(idx, 0, row)
+        workbook.close()
+        return path
+
+if __name__ == "__main__":
+    _unittest.main()
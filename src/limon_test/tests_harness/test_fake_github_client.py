@@ -0,0 +1,161 @@
+import asyncio
+import os                                                           as _os
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.git.git_config_env                        import Git_Config_Env
+from limon_test.framework.github.fake_github_client                 import Fake_GitHub_Client, Fake_GitHub_Error
+
+class TestFakeGitHubClient(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Fake_GitHub_Client` answers the calls that the harness makes to set up repo fixtures
+    like GitHub would, both with made-up SHAs and backed by real bare repos.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+    def test_fixture_calls(self):
+        '''
+        Checks the calls to create a repo and its integration branch, and to move and delete branches.
+        '''
+        async def scenario():
+            async with Fake_GitHub_Client("owner") as github:
+                await self._check_fixture_calls(github)
+
+        asyncio.run(scenario())
+
+    def test_fixture_calls_with_git_repos(self):
+        '''
+        Same as :meth:`test_fixture_calls`, but with repos backed by bare GIT repos
+        '''
+        async def scenario():
+            async with Fake_GitHub_Client("owner", repos_root=f"{self.tmp_folder}/repos") as github:
+                await self._check_fixture_calls(github)
+
+        asyncio.run(scenario())
+
+    def test_git_repos_can_be_cloned_and_pushed(self):
+        '''
+        Checks that the bare repos backing the stand-in can be cloned by their GitHub URL, through an `insteadOf`
+        redirect, and that branches pushed to them are seen by the stand-in.
+        '''
+        repos_root                                  = f"{self.tmp_folder}/repos"
+        store_path                                  = f"{self.tmp_folder}/store.json"
+
+        async def create():
+            async with Fake_GitHub_Client("owner", store_path=store_path, repos_root=repos_root) as github:
+                await github.POST("user", "/repos", body={"name": "svc", "auto_init": True})
+
+        async def heads():
+            async with Fake_GitHub_Client("owner", store_path=store_path, repos_root=repos_root) as github:
+                return [elt["ref"] for elt in await github.GET("repos", "/svc/git/refs/heads")]
+
+        asyncio.run(create())
+
+        clone_path                                  = f"{self.tmp_folder}/clone"
+        with Git_Config_Env.settings([(f"url.{repos_root}/.insteadOf", "https://owner@github.com/owner/")]):
+            self._git(None, "clone", "--quiet", "https://owner@github.com/owner/svc.git", clone_path)
+            self._git(clone_path, "push", "--quiet", "origin", "master:refs/heads/feature")
+
+        self.assertTrue(_os.path.exists(f"{clone_path}/README.md"))
+        self.assertEqual(asyncio.run(heads()), ["refs/heads/feature", "refs/heads/master"])
+
+    def test_git_repos_do_not_block_event_loop(self):
+        '''
+        Checks that other tasks keep running while repos backed by bare GIT repos are created, i.e., that the GIT
+        subprocesses are waited for without blocking the event loop
+        '''
+        async def scenario():
+            ticks_l                                 = []
+            creating                                = True
+
+            async def tick():
+                while creating:
+                    ticks_l.append(None)
+                    await asyncio.sleep(0)
+
+            async with Fake_GitHub_Client("owner", repos_root=f"{self.tmp_folder}/repos") as github:
+                ticker                              = asyncio.create_task(tick())
+                await asyncio.gather(*[github.POST("user", "/repos", body={"name": f"repo{idx}", "auto_init": True})
+                                       for idx in range(3)])
+                creating                            = False
+                await ticker
+                return len(ticks_l), [r["name"] for r in await github.GET("users", "/repos")]
+
+        tick_count, repo_names_l                    = asyncio.run(scenario())
+        self.assertEqual(repo_names_l, ["repo0", "repo1", "repo2"])
+        # Had GIT blocked the event loop, the ticker would only have run between calls
+        self.assertGreater(tick_count, 50)
+
+    def test_pagination(self):
+        '''
+        Checks that listings honor the `per_page` and `page` query parameters
+        '''
+        async def scenario():
+            async with Fake_GitHub_Client("owner") as github:
+                for idx in range(5):
+                    await github.POST("user", "/repos", body={"name": f"repo{idx}"})
+                page_1                              = await github.GET("users", "/repos?per_page=2&page=1")
+                page_3                              = await github.GET("users", "/repos?per_page=2&page=3")
+                return [r["name"] for r in page_1], [r["name"] for r in page_3]
+
+        self.assertEqual(asyncio.run(scenario()), (["repo0", "repo1"], ["repo4"]))
+
+    def test_state_persists(self):
+        '''
+        Checks that repos created in a stand-in with a store are seen by a later stand-in with the same store
+        '''
+        store_path                                  = f"{self.tmp_folder}/store.json"
+
+        async def create():
+            async with Fake_GitHub_Client("owner", store_path=store_path) as github:
+                await github.POST("user", "/repos", body={"name": "svc", "auto_init": True})
+
+        async def list_repos():
+            async with Fake_GitHub_Client("owner", store_path=store_path) as github:
+                return [r["name"] for r in await github.GET("users", "/repos")]
+
+        asyncio.run(create())
+        self.assertEqual(asyncio.run(list_repos()), ["svc"])
+
+    async def _check_fixture_calls(self, github):
+        repo                                        = await github.POST("user", "/repos",
+                                                                        body={"name": "svc", "auto_init": True})
+        self.assertEqual(repo["name"], "svc")
+
+        heads_l                                     = await github.GET("repos", "/svc/git/refs/heads")
+        self.assertEqual([elt["ref"] for elt in heads_l], ["refs/heads/master"])
+        sha                                         = heads_l[0]["object"]["sha"]
+        self.assertEqual(len(sha), 40)
+
+        await github.POST("repos", "/svc/git/refs", body={"ref": "refs/heads/integration", "sha": sha})
+        with self.assertRaises(Fake_GitHub_Error) as context:
+            await github.POST("repos", "/svc/git/refs", body={"ref": "refs/heads/integration", "sha": sha})
+        self.assertEqual(context.exception.status, 422)
+        with self.assertRaises(Fake_GitHub_Error) as context:
+            await github.POST("repos", "/svc/git/refs", body={"ref": "refs/heads/other", "sha": "0" * 40})
+        self.assertEqual(context.exception.status, 422)
+
+        await github.PATCH("repos", "/svc/git/refs/heads/integration", body={"sha": sha, "force": True})
+        await github.DELETE("repos", "/svc/git/refs/heads/integration")
+        heads_l                                     = await github.GET("repos", "/svc/git/refs/heads")
+        self.assertEqual([elt["ref"] for elt in heads_l], ["refs/heads/master"])
+
+        await github.DELETE("repos", "/svc")
+        self.assertEqual(await github.GET("users", "/repos"), [])
+        with self.assertRaises(Fake_GitHub_Error) as context:
+            await github.GET("repos", "/svc/git/refs/heads")
+        self.assertEqual(context.exception.status, 404)
+
+    def _git(self, repo_path, *args):
+        cwd_args_l                                  = ["-C", repo_path] if repo_path is not None else []
+        _subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *cwd_args_l, *args],
+                        check=True, capture_output=True)
+
+if __name__ == "__main__":
+    _unittest.main()
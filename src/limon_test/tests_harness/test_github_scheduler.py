@@ -0,0 +1,185 @@
+import asyncio
+import time                                                         as _time
+import unittest                                                     as _unittest
+
+from limon_test.framework.github.github_scheduler                   import GitHub_Scheduler
+
+class TestGitHubScheduler(_unittest.TestCase):
+
+    '''
+    Checks how the :class:`GitHub_Scheduler` retries calls rejected by GitHub, caps concurrency and paginates,
+    against a stub client that fails the way GitHub does.
+    '''
+
+    def test_retry_after_429(self):
+        '''
+        Checks that a 429 is retried after waiting as long as the ``Retry-After`` header says
+        '''
+        github                                      = _Stub_GitHub([_HTTP_Error(429, headers={"Retry-After": "0.2"})])
+
+        start                                       = _time.monotonic()
+        self.assertEqual(asyncio.run(self._GET(github)), "ok")
+        self.assertGreaterEqual(_time.monotonic() - start, 0.2)
+        self.assertEqual(len(github.calls_l), 2)
+
+    def test_retry_after_rate_limit_reset(self):
+        '''
+        Checks that a 403 with no remaining rate limit is retried once the rate limit window resets
+        '''
+        reset_at                                    = _time.time() + 0.2
+        github                                      = _Stub_GitHub([_HTTP_Error(403, headers={
+                                                                        "X-RateLimit-Remaining":   "0",
+                                                                        "X-RateLimit-Reset":       str(reset_at)})])
+
+        self.assertEqual(asyncio.run(self._GET(github)), "ok")
+        self.assertGreaterEqual(_time.time(), reset_at)
+        self.assertEqual(len(github.calls_l), 2)
+
+    def test_secondary_rate_limit(self):
+        '''
+        Checks that a 403 without rate limit headers but about a secondary rate limit is retried
+        '''
+        github                                      = _Stub_GitHub([_HTTP_Error(403, "You have exceeded a secondary rate limit")])
+
+        self.assertEqual(asyncio.run(self._GET(github)), "ok")
+        self.assertEqual(len(github.calls_l), 2)
+
+    def test_no_retry_for_other_403(self):
+        '''
+        Checks that a 403 that is not about rate limits (e.g., lack of permissions) is raised without retrying
+        '''
+        error                                       = _HTTP_Error(403, "Resource not accessible by integration",
+                                                                  headers={"X-RateLimit-Remaining": "4999"})
+        github                                      = _Stub_GitHub([error])
+
+        with self.assertRaises(_HTTP_Error) as context:
+            asyncio.run(self._GET(github))
+        self.assertIs(context.exception, error)
+        self.assertEqual(len(github.calls_l), 1)
+
+    def test_retry_for_error_with_response(self):
+        '''
+        Checks that errors that carry the HTTP response, rather than its status and headers, are retried too
+        '''
+        error                                       = Exception("429 Too Many Requests")
+        error.response                              = _Response(status_code=429, headers={"Retry-After": "0"})
+        github                                      = _Stub_GitHub([error])
+
+        self.assertEqual(asyncio.run(self._GET(github)), "ok")
+        self.assertEqual(len(github.calls_l), 2)
+
+    def test_no_retry_without_status(self):
+        '''
+        Checks that errors that are not HTTP errors are raised without retrying
+        '''
+        github                                      = _Stub_GitHub([ConnectionResetError("Connection reset by peer")])
+
+        with self.assertRaises(ConnectionResetError):
+            asyncio.run(self._GET(github))
+        self.assertEqual(len(github.calls_l), 1)
+
+    def test_retries_are_capped(self):
+        '''
+        Checks that a call that keeps being rate limited is raised after `max_retries` retries
+        '''
+        github                                      = _Stub_GitHub([_HTTP_Error(429)] * 5)
+
+        with self.assertRaises(_HTTP_Error):
+            asyncio.run(self._GET(github, max_retries=2))
+        self.assertEqual(len(github.calls_l), 3)
+
+    def test_max_concurrency(self):
+        '''
+        Checks that no more than `max_concurrency` calls are in flight at the same time
+        '''
+        github                                      = _Stub_GitHub([], latency=0.01)
+
+        async def scenario():
+            scheduler                               = GitHub_Scheduler(github, max_concurrency=3)
+            return await asyncio.gather(*[scheduler.GET("repos", f"/repo{idx}") for idx in range(10)])
+
+        self.assertEqual(asyncio.run(scenario()), ["ok"] * 10)
+        self.assertEqual(github.max_in_flight, 3)
+
+    def test_pagination(self):
+        '''
+        Checks that :meth:`GitHub_Scheduler.paginate` requests pages until one is not full
+        '''
+        github                                      = _Stub_GitHub([])
+        github.items_l                              = [f"repo{idx}" for idx in range(5)]
+
+        async def scenario():
+            scheduler                               = GitHub_Scheduler(github)
+            return [item async for item in scheduler.paginate("users", "/repos?type=owner", per_page=2)]
+
+        self.assertEqual(asyncio.run(scenario()), github.items_l)
+        self.assertEqual(github.calls_l, ["/repos?type=owner&per_page=2&page=1",
+                                          "/repos?type=owner&per_page=2&page=2",
+                                          "/repos?type=owner&per_page=2&page=3"])
+
+    def test_supports(self):
+        '''
+        Checks that :meth:`GitHub_Scheduler.supports` reflects the verbs of the wrapped client
+        '''
+        scheduler                                   = GitHub_Scheduler(_Stub_GitHub([]))
+        self.assertTrue(scheduler.supports("GET"))
+        self.assertFalse(scheduler.supports("PATCH"))
+
+    async def _GET(self, github, max_retries=5):
+        scheduler                                   = GitHub_Scheduler(github, max_retries=max_retries, base_delay=0.01)
+        return await scheduler.GET("repos", "/svc/git/refs/heads")
+
+class _HTTP_Error(Exception):
+
+    '''
+    Error with the `status` and `headers` attributes of the HTTP errors raised by real HTTP clients
+    '''
+    def __init__(self, status, message="", headers=None):
+        super().__init__(f"{status}: {message}")
+        self.status                                 = status
+        self.headers                                = headers
+
+class _Response():
+
+    '''
+    Response with the `status_code` and `headers` attributes of the responses of the requests library
+    '''
+    def __init__(self, status_code, headers):
+        self.status_code                            = status_code
+        self.headers                                = headers
+
+class _Stub_GitHub():
+
+    '''
+    Stub for a GitHub client, whose GET raises the errors in `errors_l` one per call, and then succeeds.
+
+    If `items_l` is set, GET answers with a page of it as per the ``per_page`` and ``page`` query parameters.
+    Otherwise it answers "ok".
+    '''
+    def __init__(self, errors_l, latency=0.0):
+
+        self.errors_l                               = list(errors_l)
+        self.latency                                = latency
+        self.items_l                                = None
+        self.calls_l                                = []
+        self.in_flight                              = 0
+        self.max_in_flight                          = 0
+
+    async def GET(self, resource, sub_path, **kwargs):
+        self.calls_l.append(sub_path)
+        self.in_flight                              += 1
+        self.max_in_flight                          = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if len(self.errors_l) > 0:
+                raise self.errors_l.pop(0)
+            if self.items_l is None:
+                return "ok"
+            query_dict                              = dict([p.split("=") for p in sub_path.split("?")[1].split("&")])
+            per_page, page                          = int(query_dict["per_page"]), int(query_dict["page"])
+            return self.items_l[(page - 1) * per_page : page * per_page]
+        finally:
+            self.in_flight                          -= 1
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,117 @@
+import importlib.util                                               as _importlib_util
+import os                                                           as _os
+import subprocess                                                   as _subprocess
+import sys                                                          as _sys
+import unittest                                                     as _unittest
+
+import limon_test
+
+class TestImportBudget(_unittest.TestCase):
+
+    '''
+    Guards the startup cost of the :class:`limon_test` package, which is paid every time a test runner discovers
+    tests or a harness tool starts.
+
+    The cost is measured as `python -X importtime` does, in a fresh interpreter, and the test fails if it goes
+    over a budget. The budget is in microseconds and can be overridden through the environment variable
+    `LIMON_TEST_IMPORT_BUDGET_US`, for slow machines.
+
+    The same is checked for the modules of scenario tests, which test runners import to discover tests. Those
+    need the Conway modules to define their test cases, so their budget is larger, and can be overridden through
+    the environment variable `LIMON_TEST_SCENARIO_IMPORT_BUDGET_US`. But importing them must not start the
+    application, nor import the conway_test packages (which need the application), since that is done when tests
+    run rather than when they are discovered.
+    '''
+
+    DEFAULT_BUDGET_US                               = 20000
+
+    DEFAULT_SCENARIO_BUDGET_US                      = 500000
+
+    SCENARIO_MODULES                                = ["limon_test.tests_conway_ops.onboarding.test_repo_setup"]
+
+    def test_import_budget(self):
+        '''
+        Checks that importing :class:`limon_test` stays under budget, and that it does not load any Conway module.
+        '''
+        budget_us                                   = int(_os.environ.get("LIMON_TEST_IMPORT_BUDGET_US",
+                                                                          TestImportBudget.DEFAULT_BUDGET_US))
+
+        import_times_dict                           = self._import_times("limon_test")
+
+        self.assertIn("limon_test", import_times_dict)
+        self.assertLessEqual(import_times_dict["limon_test"], budget_us,
+                             f"Importing limon_test took {import_times_dict['limon_test']} us, over the budget of "
+                             f"{budget_us} us")
+
+        conway_modules_l                            = [m for m in import_times_dict.keys() if m.startswith("conway")]
+        self.assertEqual(conway_modules_l, [], "Importing limon_test should not load Conway modules")
+
+    @_unittest.skipIf(any([_importlib_util.find_spec(p) is None for p in ["conway", "conway_ops", "limon_ops"]]),
+                      "The Conway modules, or limon_ops, are not installed")
+    def test_scenario_import_budget(self):
+        '''
+        Checks that importing the modules of scenario tests stays under budget, and that it neither starts the
+        application nor loads the conway_test packages.
+        '''
+        budget_us                                   = int(_os.environ.get("LIMON_TEST_SCENARIO_IMPORT_BUDGET_US",
+                                                                          TestImportBudget.DEFAULT_SCENARIO_BUDGET_US))
+
+        for module_name in TestImportBudget.SCENARIO_MODULES:
+            with self.subTest(module_name=module_name):
+                import_times_dict                   = self._import_times(module_name,
+                                                                         "from conway.application.application import Application; "
+                                                                         + "assert Application._singleton_app is None, "
+                                                                         + "'the application was started'")
+
+                self.assertLessEqual(import_times_dict[module_name], budget_us,
+                                     f"Importing {module_name} took {import_times_dict[module_name]} us, over the "
+                                     f"budget of {budget_us} us")
+
+                conway_test_modules_l               = [m for m in import_times_dict.keys() if m.startswith("conway_test")]
+                self.assertEqual(conway_test_modules_l, [],
+                                 f"Importing {module_name} should not load the conway_test packages")
+
+    def _import_times(self, module_name, check_code=None):
+        '''
+        Imports `module_name` in a fresh interpreter with `-X importtime`, and then runs `check_code` (if given)
+        in it, which fails the import check if it raises.
+
+        :returns: a dictionary whose keys are the modules that got imported, and whose values are the cumulative
+            time (in microseconds) that it took to import each of them.
+        :rtype: dict
+        '''
+        # The folder containing the limon_test package must be importable by the fresh interpreter, even if the
+        # package is not installed
+        #
+        src_folder                                  = _os.path.dirname(_os.path.dirname(limon_test.__file__))
+        env                                         = dict(_os.environ)
+        env["PYTHONPATH"]                           = _os.pathsep.join([src_folder, env.get("PYTHONPATH", "")])
+
+        code                                        = f"import {module_name}" if check_code is None \
+                                                            else f"import {module_name}; {check_code}"
+        completed                                   = _subprocess.run([_sys.executable, "-X", "importtime", "-c", code],
+                                                                      env               = env,
+                                                                      capture_output    = True,
+                                                                      text              = True)
+        errors_l                                    = [line for line in completed.stderr.splitlines()
+                                                            if not line.startswith("import time:")]
+        self.assertEqual(completed.returncode, 0, "\n".join(errors_l[-5:]))
+
+        # Lines in stderr look like
+        #
+        #       import time: self [us] | cumulative | imported package
+        #       import time:       312 |        312 |   limon_test
+        #
+        import_times_dict                           = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            columns_l                               = line[len("import time:"):].split("|")
+            if len(columns_l) != 3 or not columns_l[1].strip().isdigit():
+                continue
+            import_times_dict[columns_l[2].strip()] = int(columns_l[1].strip())
+
+        return import_times_dict
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,95 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.git.mirror_cache                          import Mirror_Cache
+
+class TestMirrorCache(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Mirror_Cache` keeps mirrors of remote repos up to date, and that clones made
+    through its redirect come from the mirrors yet look like clones of the remotes.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        # A bare repo stands in for the remote, and a working copy of it is used to change it
+        self.remote_path                            = f"{self.tmp_folder}/remote/svc.git"
+        self.remote_url                             = f"file://{self.remote_path}"
+        self.author_path                            = f"{self.tmp_folder}/author"
+        self._git(None, "init", "--bare", "--quiet", "--initial-branch=master", self.remote_path)
+        self._git(None, "clone", "--quiet", self.remote_url, self.author_path)
+        self._commit("README.md", "# svc\n")
+        self._git(self.author_path, "push", "--quiet", "origin", "master", "master:feature")
+
+        self.cache                                  = Mirror_Cache(f"{self.tmp_folder}/mirrors")
+
+    def test_mirror_path(self):
+        '''
+        Checks that the mirror of a remote does not depend on its scheme, credentials or ".git" suffix
+        '''
+        mirror                                      = self.cache.mirror_path("https://owner@github.com/owner/svc.git")
+        self.assertEqual(mirror, f"{self.tmp_folder}/mirrors/github.com/owner/svc.git")
+        self.assertEqual(self.cache.mirror_path("ssh://github.com/owner/svc"), mirror)
+
+    def test_clone_through_redirect(self):
+        '''
+        Checks that a clone made through the redirect comes from the mirror, has the remote as its origin, and
+        pushes to the remote
+        '''
+        self.cache.refresh(self.remote_url)
+        git_config_count                            = _os.environ.get("GIT_CONFIG_COUNT")
+
+        # Once mirrored, the remote is no longer needed to clone, so move it away to prove it
+        _os.rename(self.remote_path, f"{self.remote_path}.away")
+        clone_path                                  = f"{self.tmp_folder}/clone"
+        with self.cache.redirect([self.remote_url]):
+            self._git(None, "clone", "--quiet", self.remote_url, clone_path)
+        _os.rename(f"{self.remote_path}.away", self.remote_path)
+
+        self.assertTrue(_os.path.exists(f"{clone_path}/README.md"))
+        self.assertEqual(self._git(clone_path, "remote", "get-url", "origin").strip(), self.remote_url)
+        self.assertIn("origin/feature", self._git(clone_path, "branch", "-r"))
+
+        with self.cache.redirect([self.remote_url]):
+            self._git(clone_path, "push", "--quiet", "origin", "master:pushed")
+        self.assertIn("refs/heads/pushed", self._git(self.remote_path, "for-each-ref"))
+        self.assertNotIn("refs/heads/pushed", self._git(self.cache.mirror_path(self.remote_url), "for-each-ref"))
+
+        # Outside of the redirect, GIT configuration is as before
+        self.assertEqual(_os.environ.get("GIT_CONFIG_COUNT"), git_config_count)
+
+    def test_refresh(self):
+        '''
+        Checks that refreshing a mirror fetches new commits and prunes deleted branches
+        '''
+        mirror                                      = self.cache.refresh_all([self.remote_url])[0]
+
+        sha                                         = self._commit("CHANGES.md", "Changed\n")
+        self._git(self.author_path, "push", "--quiet", "origin", "master", ":feature")
+
+        self.assertEqual(self.cache.refresh(self.remote_url), mirror)
+        refs_output                                 = self._git(mirror, "for-each-ref", "--format=%(refname) %(objectname)")
+        self.assertEqual(refs_output.splitlines(), [f"refs/heads/master {sha}"])
+
+    def _commit(self, path, content):
+        with open(f"{self.author_path}/{path}", "w") as file:
+            file.write(content)
+        self._git(self.author_path, "add", path)
+        self._git(self.author_path, "commit", "--quiet", "-m", f"Add {path}")
+        return self._git(self.author_path, "rev-parse", "HEAD").strip()
+
+    def _git(self, repo_path, *args):
+        cwd_args_l                                  = ["-C", repo_path] if repo_path is not None else []
+        completed                                   = _subprocess.run(["git", "-c", "user.name=test",
+                                                                       "-c", "user.email=test@example.com",
+                                                                       *cwd_args_l, *args],
+                                                                      check=True, capture_output=True, text=True)
+        return completed.stdout
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,88 @@
+import os                                                           as _os
+import queue                                                        as _queue
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.observability.span_timer                  import Span_Timer
+from limon_test.framework.runner.parallel_scenario_runner           import _initialize_worker, _run_one_test
+from limon_test.framework.util.limon_test_statics                   import LimonTestStatics
+
+class TestParallelScenarioRunner(_unittest.TestCase):
+
+    '''
+    Checks how the :class:`Parallel_Scenario_Runner` prepares the copy of the scenarios repo for each worker,
+    and how it reports the result of each test.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        for var in ["LIMON_TEST_SCENARIOS_REPO", LimonTestStatics.WORKER_ID_VAR, LimonTestStatics.CACHE_ROOT_VAR,
+                    _Timed_Test.ENABLED_VAR]:
+            self.addCleanup(self._restore_environ, var, _os.environ.get(var))
+
+    def test_worker_copy_keeps_seed_repos(self):
+        '''
+        Checks that the ".git" folder of the scenarios repo is not copied, but that those of repos within seeds are
+        '''
+        scenarios_repo                              = f"{self.tmp_folder}/scenarios"
+        for relative_path in [".git/HEAD", "8001/seed/svc/.git/HEAD", "8001/seed/svc/README.md"]:
+            path                                    = f"{scenarios_repo}/{relative_path}"
+            _os.makedirs(_os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                file.write(relative_path)
+
+        slot_queue                                  = _queue.Queue()
+        slot_queue.put(3)
+        _initialize_worker(slot_queue, scenarios_repo, f"{self.tmp_folder}/work", "LIMON_TEST_SCENARIOS_REPO")
+
+        worker_scenarios_repo                       = f"{self.tmp_folder}/work/worker_3/scenarios"
+        self.assertEqual(_os.environ["LIMON_TEST_SCENARIOS_REPO"], worker_scenarios_repo)
+        self.assertFalse(_os.path.exists(f"{worker_scenarios_repo}/.git"))
+        self.assertTrue(_os.path.exists(f"{worker_scenarios_repo}/8001/seed/svc/.git/HEAD"))
+        self.assertTrue(_os.path.exists(f"{worker_scenarios_repo}/8001/seed/svc/README.md"))
+
+    def test_result_includes_timing_records(self):
+        '''
+        Checks that the result of a test includes the timing records it wrote, but not those of earlier runs
+        '''
+        _os.environ[LimonTestStatics.CACHE_ROOT_VAR] = f"{self.tmp_folder}/cache"
+        _os.environ[_Timed_Test.ENABLED_VAR]        = "true"
+        test_id                                     = f"{__name__}._Timed_Test"
+        earlier_path                                = f"{self.tmp_folder}/cache/timings/{test_id}.test_timed/earlier.json"
+        Span_Timer().save(earlier_path)
+
+        result                                      = _run_one_test(test_id)
+
+        self.assertEqual(result["status"], "passed")
+        self.assertEqual([record["path"] for record in result["timing_records"]],
+                         [f"{self.tmp_folder}/cache/timings/{test_id}.test_timed/run.json"])
+        self.assertEqual(result["timing_records"][0]["totals"]["test_timed"]["count"], 1)
+
+    def _restore_environ(self, var, value):
+        if value is None:
+            _os.environ.pop(var, None)
+        else:
+            _os.environ[var]                        = value
+
+class _Timed_Test(_unittest.TestCase):
+
+    '''
+    Test run by :meth:`TestParallelScenarioRunner.test_result_includes_timing_records`, which writes a timing
+    record like :meth:`RepoManipulationTestCase._save_timings` does. It is skipped when run on its own.
+    '''
+
+    ENABLED_VAR                                     = "LIMON_TEST_TIMED_TEST_ENABLED"
+
+    def test_timed(self):
+        if _os.environ.get(self.ENABLED_VAR) != "true":
+            self.skipTest("Only run by TestParallelScenarioRunner")
+        span_timer                                  = Span_Timer()
+        with span_timer.span(self._testMethodName):
+            pass
+        span_timer.save(f"{LimonTestStatics.CACHE_ROOT()}/timings/{self.id()}/run.json")
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.github.fake_github_client                 import Fake_GitHub_Client
+from limon_test.framework.github.recording_github_client            import Recording_GitHub_Client, ReplayMissError
+
+class TestRecordingGitHubClient(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Recording_GitHub_Client` replays the responses it recorded, using a
+    :class:`Fake_GitHub_Client` in place of GitHub when recording.
+    '''
+
+    def setUp(self):
+        tmp_folder                                  = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, tmp_folder, ignore_errors=True)
+        self.cassette_path                          = f"{tmp_folder}/recordings/scenario.json"
+
+    def test_record_and_replay(self):
+        '''
+        Checks that replayed responses are those recorded, served in the order recorded for repeated requests
+        '''
+        async def calls(github):
+            before                                  = await github.GET("users", "/repos")
+            await github.POST("user", "/repos", body={"name": "svc", "auto_init": True})
+            heads_l                                 = await github.GET("repos", "/svc/git/refs/heads")
+            after                                   = await github.GET("users", "/repos")
+            return before, heads_l, after
+
+        async def record():
+            async with Recording_GitHub_Client("owner", self.cassette_path, replay=False,
+                                               github=Fake_GitHub_Client("owner")) as github:
+                return await calls(github)
+
+        async def replay():
+            async with Recording_GitHub_Client("owner", self.cassette_path, replay=True) as github:
+                return await calls(github)
+
+        recorded                                    = asyncio.run(record())
+        self.assertEqual(recorded[0], [])
+        self.assertEqual([r["name"] for r in recorded[2]], ["svc"])
+
+        self.assertEqual(asyncio.run(replay()), recorded)
+
+    def test_replay_miss(self):
+        '''
+        Checks that replaying a request that was not recorded fails, rather than reaching GitHub
+        '''
+        async def record():
+            async with Recording_GitHub_Client("owner", self.cassette_path, replay=False,
+                                               github=Fake_GitHub_Client("owner")) as github:
+                await github.GET("users", "/repos")
+
+        async def replay():
+            async with Recording_GitHub_Client("owner", self.cassette_path, replay=True) as github:
+                await github.GET("users", "/repos")
+                await github.GET("users", "/repos")
+
+        asyncio.run(record())
+        with self.assertRaises(ReplayMissError):
+            asyncio.run(replay())
+
+    def test_replay_without_recording(self):
+        '''
+        Checks that replaying fails clearly if nothing was recorded
+        '''
+        async def replay():
+            async with Recording_GitHub_Client("owner", self.cassette_path, replay=True) as github:
+                pass
+
+        with self.assertRaises(ReplayMissError):
+            asyncio.run(replay())
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,47 @@
+import json                                                         as _json
+import os                                                           as _os
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.github.repo_fixture_registry              import Repo_Fixture_Registry
+
+class TestRepoFixtureRegistry(_unittest.TestCase):
+
+    '''
+    Checks that concurrent users of the same :class:`Repo_Fixture_Registry` file don't lose each other's updates.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        self.registry_path                          = f"{self.tmp_folder}/github/owner/fixtures_live.json"
+
+    def test_concurrent_saves_are_merged(self):
+        '''
+        Checks that each save applies its own changes on top of what other instances saved in the meantime
+        '''
+        registry                                    = Repo_Fixture_Registry(self.registry_path)
+        registry.register("scenario_1.svc", "sha1")
+        registry.register("scenario_2.svc", "sha2")
+        registry.save()
+
+        # Two workers load the registry at the same time...
+        worker_1                                    = Repo_Fixture_Registry(self.registry_path)
+        worker_2                                    = Repo_Fixture_Registry(self.registry_path)
+
+        # ...and each changes its own repos
+        worker_1.forget("scenario_1.svc")
+        worker_1.register("scenario_3.svc", "sha3")
+        worker_2.register("scenario_2.svc", "sha2b")
+        worker_1.save()
+        worker_2.save()
+
+        with open(self.registry_path, "r") as file:
+            self.assertEqual(_json.load(file), {"scenario_2.svc": "sha2b", "scenario_3.svc": "sha3"})
+        self.assertEqual(worker_2.initial_sha("scenario_3.svc"), "sha3")
+        self.assertEqual(_os.listdir(_os.path.dirname(self.registry_path)), ["fixtures_live.json"])
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import shutil                                                       as _shutil
+import subprocess                                                   as _subprocess
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.github.fake_github_client                 import Fake_GitHub_Client, Fake_GitHub_Error
+from limon_test.framework.github.github_scheduler                   import GitHub_Scheduler
+from limon_test.framework.github.repo_fixture_registry              import Repo_Fixture_Registry
+from limon_test.framework.github.repo_fixtures                      import Repo_Fixtures
+
+class TestRepoFixtures(_unittest.TestCase):
+
+    '''
+    Checks that :class:`Repo_Fixtures` creates repo fixtures, and resets them in place when asked to re-use them,
+    against a :class:`Fake_GitHub_Client` backed by bare GIT repos.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        self.repos_root                             = f"{self.tmp_folder}/repos"
+        self.store_path                             = f"{self.tmp_folder}/store.json"
+        self.registry_path                          = f"{self.tmp_folder}/fixtures.json"
+
+    def test_reset_in_place(self):
+        '''
+        Checks that a repo that moved on since it was created is reset in place, i.e., without re-creating it.
+        '''
+        self._setup(reuse_repos=False)
+        initial_sha                                 = Repo_Fixture_Registry(self.registry_path).initial_sha("svc")
+        repo_id                                     = self._repo_ids()["svc"]
+
+        moved_sha                                   = self._commit("svc", parent_sha=initial_sha)
+        self._bare_git("svc", "update-ref", "refs/heads/integration", moved_sha)
+        self._bare_git("svc", "update-ref", "refs/heads/feature", moved_sha)
+
+        self.assertEqual(self._setup(reuse_repos=True), ["svc"])
+        self.assertEqual(self._repo_ids()["svc"], repo_id)
+        self.assertEqual(self._heads("svc"), {"refs/heads/integration": initial_sha,
+                                              "refs/heads/master":      initial_sha})
+
+    def test_recreate_if_initial_commit_is_gone(self):
+        '''
+        Checks that a repo whose recorded initial commit is not in it (so GitHub answers with a 422) is re-created
+        '''
+        self._setup(reuse_repos=False)
+        repo_id                                     = self._repo_ids()["svc"]
+        registry                                    = Repo_Fixture_Registry(self.registry_path)
+        registry.register("svc", "0" * 40)
+        registry.save()
+
+        self._bare_git("svc", "update-ref", "refs/heads/integration",
+                       self._commit("svc", parent_sha=self._heads("svc")["refs/heads/master"]))
+
+        self.assertEqual(self._setup(reuse_repos=True), ["svc"])
+        self.assertNotEqual(self._repo_ids()["svc"], repo_id)
+        new_initial_sha                             = Repo_Fixture_Registry(self.registry_path).initial_sha("svc")
+        self.assertEqual(self._heads("svc"), {"refs/heads/integration": new_initial_sha,
+                                              "refs/heads/master":      new_initial_sha})
+
+    def test_other_errors_are_raised(self):
+        '''
+        Checks that errors other than those meaning that the repo can't be reset are not hidden by re-creating it
+        '''
+        self._setup(reuse_repos=False)
+        self._bare_git("svc", "update-ref", "refs/heads/integration",
+                       self._commit("svc", parent_sha=self._heads("svc")["refs/heads/master"]))
+
+        with self.assertRaises(Fake_GitHub_Error) as context:
+            self._setup(reuse_repos=True, wrapper=_Failing_PATCH)
+        self.assertEqual(context.exception.status, 500)
+
+    def test_recreate_without_PATCH(self):
+        '''
+        Checks that repos are re-created, rather than reset, if the GitHub client doesn't support PATCH
+        '''
+        self._setup(reuse_repos=False)
+        repo_id                                     = self._repo_ids()["svc"]
+
+        self.assertEqual(self._setup(reuse_repos=True, wrapper=_Without_PATCH), ["svc"])
+        self.assertNotEqual(self._repo_ids()["svc"], repo_id)
+
+    def _setup(self, reuse_repos, wrapper=None):
+        '''
+        Sets up the "svc" repo fixture the way the harness does, optionally wrapping the stand-in for GitHub in
+        `wrapper` first.
+
+        :returns: the names of the repos set up
+        :rtype: list
+        '''
+        async def scenario():
+            async with Fake_GitHub_Client("owner", store_path=self.store_path, repos_root=self.repos_root) as fake:
+                github                              = GitHub_Scheduler(fake if wrapper is None else wrapper(fake))
+                registry                            = Repo_Fixture_Registry(self.registry_path)
+                fixtures                            = Repo_Fixtures(github, registry, "integration")
+                pre_existing_repos_names            = await fixtures.pre_existing_repos()
+                result_l                            = await asyncio.gather(*fixtures.setup_coroutines(
+                                                                            repo_names_l              = ["svc"],
+                                                                            pre_existing_repos_names  = pre_existing_repos_names,
+                                                                            reuse_repos               = reuse_repos))
+                registry.save()
+                return result_l
+
+        return asyncio.run(scenario())
+
+    def _repo_ids(self):
+        async def scenario():
+            async with Fake_GitHub_Client("owner", store_path=self.store_path, repos_root=self.repos_root) as github:
+                return {r["name"]: r["id"] for r in await github.GET("users", "/repos")}
+
+        return asyncio.run(scenario())
+
+    def _heads(self, repo_name):
+        output                                      = self._bare_git(repo_name, "for-each-ref",
+                                                                     "--format=%(refname) %(objectname)", "refs/heads")
+        return dict([line.split(" ") for line in output.splitlines()])
+
+    def _commit(self, repo_name, parent_sha):
+        return self._bare_git(repo_name, "commit-tree", f"{parent_sha}^{{tree}}", "-p", parent_sha,
+                              "-m", "Moved on").strip()
+
+    def _bare_git(self, repo_name, *args):
+        completed                                   = _subprocess.run(["git", "-c", "user.name=test",
+                                                                       "-c", "user.email=test@example.com",
+                                                                       "--git-dir", f"{self.repos_root}/{repo_name}.git",
+                                                                       *args],
+                                                                      check=True, capture_output=True, text=True)
+        return completed.stdout
+
+class _Without_PATCH():
+
+    '''
+    Wraps a stand-in for GitHub so that it looks like a client without PATCH
+    '''
+    def __init__(self, github):
+        self.github                                 = github
+
+    async def GET(self, resource, sub_path, **kwargs):
+        return await self.github.GET(resource, sub_path, **kwargs)
+
+    async def POST(self, resource, sub_path, body=None, **kwargs):
+        return await self.github.POST(resource, sub_path, body=body, **kwargs)
+
+    async def DELETE(self, resource, sub_path, **kwargs):
+        return await self.github.DELETE(resource, sub_path, **kwargs)
+
+class _Failing_PATCH(_Without_PATCH):
+
+    '''
+    Wraps a stand-in for GitHub so that PATCH fails with an error unrelated to the repo's state
+    '''
+    async def PATCH(self, resource, sub_path, body=None, **kwargs):
+        raise Fake_GitHub_Error(500, "Server error")
+
+if __name__ == "__main__":
+    _unittest.main()
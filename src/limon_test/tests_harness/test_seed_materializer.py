@@ -0,0 +1,104 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+import stat                                                         as _stat
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.util.seed_materializer                    import Seed_Materializer
+
+class TestSeedMaterializer(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Seed_Materializer` materializes seeds, and that writing to a materialized file never
+    changes what later materializations get.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        self.seed_folder                            = f"{self.tmp_folder}/seed"
+        self.store_root                             = f"{self.tmp_folder}/store"
+        self._write(f"{self.seed_folder}/g.txt", "original\n")
+        self._write(f"{self.seed_folder}/same_as_g.txt", "original\n")
+        self._write(f"{self.seed_folder}/bin/run.sh", "#!/bin/sh\n")
+        _os.chmod(f"{self.seed_folder}/bin/run.sh", 0o755)
+
+    def test_materialize(self):
+        '''
+        Checks the content and permissions of materialized files, and that files with the same content share a blob
+        '''
+        dst_folder                                  = f"{self.tmp_folder}/dst"
+        self._write(f"{dst_folder}/g.txt", "to be replaced\n")
+        self._write(f"{dst_folder}/kept.txt", "kept\n")
+
+        self.assertEqual(Seed_Materializer(self.store_root).materialize(self.seed_folder, dst_folder), 3)
+
+        self.assertEqual(self._read(f"{dst_folder}/g.txt"), "original\n")
+        self.assertEqual(self._read(f"{dst_folder}/kept.txt"), "kept\n")
+        self.assertTrue(_os.stat(f"{dst_folder}/bin/run.sh").st_mode & _stat.S_IXUSR)
+        self.assertTrue(_os.stat(f"{dst_folder}/g.txt").st_mode & _stat.S_IWUSR)
+        self.assertEqual(len(self._blobs()), 2)
+
+    def test_writes_to_copies_do_not_reach_the_store(self):
+        '''
+        Checks that, by default, materialized files are independent of the store
+        '''
+        self._materialize_and_write("dst_1", Seed_Materializer(self.store_root))
+
+        self._materialize_and_check("dst_2", Seed_Materializer(self.store_root))
+
+    def test_writes_through_hardlinks_are_repaired(self):
+        '''
+        Checks that if a hardlinked file is written to in place, which corrupts its blob, the blob is rebuilt
+        before it is used again
+        '''
+        self._materialize_and_write("dst_1", Seed_Materializer(self.store_root, allow_hardlinks=True))
+
+        self._materialize_and_check("dst_2", Seed_Materializer(self.store_root, allow_hardlinks=True))
+
+    def test_detach(self):
+        '''
+        Checks that a detached file can be written to without changing the store
+        '''
+        materializer                                = Seed_Materializer(self.store_root, allow_hardlinks=True)
+        materializer.materialize(self.seed_folder, f"{self.tmp_folder}/dst_1")
+
+        path                                        = f"{self.tmp_folder}/dst_1/g.txt"
+        materializer.detach(path)
+        self.assertEqual(_os.stat(path).st_nlink, 1)
+        with open(path, "a") as file:
+            file.write("appended\n")
+
+        self.assertEqual(sorted([self._read(path) for path in self._blobs()]), ["#!/bin/sh\n", "original\n"])
+
+    def _materialize_and_write(self, dst_name, materializer):
+        materializer.materialize(self.seed_folder, f"{self.tmp_folder}/{dst_name}")
+
+        # Like code under test running as root would, ignoring that the file might be read-only
+        path                                        = f"{self.tmp_folder}/{dst_name}/g.txt"
+        _os.chmod(path, _os.stat(path).st_mode | _stat.S_IWUSR)
+        with open(path, "a") as file:
+            file.write("appended\n")
+
+    def _materialize_and_check(self, dst_name, materializer):
+        materializer.materialize(self.seed_folder, f"{self.tmp_folder}/{dst_name}")
+
+        self.assertEqual(self._read(f"{self.tmp_folder}/{dst_name}/g.txt"), "original\n")
+        self.assertEqual(self._read(f"{self.tmp_folder}/{dst_name}/same_as_g.txt"), "original\n")
+
+    def _blobs(self):
+        return [_os.path.join(folder, name) for folder, _, names_l in _os.walk(f"{self.store_root}/blobs")
+                                            for name in names_l]
+
+    def _write(self, path, content):
+        _os.makedirs(_os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write(content)
+
+    def _read(self, path):
+        with open(path, "r") as file:
+            return file.read()
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib                                                   as _contextlib
+import io                                                           as _io
+import json                                                         as _json
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import threading                                                    as _threading
+import unittest                                                     as _unittest
+
+from limon_test.framework.observability.span_timer                  import Span_Timer
+from limon_test.framework.observability.timing_report               import Timing_Report, main
+
+class TestSpanTimer(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Span_Timer` nests spans per thread and asyncio task, and that the
+    :class:`Timing_Report` compares its records across runs.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+    def test_nested_spans(self):
+        '''
+        Checks the paths, attributes and durations of nested spans
+        '''
+        timer                                       = Span_Timer()
+        with timer.span("test"):
+            with timer.span("setup", repo="svc", count=2):
+                pass
+            with timer.span("report"):
+                pass
+
+        records_l                                   = timer.records()
+        self.assertEqual([r["path"] for r in records_l], ["test/setup", "test/report", "test"])
+        self.assertEqual(records_l[0]["attributes"], {"repo": "svc", "count": "2"})
+        self.assertGreaterEqual(records_l[2]["duration"], records_l[0]["duration"] + records_l[1]["duration"])
+
+    def test_concurrent_tasks_and_threads(self):
+        '''
+        Checks that spans of concurrent asyncio tasks and threads are nested under the span that was open when
+        they started, and not under each other's
+        '''
+        timer                                       = Span_Timer()
+
+        async def one_repo(repo_name):
+            with timer.span("github.POST", repo=repo_name):
+                await asyncio.sleep(0.01)
+
+        async def fixtures():
+            with timer.span("github_fixtures"):
+                await asyncio.gather(*[one_repo(f"repo{idx}") for idx in range(3)])
+
+        asyncio.run(fixtures())
+
+        def in_thread():
+            with timer.span("clone"):
+                pass
+
+        thread                                      = _threading.Thread(target=in_thread)
+        with timer.span("local_repos"):
+            thread.start()
+            thread.join()
+
+        self.assertEqual(sorted([r["path"] for r in timer.records()]),
+                         ["clone"] + ["github_fixtures"] + ["github_fixtures/github.POST"] * 3 + ["local_repos"])
+
+    def test_compare(self):
+        '''
+        Checks that a span path regresses only if it is both slower by the ratio and by the minimum time
+        '''
+        baseline_path                               = self._save_record("baseline.json", {"test":         [2.0],
+                                                                                          "test/clone":   [0.5, 0.5],
+                                                                                          "test/report":  [0.01],
+                                                                                          "test/removed": [0.1]})
+        current_path                                = self._save_record("current.json",  {"test":         [2.1],
+                                                                                          "test/clone":   [0.7, 0.7],
+                                                                                          "test/report":  [0.05],
+                                                                                          "test/added":   [0.3]})
+
+        rows_dict                                   = {row["path"]: row for row in
+                                                            Timing_Report().compare(baseline_path, current_path)}
+        self.assertEqual(sorted(rows_dict.keys()), ["test", "test/added", "test/clone", "test/removed",
+                                                    "test/report"])
+        self.assertEqual([p for p, row in rows_dict.items() if row["regressed"]], ["test/clone"])
+        self.assertAlmostEqual(rows_dict["test/clone"]["current"], 1.4)
+        self.assertIsNone(rows_dict["test/added"]["baseline"])
+        self.assertIsNone(rows_dict["test/removed"]["current"])
+
+        with _contextlib.redirect_stdout(_io.StringIO()):
+            self.assertEqual(main(["compare", baseline_path, current_path]), 1)
+            self.assertEqual(main(["compare", baseline_path, baseline_path]), 0)
+
+    def test_trend(self):
+        '''
+        Checks that the records of successive runs are listed in chronological order
+        '''
+        self._save_record("runs/20240102_000000.json", {"test": [2.0]})
+        self._save_record("runs/20240101_000000.json", {"test": [1.0]})
+
+        trend_l                                     = Timing_Report().trend(f"{self.tmp_folder}/runs")
+        self.assertEqual([(name, totals["test"]["total"]) for name, totals in trend_l],
+                         [("20240101_000000.json", 1.0), ("20240102_000000.json", 2.0)])
+
+    def _save_record(self, relative_path, durations_dict):
+        '''
+        Writes a timing record like :meth:`Span_Timer.save` does, with a span for each duration in `durations_dict`
+
+        :returns: the path of the timing record
+        :rtype: str
+        '''
+        timer                                       = Span_Timer()
+        timer._records_l                            = [{"path": path, "start": 0.0, "duration": duration,
+                                                        "attributes": {}}
+                                                            for path, durations_l in durations_dict.items()
+                                                            for duration in durations_l]
+        path                                        = f"{self.tmp_folder}/{relative_path}"
+        timer.save(path, run_info={"test": "test_span_timer"})
+        with open(path, "r") as file:
+            self.assertEqual(_json.load(file)["run_info"], {"test": "test_span_timer"})
+        return path
+
+if __name__ == "__main__":
+    _unittest.main()
@@ -0,0 +1,78 @@
+import os                                                           as _os
+import shutil                                                       as _shutil
+import tempfile                                                     as _tempfile
+import unittest                                                     as _unittest
+
+from limon_test.framework.util.tree_walker                          import Tree_Walker
+
+class TestTreeWalker(_unittest.TestCase):
+
+    '''
+    Checks that the :class:`Tree_Walker` lists the same files, with the same paths and in the same order, as
+    filtering the output of `os.walk` by name, which is how files in ".git" folders used to be excluded from
+    comparisons of folder structures.
+    '''
+
+    def setUp(self):
+        self.tmp_folder                             = _tempfile.mkdtemp()
+        self.addCleanup(_shutil.rmtree, self.tmp_folder, ignore_errors=True)
+
+        # A local repo with GIT internals, a seed with a GIT repo of its own, and files whose names merely
+        # start like ".git"
+        #
+        self.root_folder                            = f"{self.tmp_folder}/repos"
+        for relative_path in ["svc/.git/HEAD", "svc/.git/objects/3f/69985b", "svc/.gitignore", "svc/README.md",
+                              "svc/src/app.py", "svc/src/.git", "svc/docs/b.md", "svc/docs/a.md",
+                              "svc/seed/inner/.git/config", "svc/seed/inner/data.txt",
+                              "svc/__pycache__/app.cpython-311.pyc", "top.txt"]:
+            path                                    = f"{self.root_folder}/{relative_path}"
+            _os.makedirs(_os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                file.write(relative_path)
+        _os.symlink(f"{self.root_folder}/svc/docs", f"{self.root_folder}/svc/docs_link")
+
+    def test_same_as_filtered_os_walk(self):
+        '''
+        Checks the default exclusion of ".git" against the filter that comparisons of folder structures used before
+        '''
+        all_files_l                                 = [_os.path.join(folder, name)
+                                                            for folder, _, file_names_l in _os.walk(self.root_folder)
+                                                            for name in file_names_l]
+        expected_l                                  = [f for f in all_files_l if not ".git" in f.split("/")]
+
+        self.assertEqual(list(Tree_Walker().walk(self.root_folder)), expected_l)
+        self.assertIn(f"{self.root_folder}/svc/.gitignore", expected_l)
+        # Like `os.walk`, symbolic links to folders are neither followed nor listed as files
+        self.assertNotIn(f"{self.root_folder}/svc/docs_link", expected_l)
+
+    def test_patterns(self):
+        '''
+        Checks that glob-style patterns exclude both files and folders, by name
+        '''
+        relative_paths_l                            = [p[len(self.root_folder) + 1:] for p in
+                                                            Tree_Walker([".git", "__pycache__", "*.md"]).walk(self.root_folder)]
+        self.assertEqual(sorted(relative_paths_l), ["svc/.gitignore", "svc/seed/inner/data.txt",
+                                                    "svc/src/app.py", "top.txt"])
+
+    def test_excluded_folders_are_not_visited(self):
+        '''
+        Checks that the content of excluded folders is not even listed
+        '''
+        visited_l                                   = []
+        original_walk                               = _os.walk
+
+        def recording_walk(top, *args, **kwargs):
+            for folder, sub_folders_l, file_names_l in original_walk(top, *args, **kwargs):
+                visited_l.append(folder)
+                yield folder, sub_folders_l, file_names_l
+
+        _os.walk                                    = recording_walk
+        try:
+            list(Tree_Walker().walk(self.root_folder))
+        finally:
+            _os.walk                                = original_walk
+
+        self.assertEqual([f for f in visited_l if ".git" in f.split("/")], [])
+
+if __name__ == "__main__":
+    _unittest.main()